@@ -2,25 +2,30 @@ from __future__ import annotations
 
 from pathlib import Path
 import os
-import threading
 import time
-import uuid
+from typing import Callable
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request
 
 from exchange import ExchangeGuard
+from jobs import OptimizerQueue
 from trading_engine import ConfigStore, TradingAnalyzer
-from storage import TradeStore
+from trading_engine.cache import ResponseCache
+from trading_engine.market_data import BinanceKlines
+from trading_engine.timeframes import last_closed_open_time
+from storage import CandleStore, JobStore, ResponseStore, TradeStore
 
 
 BASE_DIR = Path(__file__).resolve().parent
 app = Flask(__name__)
 config_store = ConfigStore(BASE_DIR / "config.json")
-store = TradeStore(BASE_DIR / "data" / "trade_web.sqlite3")
-analyzer = TradingAnalyzer()
+# One SQLite file holds runs, candles, optimizer jobs and shared responses for every worker process.
+DATA_DIR = Path(os.environ.get("TRADE_WEB_DATA", BASE_DIR / "data"))
+store = TradeStore(DATA_DIR / "trade_web.sqlite3")
+candle_store = CandleStore(store.path)
+analyzer = TradingAnalyzer(candle_store=candle_store, market_data=BinanceKlines())
 exchange_guard = ExchangeGuard()
-optimizer_jobs: dict[str, dict] = {}
-optimizer_lock = threading.Lock()
+response_cache = ResponseCache(shared=ResponseStore(store.path))
 
 
 @app.get("/")
@@ -30,7 +35,10 @@ def index():
 
 @app.get("/api/config")
 def get_config():
-    return jsonify(config_store.load())
+    snapshot = config_store.snapshot()
+    response = jsonify(snapshot.config)
+    response.set_etag(snapshot.etag)
+    return response.make_conditional(request)
 
 
 @app.post("/api/config")
@@ -45,31 +53,86 @@ def update_config():
             config.setdefault("available_symbols", []).append(symbol)
     if signal_mode in config.get("available_signal_modes", ["balanced", "high_precision", "lux_style"]):
         config["signal_mode"] = signal_mode
-    config_store.save(config)
-    return jsonify(config)
+    response = jsonify(config)
+    response.set_etag(config_store.save(config).etag)
+    return response
+
+
+def cached_json(key: tuple, compute: Callable[[], tuple[dict, bool]]):
+    """JSON response computed once per `key` and shared by concurrent requests.
+
+    `key` holds everything the response depends on, so its hash is the ETag: a matching
+    If-None-Match is answered with 304 before any lookup. Bodies are shared with the other worker
+    processes through SQLite. Responses that `compute` marks as not cacheable (fallback data,
+    timeouts) get no ETag and are recomputed next time.
+    """
+    etag = ResponseCache.etag(key)
+    if request.if_none_match.contains_weak(etag):
+        response, outcome = app.response_class(status=304), "not-modified"
+    else:
+        def render():
+            result, cacheable = compute()
+            return app.json.dumps(result), cacheable
+
+        body, outcome = response_cache.get_or_compute(key, render)
+        response = app.response_class(body, mimetype="application/json")
+        if outcome == "uncached":
+            response.headers["X-Cache"] = outcome
+            return response
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Cache"] = outcome
+    return response
+
+
+def closed_candles(timeframes: list[str]) -> tuple:
+    return tuple((timeframe, last_closed_open_time(timeframe)) for timeframe in timeframes)
 
 
 @app.get("/api/analyze")
 def analyze():
-    config = config_store.load()
+    snapshot = config_store.snapshot()
+    config = snapshot.config
     demo = request.args.get("demo", "").lower() in {"1", "true", "yes"}
-    result = analyzer.analyze(config, use_demo_data=demo)
-    result["risk_plan"] = analyzer.risk_plan(config, result["signal"])
-    return jsonify(result)
+    timeframes = config.get("timeframes", ["15m", "30m", "4h", "1d"])
+    key = ("analyze", snapshot.etag, config.get("symbol", "BTCUSDT"), demo, closed_candles(timeframes))
+
+    def compute():
+        result = analyzer.analyze(config, use_demo_data=demo)
+        result["risk_plan"] = analyzer.risk_plan(config, result["signal"])
+        return result, not result["warnings"]
+
+    return cached_json(key, compute)
+
+
+@app.get("/api/analyze/batch")
+def analyze_batch():
+    config = config_store.snapshot().config
+    demo = request.args.get("demo", "").lower() in {"1", "true", "yes"}
+    symbols = request.args.get("symbols")
+    requested = list(dict.fromkeys(item.strip().upper() for item in symbols.split(",") if item.strip())) if symbols else None
+    # Every symbol fans out into one history fetch per timeframe on the shared pool and the exchange limit.
+    allowed = config.get("available_symbols") or [config.get("symbol", "BTCUSDT")]
+    unknown = [symbol for symbol in requested or [] if symbol not in allowed]
+    if unknown:
+        return jsonify({"error": "symbols nicht erlaubt", "unknown": unknown, "allowed": allowed}), 400
+    return jsonify(analyzer.analyze_many(config, symbols=requested, use_demo_data=demo))
 
 
 @app.get("/api/backtest")
 def backtest():
-    config = config_store.load()
+    config = config_store.snapshot().config
     demo = request.args.get("demo", "").lower() in {"1", "true", "yes"}
     symbols = request.args.get("symbols")
     modes = request.args.get("modes")
+    horizons = request.args.get("horizons")
     result = analyzer.backtest(
         config,
         symbols=[item.strip().upper() for item in symbols.split(",") if item.strip()] if symbols else None,
         modes=[item.strip() for item in modes.split(",") if item.strip()] if modes else None,
         candles=int(request.args.get("candles", "360")),
         horizon=int(request.args.get("horizon", "12")),
+        horizons=[int(item) for item in horizons.split(",") if item.strip()] if horizons else None,
         use_demo_data=demo,
     )
     run_id = store.save_run("backtest", result, label=",".join(result["settings"]["symbols"]))
@@ -79,122 +142,117 @@ def backtest():
 
 @app.get("/api/forecast")
 def forecast():
-    config = config_store.load()
+    snapshot = config_store.snapshot()
+    config = snapshot.config
     demo = request.args.get("demo", "").lower() in {"1", "true", "yes"}
-    return jsonify(
-        analyzer.forecast(
-            config,
-            candles=int(request.args.get("candles", "220")),
-            horizon=int(request.args.get("horizon", "24")),
-            use_demo_data=demo,
-        )
-    )
+    options = {
+        "candles": int(request.args.get("candles", "220")),
+        "horizon": int(request.args.get("horizon", "24")),
+        "paths": int(request.args.get("paths", "0")),
+        "method": request.args.get("method"),
+        "seed": request.args.get("seed", type=int),
+    }
+    key = ("forecast", snapshot.etag, config.get("symbol", "BTCUSDT"), demo, closed_candles(["4h"]), tuple(options.items()))
+
+    def compute():
+        result = analyzer.forecast(config, use_demo_data=demo, **options)
+        return result, demo or result["settings"]["source"] == "live"
+
+    return cached_json(key, compute)
 
 
 @app.get("/api/optimize")
 def optimize():
-    config = config_store.load()
+    config = config_store.snapshot().config
     demo = request.args.get("demo", "").lower() in {"1", "true", "yes"}
     symbols = request.args.get("symbols")
-    result = analyzer.optimize(
+    return analyzer.optimize(
         config,
         symbols=[item.strip().upper() for item in symbols.split(",") if item.strip()] if symbols else None,
         candles=int(request.args.get("candles", "320")),
         horizon=int(request.args.get("horizon", "12")),
+        workers=int(request.args.get("workers", "0")),
+        search=request.args.get("search"),
+        validation=request.args.get("validation"),
         use_demo_data=demo,
     )
     return jsonify(result)
 
 
+def run_optimizer_job(config: dict, payload: dict, **hooks) -> dict:
+    symbols = payload.get("symbols")
+    return analyzer.optimize(
+        config,
+        symbols=[item.strip().upper() for item in symbols.split(",") if item.strip()] if isinstance(symbols, str) else None,
+        candles=int(payload.get("candles", 320)),
+        horizon=int(payload.get("horizon", 12)),
+        workers=int(payload.get("workers", 0)),
+        search=payload.get("search"),
+        validation=payload.get("validation"),
+        use_demo_data=bool(payload.get("demo")),
+        **hooks,
+    )
+
+
+def save_optimizer_run(result: dict) -> None:
+    result["run_id"] = store.save_run("optimizer", result, label=",".join(result["settings"]["symbols"]))
+
+
+job_options = config_store.snapshot().config.get("optimizer", {}).get("jobs", {})
+optimizer_queue = OptimizerQueue(
+    JobStore(store.path),
+    run_optimizer_job,
+    workers=int(job_options.get("workers", 1)),
+    lease=float(job_options.get("lease_seconds", 30)),
+    ttl=float(job_options.get("ttl_hours", 24)) * 3600,
+    top_k=int(job_options.get("top_k", 8)),
+    on_result=save_optimizer_run,
+)
+
+
+def start_optimizer_queue() -> None:
+    """Start the job threads of this process; only entry points call it, importing `app` never does.
+
+    Jobs interrupted by a restart resume right away instead of waiting for a request.
+    `OPTIMIZER_QUEUE=0` serves the API without job threads (load tests).
+    """
+    if os.environ.get("OPTIMIZER_QUEUE", "1") == "1":
+        optimizer_queue.start()
+
+
 @app.post("/api/optimize/start")
 def optimize_start():
-    config = config_store.load()
+    config = config_store.snapshot().config
     payload = request.get_json(silent=True) or {}
-    symbols = payload.get("symbols")
-    demo = bool(payload.get("demo"))
-    job_id = uuid.uuid4().hex
-    with optimizer_lock:
-        optimizer_jobs[job_id] = {
-            "id": job_id,
-            "status": "running",
-            "done": 0,
-            "total": 0,
-            "best": None,
-            "candidates": [],
-            "best_history": [],
-            "result": None,
-            "error": None,
-            "cancel": False,
-            "started_at": int(time.time()),
-        }
-
-    def progress(update: dict) -> None:
-        with optimizer_lock:
-            job = optimizer_jobs.get(job_id)
-            if not job:
-                return
-            job["done"] = update.get("done", job["done"])
-            job["total"] = update.get("total", job["total"])
-            job["best"] = update.get("best")
-            if update.get("candidate"):
-                job["candidates"].append(update["candidate"])
-                job["candidates"] = sorted(job["candidates"], key=lambda item: item["score"], reverse=True)[:8]
-            if update.get("convergence"):
-                job["best_history"].append(update["convergence"])
-
-    def should_cancel() -> bool:
-        with optimizer_lock:
-            return bool(optimizer_jobs.get(job_id, {}).get("cancel"))
-
-    def run_job() -> None:
-        try:
-            result = analyzer.optimize(
-                config,
-                symbols=[item.strip().upper() for item in symbols.split(",") if item.strip()]
-                if isinstance(symbols, str)
-                else None,
-                candles=int(payload.get("candles", 320)),
-                horizon=int(payload.get("horizon", 12)),
-                use_demo_data=demo,
-                progress=progress,
-                should_cancel=should_cancel,
-            )
-            with optimizer_lock:
-                job = optimizer_jobs[job_id]
-                run_id = store.save_run("optimizer", result, label=",".join(result["settings"]["symbols"]))
-                result["run_id"] = run_id
-                job["result"] = result
-                job["best"] = result.get("best")
-                job["status"] = "cancelled" if job.get("cancel") else "done"
-                job["finished_at"] = int(time.time())
-        except Exception as exc:
-            with optimizer_lock:
-                job = optimizer_jobs[job_id]
-                job["status"] = "error"
-                job["error"] = str(exc)
-                job["finished_at"] = int(time.time())
-
-    threading.Thread(target=run_job, daemon=True).start()
+    job_id = optimizer_queue.submit({"config": config, "payload": payload}, priority=int(payload.get("priority", 0)))
     return jsonify({"job_id": job_id})
 
 
 @app.get("/api/optimize/status/<job_id>")
 def optimize_status(job_id: str):
-    with optimizer_lock:
-        job = optimizer_jobs.get(job_id)
-        if not job:
-            return jsonify({"error": "job nicht gefunden"}), 404
-        return jsonify({key: value for key, value in job.items() if key != "cancel"})
+    job = optimizer_queue.get(job_id)
+    if not job:
+        return jsonify({"error": "job nicht gefunden"}), 404
+    return jsonify(job)
+
+
+@app.get("/api/optimize/stream/<job_id>")
+def optimize_stream(job_id: str):
+    if optimizer_queue.get(job_id) is None:
+        return jsonify({"error": "job nicht gefunden"}), 404
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    return Response(
+        optimizer_queue.stream(job_id, int(last_event_id) if last_event_id and last_event_id.isdigit() else None),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post("/api/optimize/cancel/<job_id>")
 def optimize_cancel(job_id: str):
-    with optimizer_lock:
-        job = optimizer_jobs.get(job_id)
-        if not job:
-            return jsonify({"error": "job nicht gefunden"}), 404
-        job["cancel"] = True
-        return jsonify({"status": "cancel_requested"})
+    if not optimizer_queue.cancel(job_id):
+        return jsonify({"error": "job nicht gefunden"}), 404
+    return jsonify({"status": "cancel_requested"})
 
 
 @app.post("/api/optimize/apply")
@@ -214,8 +272,9 @@ def apply_optimization():
         "symbol_params": config.get("symbol_params", {}),
         "source": "api/optimize",
     }
-    config_store.save(config)
-    return jsonify(config)
+    response = jsonify(config)
+    response.set_etag(config_store.save(config).etag)
+    return response
 
 
 @app.get("/api/history")
@@ -227,7 +286,7 @@ def history():
 
 @app.get("/api/health")
 def health():
-    config = config_store.load()
+    config = config_store.snapshot().config
     return jsonify(
         {
             "status": "ok",
@@ -236,10 +295,9 @@ def health():
             "execution": config.get("execution", {}),
             "risk_management": config.get("risk_management", {}),
             "exchange_guard": exchange_guard.status(config),
-            "optimizer_jobs": {
-                "running": sum(1 for job in optimizer_jobs.values() if job.get("status") == "running"),
-                "total": len(optimizer_jobs),
-            },
+            "optimizer_jobs": optimizer_queue.counts(),
+            "indicator_cache": analyzer.indicator_cache.stats(),
+            "response_cache": response_cache.stats(),
         }
     )
 
@@ -251,7 +309,7 @@ def paper_orders():
 
 @app.post("/api/paper/order")
 def paper_order():
-    config = config_store.load()
+    config = config_store.snapshot().config
     payload = request.get_json(silent=True) or {}
     signal = payload.get("signal")
     if not isinstance(signal, dict):
@@ -278,12 +336,12 @@ def paper_order():
 
 @app.get("/api/exchange/status")
 def exchange_status():
-    return jsonify(exchange_guard.status(config_store.load()))
+    return jsonify(exchange_guard.status(config_store.snapshot().config))
 
 
 @app.post("/api/exchange/order")
 def exchange_order():
-    config = config_store.load()
+    config = config_store.snapshot().config
     payload = request.get_json(silent=True) or {}
     return jsonify(exchange_guard.place_order(config, payload))
 
@@ -292,4 +350,7 @@ if __name__ == "__main__":
     host = os.environ.get("FLASK_HOST", "127.0.0.1")
     port = int(os.environ.get("PORT", "5050"))
     debug = os.environ.get("FLASK_DEBUG", "1") == "1"
+    # With the debug reloader this block runs in a watcher parent too; only the serving child gets workers.
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_optimizer_queue()
     app.run(host=host, port=port, debug=debug)
@@ -0,0 +1,57 @@
+"""Hit-path latency of CandleStore range reads.
+
+    python3 benchmarks/bench_candle_store.py --candles 10000 --runs 50
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from storage import CandleStore  # noqa: E402
+
+STEP = 14400
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candles", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CandleStore(Path(directory) / "bench.sqlite3")
+        end = (args.candles - 1) * STEP
+        price = 76000.0
+        candles = []
+        for index in range(args.candles):
+            price *= 1.0005 if index % 3 else 0.999
+            candles.append({"time": index * STEP, "open": price, "high": price * 1.002, "low": price * 0.998, "close": price, "volume": 1.0})
+        started = time.perf_counter()
+        store.upsert("BINANCE", "BTCUSDT", "4h", candles)
+        write_ms = (time.perf_counter() - started) * 1000
+
+        def loader(symbol, timeframe, start, stop):
+            raise AssertionError("hit path must not call the loader")
+
+        samples = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            rows = store.fetch("BINANCE", "BTCUSDT", "4h", 0, end, STEP, loader)
+            samples.append((time.perf_counter() - started) * 1000)
+        assert len(rows) == args.candles
+        samples.sort()
+        print(f"candles={args.candles} runs={args.runs} write_ms={write_ms:.1f}")
+        print(
+            f"hit_ms median={statistics.median(samples):.2f} "
+            f"p95={samples[int(len(samples) * 0.95) - 1]:.2f} min={samples[0]:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Trading engine benchmark suite: scaling curves, peak memory and regression gate.
+
+    python3 benchmarks/bench_engine.py --output benchmarks/baseline.json
+    python3 benchmarks/bench_engine.py --sizes 1000,10000 --check benchmarks/baseline.json --threshold 25
+
+The generator and every indicator kernel and backtest/optimize entry point run on regime-switching
+synthetic 4h candles from `trading_engine.synthetic` (1k to 1M rows by default); analyze and forecast
+use their fixed request sizes. Timings are the median of `--runs` runs; peak memory comes from a
+separate tracemalloc run so tracing does not distort the timings. `--check` exits with status 1 if a case is slower or uses more memory than the
+baseline by more than `--threshold` percent (timings within `--min-ms` of the baseline are ignored).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from trading_engine import TradingAnalyzer  # noqa: E402
+from trading_engine.backtest import indicator_arrays, timeframe_weights  # noqa: E402
+from trading_engine.indicators import ema_series, macd_series, rsi_series, sma_series  # noqa: E402
+from trading_engine.levels import LevelIndex, rolling_extremes  # noqa: E402
+from trading_engine.optimizer import sample_params  # noqa: E402
+from trading_engine.patterns import scan as scan_patterns  # noqa: E402
+from trading_engine.scoring import grid_signal_arrays, param_grid, status_arrays  # noqa: E402
+from trading_engine.synthetic import generate_candles  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# optimize evaluates many candidates x folds; beyond this size it would dominate the whole run.
+OPTIMIZE_MAX_SIZE = 100_000
+# Parameter sets scored at once by the grid case; its (sets x candles) outputs are capped like optimize.
+GRID_SETS = 100
+CONFIG = {
+    "symbol": "BTCUSDT", "benchmark_assets": ["BTCUSDT", "ETHUSDT", "SOLUSDT"], "timeframes": ["15m", "30m", "4h", "1d"],
+    "signal_mode": "balanced", "forecast": {"paths": 10000, "horizon": 48},
+}
+
+
+def cases(sizes: list[int]) -> dict[str, Callable[[], Any]]:
+    result: dict[str, Callable[[], Any]] = {}
+    rng = random.Random(1)
+    grid = param_grid([sample_params(TradingAnalyzer()._signal_params(), rng) for _ in range(GRID_SETS)])
+    for size in sizes:
+        candles = generate_candles(size, "4h", seed=1, price=76000)
+        close = candles.close
+        result[f"synthetic.generate@{size}"] = lambda size=size: generate_candles(size, "4h", seed=1, price=76000)
+        result[f"indicator.sma200@{size}"] = lambda close=close: sma_series(close, 200)
+        result[f"indicator.ema20@{size}"] = lambda close=close: ema_series(close, 20)
+        result[f"indicator.rsi14@{size}"] = lambda close=close: rsi_series(close)
+        result[f"indicator.macd@{size}"] = lambda close=close: macd_series(close)
+        result[f"indicator.extremes30@{size}"] = lambda close=close: rolling_extremes(close)
+        result[f"indicator.levels@{size}"] = lambda candles=candles: LevelIndex(candles)
+        result[f"patterns.scan@{size}"] = lambda candles=candles: scan_patterns(candles)
+        # A fresh analyzer per run keeps the indicator cache out of the measurement.
+        result[f"engine.backtest@{size}"] = lambda candles=candles: TradingAnalyzer().backtest(CONFIG, symbols=["BTCUSDT"], horizons=[6, 24], data={"BTCUSDT": candles})
+        if size <= OPTIMIZE_MAX_SIZE:
+            indicators = indicator_arrays(candles)
+            statuses = status_arrays(**indicators)
+            result[f"scoring.grid{GRID_SETS}@{size}"] = lambda indicators=indicators, statuses=statuses: grid_signal_arrays(
+                statuses, timeframe_weights(CONFIG["timeframes"]), indicators["price"], indicators["support"], indicators["resistance"], indicators["rsi"], grid, "high_precision",
+            )
+            result[f"engine.optimize@{size}"] = lambda candles=candles: TradingAnalyzer().optimize(CONFIG, symbols=["BTCUSDT"], candidates=8, workers=1, data={"BTCUSDT": candles})
+    result["engine.analyze@241"] = lambda: TradingAnalyzer().analyze(CONFIG, use_demo_data=True)
+    result["engine.forecast@10000x48"] = lambda: TradingAnalyzer().forecast(CONFIG, use_demo_data=True)
+    return result
+
+
+def measure(function: Callable[[], Any], runs: int) -> dict[str, float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"median_ms": round(statistics.median(samples), 3), "min_ms": round(min(samples), 3), "peak_mb": round(peak / 2**20, 3)}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float, min_ms: float) -> list[str]:
+    """Regressions of `current` against `baseline` as readable lines; cases missing on either side are skipped."""
+    problems = []
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        limit = 1 + threshold / 100
+        if now["median_ms"] > before["median_ms"] * limit and now["median_ms"] - before["median_ms"] > min_ms:
+            problems.append(f"{name}: median {before['median_ms']:.2f}ms -> {now['median_ms']:.2f}ms")
+        if now["peak_mb"] > before["peak_mb"] * limit and now["peak_mb"] - before["peak_mb"] > 0.5:
+            problems.append(f"{name}: peak {before['peak_mb']:.2f}MB -> {now['peak_mb']:.2f}MB")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--only", default="", help="substring filter on case names")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--check", type=Path, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=25.0, help="allowed regression in percent")
+    parser.add_argument("--min-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    sizes = [int(item) for item in args.sizes.split(",") if item.strip()]
+    results = {}
+    for name, function in cases(sizes).items():
+        if args.only and args.only not in name:
+            continue
+        function()  # warm-up: imports, page faults, first allocation of pools
+        results[name] = measure(function, args.runs)
+        row = results[name]
+        print(f"{name:<32} median={row['median_ms']:>10.2f}ms min={row['min_ms']:>10.2f}ms peak={row['peak_mb']:>9.2f}MB", flush=True)
+
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(), "created_at": int(time.time()), "runs": args.runs},
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.output}")
+    if args.check:
+        problems = compare(json.loads(args.check.read_text(encoding="utf-8")), report, args.threshold, args.min_ms)
+        for line in problems:
+            print(f"REGRESSION {line}")
+        if problems:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:g}% against {args.check}")
+
+
+if __name__ == "__main__":
+    main()
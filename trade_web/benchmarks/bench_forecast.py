@@ -0,0 +1,44 @@
+"""Monte Carlo forecast latency (target: 10k paths x 48 steps under 50 ms).
+
+    python3 benchmarks/bench_forecast.py --paths 10000 --steps 48 --runs 30
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from trading_engine.forecast import METHODS, monte_carlo  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paths", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=48)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    close = 76000 * np.exp(np.cumsum(rng.normal(0, 0.01, 240)))
+    print(f"paths={args.paths} steps={args.steps} runs={args.runs}")
+    for method in METHODS:
+        samples = []
+        for run in range(args.runs):
+            started = time.perf_counter()
+            monte_carlo(close, args.steps, args.paths, method, window=120, seed=run)
+            samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        print(
+            f"{method:<9} median={statistics.median(samples):.2f}ms "
+            f"p95={samples[int(len(samples) * 0.95) - 1]:.2f}ms min={samples[0]:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
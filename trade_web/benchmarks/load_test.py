@@ -0,0 +1,184 @@
+"""HTTP load test for the production server: requests/sec and latency per endpoint and worker count.
+
+    python3 benchmarks/load_test.py                        # gunicorn with 1, 4 and 8 workers
+    python3 benchmarks/load_test.py --workers 4 --duration 20 --paths "/api/analyze?demo=1"
+    python3 benchmarks/load_test.py --url http://127.0.0.1:5050 --revalidate
+
+For every worker count a gunicorn (`gunicorn.conf.py`, `wsgi:app`) is started on a free port with
+its own temporary data directory and without optimizer job threads. Every path is requested once to
+warm the caches, then `--clients` client processes with `--connections` keep-alive connections each
+send requests for `--duration` seconds. `--revalidate` sends the ETag of the warm-up response as
+If-None-Match, which measures the 304 path instead of cached bodies. The client runs on the same
+machine, so on small hosts it competes with the server for CPU.
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+PATHS = ("/api/health", "/api/analyze?demo=1")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request(connection: http.client.HTTPConnection, path: str, headers: dict[str, str]) -> http.client.HTTPResponse:
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    return response
+
+
+def start_server(workers: int, threads: int, data_dir: str) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    env = dict(os.environ, TRADE_WEB_DATA=data_dir, OPTIMIZER_QUEUE="0", WEB_ACCESS_LOG="", FLASK_HOST="127.0.0.1", PORT=str(port))
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--workers", str(workers), "--threads", str(threads), "wsgi:app"]
+    log = Path(data_dir) / "gunicorn.log"
+    with log.open("wb") as handle:
+        server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=handle)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"gunicorn exited: {log.read_text(errors='replace')[-2000:]}")
+        try:
+            if request(http.client.HTTPConnection("127.0.0.1", port, timeout=2), "/api/health", {}).status == 200:
+                return server, url
+        except OSError:
+            pass
+        time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("gunicorn did not become ready within 60s")
+
+
+def hammer(url: str, path: str, headers: dict[str, str], threads: int, duration: float) -> dict[str, Any]:
+    """One client process: `threads` keep-alive connections in a loop until `duration` is over."""
+    parts = urlsplit(url)
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    outcomes: Counter = Counter()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client() -> None:
+        connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+        own_latencies, own_statuses, own_outcomes = [], Counter(), Counter()
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = request(connection, path, headers)
+            except (OSError, http.client.HTTPException):
+                own_statuses["error"] += 1
+                connection.close()
+                connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+                continue
+            own_latencies.append(time.perf_counter() - started)
+            own_statuses[str(response.status)] += 1
+            own_outcomes[response.getheader("X-Cache", "-")] += 1
+        connection.close()
+        with lock:
+            latencies.extend(own_latencies)
+            statuses.update(own_statuses)
+            outcomes.update(own_outcomes)
+
+    workers = [threading.Thread(target=client) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return {"latencies": latencies, "statuses": dict(statuses), "outcomes": dict(outcomes)}
+
+
+def measure(url: str, path: str, clients: int, threads: int, duration: float, revalidate: bool) -> dict[str, Any]:
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=120)
+    etag = request(connection, path, {}).getheader("ETag")
+    connection.close()
+    headers = {"If-None-Match": etag} if revalidate and etag else {}
+    with ProcessPoolExecutor(max_workers=clients) as pool:
+        runs = [future.result() for future in [pool.submit(hammer, url, path, headers, threads, duration) for _ in range(clients)]]
+    latencies = sorted(value for run in runs for value in run["latencies"])
+    statuses, outcomes = Counter(), Counter()
+    for run in runs:
+        statuses.update(run["statuses"])
+        outcomes.update(run["outcomes"])
+
+    def percentile(share: float) -> float | None:
+        return round(latencies[min(len(latencies) - 1, int(share * len(latencies)))] * 1000, 2) if latencies else None
+
+    return {
+        "requests": len(latencies), "rps": round(len(latencies) / duration, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else None,
+        "p50_ms": percentile(0.5), "p95_ms": percentile(0.95), "p99_ms": percentile(0.99),
+        "statuses": dict(statuses), "cache": dict(outcomes),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,4,8", help="gunicorn worker counts to compare")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn threads per worker")
+    parser.add_argument("--paths", default=",".join(PATHS))
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per path and worker count")
+    parser.add_argument("--clients", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="client processes")
+    parser.add_argument("--connections", type=int, default=8, help="keep-alive connections per client process")
+    parser.add_argument("--revalidate", action="store_true", help="send If-None-Match with the warm-up ETag")
+    parser.add_argument("--url", help="test a running server instead of starting gunicorn")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    paths = [item.strip() for item in args.paths.split(",") if item.strip()]
+    targets = [("external", args.url)] if args.url else [(int(item), None) for item in args.workers.split(",") if item.strip()]
+    results: dict[str, dict[str, Any]] = {}
+    for workers, url in targets:
+        server = None
+        with tempfile.TemporaryDirectory(prefix="trade_web_load_") as data_dir:
+            if url is None:
+                server, url = start_server(workers, args.threads, data_dir)
+            try:
+                for path in paths:
+                    row = measure(url, path, args.clients, args.connections, args.duration, args.revalidate)
+                    results.setdefault(str(workers), {})[path] = row
+                    print(
+                        f"workers={workers!s:<8} {path:<28} {row['rps']:>9.1f} req/s  p50={row['p50_ms']}ms p95={row['p95_ms']}ms "
+                        f"p99={row['p99_ms']}ms status={row['statuses']} cache={row['cache']}",
+                        flush=True,
+                    )
+            finally:
+                if server is not None:
+                    server.terminate()
+                    server.wait(timeout=30)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count(), "created_at": int(time.time()),
+            "threads": args.threads, "duration_s": args.duration, "clients": args.clients, "connections": args.connections, "revalidate": args.revalidate,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# gunicorn settings for `gunicorn -c gunicorn.conf.py wsgi:app`, overridable through the environment.
+#
+# Workers are separate processes that share state only through data/trade_web.sqlite3 (optimizer
+# jobs, job events, rendered responses) and config.json. gthread keeps one thread per request, so a
+# Server-Sent Events stream occupies a thread, not a whole worker. Every worker starts its own
+# optimizer job threads in `post_worker_init` and hands its running jobs back in `worker_exit`;
+# the master never runs jobs, even with preload_app.
+import os
+
+bind = f"{os.environ.get('FLASK_HOST', '0.0.0.0')}:{os.environ.get('PORT', '5050')}"
+workers = int(os.environ.get("WEB_WORKERS", "2"))
+worker_class = "gthread"
+threads = int(os.environ.get("WEB_THREADS", "8"))
+# Synchronous backtests and optimizer runs can take minutes; SSE streams do not count against this.
+timeout = int(os.environ.get("WEB_TIMEOUT", "300"))
+graceful_timeout = 30
+keepalive = 5
+preload_app = False
+# WEB_ACCESS_LOG="" turns the access log off (load tests).
+accesslog = os.environ.get("WEB_ACCESS_LOG", "-") or None
+
+
+def post_worker_init(worker):
+    from app import start_optimizer_queue
+
+    start_optimizer_queue()
+
+
+def worker_exit(server, worker):
+    # A graceful shutdown requeues running jobs at once instead of leaving them to the lease timeout.
+    from app import optimizer_queue
+
+    optimizer_queue.stop()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import heapq
+import json
+import threading
+import time
+import uuid
+from typing import Any, Callable, Iterator
+
+from storage import JobStore
+
+
+class OptimizerQueue:
+    """Optimizer jobs on a bounded pool of worker threads, persisted in a `JobStore`.
+
+    Workers claim the highest-priority queued job from SQLite, so any number of app processes can
+    share one queue; `workers` also caps the jobs running at once across all of them. Every evaluated trial is checkpointed; a job whose process died is claimed
+    again once its lease expires and replays its checkpoints instead of re-evaluating them.
+
+    Every checkpoint also appends delta events (`progress`, `best`, `candidates`, `convergence`,
+    `status`) to the job's event log, which `stream` serves as Server-Sent Events.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        run: Callable[..., dict[str, Any]],
+        workers: int = 1,
+        lease: float = 30.0,
+        ttl: float = 86400.0,
+        top_k: int = 8,
+        poll: float = 2.0,
+        stream_poll: float = 0.1,
+        keep_alive: float = 15.0,
+        on_result: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.store = store
+        self.run = run
+        self.on_result = on_result
+        self.workers = max(1, workers)
+        self.lease = lease
+        self.ttl = ttl
+        self.top_k = top_k
+        self.poll = poll
+        self.stream_poll = stream_poll
+        self.keep_alive = keep_alive
+        self.owner = uuid.uuid4().hex
+        self._wake = threading.Condition()
+        self._events = threading.Condition()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._threads = [threading.Thread(target=self._work, name=f"optimizer-{index}", daemon=True) for index in range(self.workers)]
+        self._threads.append(threading.Thread(target=self._maintain, name="optimizer-lease", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the threads and hand running jobs back to the queue instead of waiting for their lease to expire.
+
+        A running job stops after its current trial; another process claims it at once and replays
+        its checkpoints.
+        """
+        if not self._threads:
+            return
+        self._stop.set()
+        with self._wake:
+            self._wake.notify_all()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self.store.release(self.owner)
+        self._notify()
+        self._threads = []
+
+    def submit(self, request: dict[str, Any], priority: int = 0) -> str:
+        """Queue a job; `request` ({'config', 'payload'}) is stored with it, so a resumed job sees the same input."""
+        job_id = uuid.uuid4().hex
+        self.store.submit(job_id, request, priority)
+        with self._wake:
+            self._wake.notify()
+        return job_id
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        cancelled = self.store.cancel(job_id)
+        self._notify()
+        return cancelled
+
+    def _notify(self) -> None:
+        with self._events:
+            self._events.notify_all()
+
+    def stream(self, job_id: str, last_event_id: int | None = None) -> Iterator[str]:
+        """SSE frames for one job until it finishes.
+
+        Without `last_event_id` the first frame is a `snapshot` of the whole job; afterwards only
+        deltas follow, each with its event id, so a reconnecting EventSource continues where it
+        stopped. Events of this process wake the stream at once, other processes are polled every
+        `stream_poll` seconds; idle streams get a comment line every `keep_alive` seconds.
+        """
+        after = last_event_id
+        yield "retry: 2000\n\n"
+        if after is None:
+            job = self.store.get(job_id)
+            if job is None:
+                return
+            after = job["event_id"]
+            yield _frame(after, "snapshot", job)
+            if job["status"] in self.store.FINISHED:
+                return
+        idle = time.monotonic()
+        while True:
+            events = self.store.events(job_id, after)
+            for after, kind, data in events:
+                yield _frame(after, kind, data)
+                if kind == "status" and data["status"] in self.store.FINISHED:
+                    return
+            if events:
+                idle = time.monotonic()
+            elif time.monotonic() - idle >= self.keep_alive:
+                if self.store.get(job_id) is None:
+                    return
+                yield ": keep-alive\n\n"
+                idle = time.monotonic()
+            with self._events:
+                self._events.wait(self.stream_poll)
+
+    def counts(self) -> dict[str, int]:
+        counts = self.store.counts()
+        return {"running": counts.get("running", 0), "queued": counts.get("queued", 0), "total": sum(counts.values()), "workers": self.workers}
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            job = self.store.claim(self.owner, self.lease, limit=self.workers)
+            if job is None:
+                # Jobs submitted by other processes are only noticed on the next poll.
+                with self._wake:
+                    self._wake.wait(self.poll)
+                continue
+            self.execute(job)
+
+    def _maintain(self) -> None:
+        while not self._stop.is_set():
+            self.store.heartbeat(self.owner)
+            self.store.evict(self.ttl)
+            self._stop.wait(self.lease / 3)
+
+    def execute(self, job: dict[str, Any]) -> None:
+        """Run one claimed job to the end, checkpointing every trial."""
+        job_id = job["id"]
+        # Min-heap of the best `top_k` full evaluations: (score, trial id, candidate).
+        top: list[tuple[float, int, dict[str, Any]]] = []
+        state: dict[str, Any] = {"done": 0, "total": 0, "best": None, "candidates": [], "best_history": []}
+        cancelled = False
+
+        def progress(update: dict[str, Any]) -> None:
+            nonlocal cancelled
+            state.update({key: update[key] for key in ("done", "total", "search") if key in update})
+            events: list[tuple[str, Any]] = [("progress", {"done": state["done"], "total": state["total"], "search": state.get("search")})]
+            if update.get("candidate"):
+                if update["best"] is not state["best"]:
+                    events.append(("best", update["best"]))
+                state["best"] = update["best"]
+                entry = (update["candidate"]["score"], update["trial"]["id"], update["candidate"])
+                if len(top) < self.top_k:
+                    heapq.heappush(top, entry)
+                elif entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+                else:
+                    entry = None
+                if entry is not None:
+                    state["candidates"] = [item[2] for item in sorted(top, key=lambda item: item[:2], reverse=True)]
+                    events.append(("candidates", state["candidates"]))
+            if update.get("convergence"):
+                state["best_history"].append(update["convergence"])
+                events.append(("convergence", update["convergence"]))
+            trial = None if update.get("resumed") else update.get("trial")
+            cancelled = self.store.checkpoint(job_id, state, trial, update.get("evaluation"), events) or cancelled
+            self._notify()
+
+        try:
+            result = self.run(
+                job["request"]["config"],
+                job["request"]["payload"],
+                progress=progress,
+                should_cancel=lambda: cancelled or self._stop.is_set(),
+                resume=self.store.trials(job_id),
+            )
+            if self._stop.is_set() and not cancelled:
+                # Interrupted by `stop`: `release` requeues the job, its checkpoints stay.
+                return
+            # Only final results reach `on_result` (the run history), never a handed-back partial one.
+            if self.on_result is not None:
+                self.on_result(result)
+            self.store.finish(job_id, "cancelled" if cancelled else "done", result=result)
+        except Exception as exc:
+            self.store.finish(job_id, "error", error=str(exc))
+        self._notify()
+
+
+def _frame(event_id: int, kind: str, data: Any) -> str:
+    return f"id: {event_id}\nevent: {kind}\ndata: {json.dumps(data)}\n\n"
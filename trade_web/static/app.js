@@ -9,12 +9,14 @@ const runBacktestButton = document.querySelector("#run-backtest");
 const runOptimizerButton = document.querySelector("#run-optimizer");
 const runForecastButton = document.querySelector("#run-forecast");
 const cancelOptimizerButton = document.querySelector("#cancel-optimizer");
+const optimizerSearchSelect = document.querySelector("#optimizer-search");
 const refreshHistoryButton = document.querySelector("#refresh-history");
 const refreshOrdersButton = document.querySelector("#refresh-orders");
 const paperOrderButton = document.querySelector("#paper-order");
 const primaryPaperOrderButton = document.querySelector("#primary-paper-order");
 let optimizerJobId = null;
 let optimizerPollTimer = null;
+let optimizerStream = null;
 let latestAnalysis = null;
 
 const statusColor = {
@@ -141,7 +143,7 @@ function render(data) {
   renderSignal(data.signal);
   renderFrames(data.frames, data.signal);
   renderPattern(data.pattern);
-  renderCorrelations(data.correlations);
+  renderCorrelations(data.correlations, data.correlation_matrix);
   renderMacro(data.macro);
   renderRiskPlan(data.risk_plan);
   renderSummaryChips(data);
@@ -302,17 +304,19 @@ function renderFrames(frames, signal) {
 function renderPattern(pattern) {
   const target = document.querySelector("#pattern");
   const rows = [
-    ["Status", pattern.pattern_detected ? pattern.pattern_type : "Kein W-Muster"],
+    ["Status", pattern.pattern_detected ? pattern.pattern_type : "Kein Muster"],
+    ["Timeframe", pattern.timeframe || "--"],
     ["Konfidenz", `${pattern.confidence || 0}%`],
     ["Entry", money(pattern.optimal_entry)],
     ["Stop", money(pattern.stop_loss)],
     ["Ziel", money(pattern.target_price)],
     ["R/R", pattern.risk_reward ? pattern.risk_reward.toFixed(2) : "--"],
+    ["Fib 0.5 / 0.618", pattern.fibonacci && pattern.fibonacci["0.5"] ? `${money(pattern.fibonacci["0.5"])} / ${money(pattern.fibonacci["0.618"])}` : "--"],
   ];
   target.innerHTML = rows.map(([label, value]) => `<div class="pattern-row"><strong>${label}</strong><span>${value}</span></div>`).join("");
 }
 
-function renderCorrelations(rows) {
+function renderCorrelations(rows, heatmap) {
   const target = document.querySelector("#correlations");
   if (!rows.length) {
     target.textContent = "Keine Korrelationsdaten";
@@ -326,7 +330,24 @@ function renderCorrelations(rows) {
       <span class="${corrClass}">${row.correlation ?? "--"}</span>
       <span class="${strengthClass}">${row.relative_strength > 0 ? "+" : ""}${row.relative_strength}%</span>
     </div>`;
-  }).join("");
+  }).join("") + renderCorrelationHeatmap(heatmap);
+}
+
+function renderCorrelationHeatmap(heatmap) {
+  if (!heatmap || !heatmap.matrix) return "";
+  const label = symbol => symbol.replace(/USDT$/, "");
+  const cell = value => {
+    const alpha = Math.min(Math.abs(value), 1) * 0.75;
+    const color = value >= 0 ? `rgba(37, 123, 80, ${alpha})` : `rgba(185, 74, 66, ${alpha})`;
+    return `<span class="heat-cell" style="background: ${color}" title="${value}">${value.toFixed(2)}</span>`;
+  };
+  return `
+    <div class="corr-heatmap" style="grid-template-columns: 52px repeat(${heatmap.symbols.length}, 1fr)">
+      <span></span>${heatmap.symbols.map(symbol => `<strong>${label(symbol)}</strong>`).join("")}
+      ${heatmap.matrix.map((row, index) => `<strong>${label(heatmap.symbols[index])}</strong>${row.map(cell).join("")}`).join("")}
+    </div>
+    <p class="muted">${heatmap.timeframe} · ${heatmap.window} Returns</p>
+  `;
 }
 
 function renderWarnings(warnings) {
@@ -459,11 +480,11 @@ async function runOptimizer() {
     const response = await fetch("/api/optimize/start", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ demo: demoToggle.checked }),
+      body: JSON.stringify({ demo: demoToggle.checked, search: optimizerSearchSelect.value }),
     });
     const data = await response.json();
     optimizerJobId = data.job_id;
-    pollOptimizer();
+    streamOptimizer();
   } catch (error) {
     target.innerHTML = `<p class="muted">Optimizer konnte nicht gestartet werden: ${error}</p>`;
     runOptimizerButton.disabled = false;
@@ -472,15 +493,63 @@ async function runOptimizer() {
   }
 }
 
+function streamOptimizer() {
+  if (!optimizerJobId) return;
+  if (!window.EventSource) {
+    pollOptimizer();
+    return;
+  }
+  // The server sends a snapshot, then deltas; the browser reconnects with Last-Event-ID on its own.
+  const job = { status: "queued", done: 0, total: 0, candidates: [], best_history: [] };
+  const source = new EventSource(`/api/optimize/stream/${optimizerJobId}`);
+  optimizerStream = source;
+  let frame = 0;
+  const render = () => {
+    if (!frame) frame = window.requestAnimationFrame(() => {
+      frame = 0;
+      renderOptimizerProgress(job);
+    });
+  };
+  const on = (kind, apply) => source.addEventListener(kind, event => {
+    apply(JSON.parse(event.data));
+    render();
+    if (["done", "cancelled", "error"].includes(job.status)) {
+      source.close();
+      optimizerStream = null;
+      finishOptimizer(job);
+    }
+  });
+  on("snapshot", data => Object.assign(job, data));
+  on("progress", data => Object.assign(job, data));
+  on("best", data => { job.best = data; });
+  on("candidates", data => { job.candidates = data; });
+  on("convergence", data => { job.best_history.push(data); });
+  on("status", data => {
+    // A (re)started job replays its checkpoints from zero.
+    if (data.status === "running") Object.assign(job, { done: 0, candidates: [], best_history: [] });
+    Object.assign(job, data);
+  });
+  source.onerror = () => {
+    if (source.readyState === EventSource.CLOSED && optimizerStream === source) {
+      optimizerStream = null;
+      pollOptimizer();
+    }
+  };
+}
+
 async function pollOptimizer() {
   if (!optimizerJobId) return;
   const response = await fetch(`/api/optimize/status/${optimizerJobId}`);
   const data = await response.json();
   renderOptimizerProgress(data);
-  if (data.status === "running") {
+  if (data.status === "running" || data.status === "queued") {
     optimizerPollTimer = window.setTimeout(pollOptimizer, 1200);
     return;
   }
+  finishOptimizer(data);
+}
+
+function finishOptimizer(data) {
   runOptimizerButton.disabled = false;
   cancelOptimizerButton.disabled = true;
   runOptimizerButton.textContent = "Live optimieren";
@@ -502,6 +571,7 @@ function renderOptimizerProgress(data) {
       <div class="progress-bar"><span style="width: ${pct}%"></span></div>
       <span>${data.done || 0}/${data.total || "?"} · ${pct}%</span>
       <span>Status: ${data.status}</span>
+      ${data.search ? `<span>${data.search.strategy} · ${data.search.saved_full_evaluations} volle Läufe gespart</span>` : ""}
     </div>
     <div class="optimizer-ranking">
       ${rows.map(row => `
@@ -543,7 +613,9 @@ function renderForecast(data) {
       <span>${data.settings.timeframe}</span>
       <span>${data.settings.candles} Kerzen</span>
       <span>Horizont ${data.settings.horizon}</span>
+      <span>${data.settings.method} · ${data.settings.paths} Pfade</span>
       <span>Vol ${data.metrics.volatility_pct}%</span>
+      <span>P(hoeher) ${data.metrics.prob_up_pct}%</span>
     </div>
     ${renderForecastChart(data)}
     ${renderLearningCurve(data.learning_curve || [])}
@@ -580,6 +652,7 @@ function renderBacktest(data) {
         </div>
       `).join("")}
     </div>
+    ${rows[0]?.patterns ? `<p class="muted">Muster: ${rows[0].patterns.w_patterns} W-Muster, ${rows[0].patterns.fib_candles} Fibonacci-Kerzen · ${rows[0].patterns.aligned_trades} Trades mit Muster in Trade-Richtung${rows[0].patterns.aligned_win_rate !== null ? `, Winrate ${rows[0].patterns.aligned_win_rate}%` : ""}</p>` : ""}
     ${renderPriceChart(rows[0]?.chart || {})}
     ${renderEquityChart(rows[0]?.equity_curve || [])}
   `;
@@ -598,6 +671,8 @@ function renderOptimizer(data) {
   target.innerHTML = `
     <div class="backtest-meta">
       <span>${data.settings.mode}</span>
+      ${data.settings.search ? `<span>${data.settings.search.strategy} · ${data.settings.search.saved_full_evaluations} volle Läufe gespart</span>` : ""}
+      ${data.best.partial ? `<span>Teilbudget ${data.best.budget} (abgebrochen)</span>` : ""}
       <span>Score ${data.best.score}</span>
       <span>Train ${data.best.train_score}</span>
       <span>OOS ${data.best.out_of_sample_score}</span>
@@ -657,6 +732,8 @@ function renderForecastChart(data) {
   const forecastLine = forecast.map((point, index) => `${index ? "L" : "M"}${x(start + index + 1).toFixed(1)} ${y(point.price).toFixed(1)}`).join(" ");
   const upper = forecast.map((point, index) => `${index ? "L" : "M"}${x(start + index + 1).toFixed(1)} ${y(point.upper).toFixed(1)}`).join(" ");
   const lower = forecast.map((point, index) => `L${x(start + forecast.length - index).toFixed(1)} ${y(forecast[forecast.length - 1 - index].lower).toFixed(1)}`).join(" ");
+  const upperInner = forecast.map((point, index) => `${index ? "L" : "M"}${x(start + index + 1).toFixed(1)} ${y(point.upper_50 ?? point.upper).toFixed(1)}`).join(" ");
+  const lowerInner = forecast.map((point, index) => `L${x(start + forecast.length - index).toFixed(1)} ${y(forecast[forecast.length - 1 - index].lower_50 ?? forecast[forecast.length - 1 - index].lower).toFixed(1)}`).join(" ");
   const splitX = x(start);
   const firstTime = history[0]?.time;
   const lastHistoryTime = history[history.length - 1]?.time;
@@ -684,11 +761,12 @@ function renderForecastChart(data) {
       <svg class="forecast-chart" viewBox="0 0 ${width} ${height}" role="img" aria-label="Forecast mit Konfidenzband">
         ${frame}
         <path class="forecast-band" d="${upper} ${lower} Z"></path>
+        <path class="forecast-band" d="${upperInner} ${lowerInner} Z"></path>
         <path class="history-line" d="${histLine}"></path>
         <path class="forecast-line" d="${forecastLine}"></path>
         <text class="chart-label" x="${(splitX + 8).toFixed(1)}" y="${(padTop + 14).toFixed(1)}">Forecast</text>
       </svg>
-      <div class="chart-legend"><span>Historie</span><span class="text-green">Forecast</span><span>Band = Unsicherheit</span></div>
+      <div class="chart-legend"><span>Historie</span><span class="text-green">Forecast</span><span>Baender = 50% / 90% der Pfade</span></div>
     </div>
   `;
 }
@@ -696,7 +774,9 @@ function renderForecastChart(data) {
 function renderLearningCurve(points) {
   if (!points.length) return "";
   const series = points.map(point => ({ x: point.window, y: point.error_pct }));
-  return renderLineCard("Lernkurve: Fehler sinkt mit mehr Historie", series, "window", "error_pct", true);
+  const best = points.reduce((left, right) => (right.error_pct < left.error_pct ? right : left));
+  const note = `<p class="muted">Bestes Fenster ${best.window} Kerzen · Fehler ${best.error_pct}% · 90%-Band trifft ${best.coverage_pct ?? "--"}% · Random Walk ${best.random_walk_error_pct ?? "--"}% · ${best.anchors ?? "--"} Zeitpunkte</p>`;
+  return renderLineCard("Lernkurve: Forecast-Fehler je Lookback-Fenster", series, "window", "error_pct", true) + note;
 }
 
 function renderConvergenceChart(points) {
@@ -4,7 +4,7 @@ import json
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 
 class TradeStore:
@@ -114,3 +114,514 @@ class TradeStore:
             payload["created_at"] = row["created_at"]
             result.append(payload)
         return result
+
+
+class CandleStore:
+    """Closed OHLCV candles keyed by (exchange, symbol, timeframe, open_time), open_time in seconds.
+
+    Ranges the exchange answered without candles although it has later ones (before the listing,
+    outages) are kept in `candle_voids` and never requested again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._init()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute("pragma synchronous = normal")
+        return connection
+
+    def _init(self) -> None:
+        with self._connect() as db:
+            db.execute("pragma journal_mode = wal")
+            db.execute(
+                """
+                create table if not exists candles (
+                    exchange text not null,
+                    symbol text not null,
+                    timeframe text not null,
+                    open_time integer not null,
+                    open real not null,
+                    high real not null,
+                    low real not null,
+                    close real not null,
+                    volume real not null,
+                    primary key (exchange, symbol, timeframe, open_time)
+                ) without rowid
+                """
+            )
+            db.execute(
+                """
+                create table if not exists candle_voids (
+                    exchange text not null,
+                    symbol text not null,
+                    timeframe text not null,
+                    start_time integer not null,
+                    end_time integer not null,
+                    primary key (exchange, symbol, timeframe, start_time)
+                ) without rowid
+                """
+            )
+
+    def upsert(self, exchange: str, symbol: str, timeframe: str, candles: list[dict[str, Any]]) -> int:
+        rows = [
+            (
+                exchange,
+                symbol,
+                timeframe,
+                int(candle["time"]),
+                float(candle["open"]),
+                float(candle["high"]),
+                float(candle["low"]),
+                float(candle["close"]),
+                float(candle.get("volume", 0)),
+            )
+            for candle in candles
+        ]
+        with self._connect() as db:
+            db.executemany(
+                """
+                insert or replace into candles(exchange, symbol, timeframe, open_time, open, high, low, close, volume)
+                values(?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def range(self, exchange: str, symbol: str, timeframe: str, start: int, end: int) -> list[dict[str, Any]]:
+        with self._connect() as db:
+            rows = db.execute(
+                """
+                select open_time, open, high, low, close, volume from candles
+                where exchange = ? and symbol = ? and timeframe = ? and open_time between ? and ?
+                order by open_time
+                """,
+                (exchange, symbol, timeframe, start, end),
+            ).fetchall()
+        keys = ("time", "open", "high", "low", "close", "volume")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def voids(self, exchange: str, symbol: str, timeframe: str, start: int, end: int) -> list[tuple[int, int]]:
+        with self._connect() as db:
+            rows = db.execute(
+                """
+                select start_time, end_time from candle_voids
+                where exchange = ? and symbol = ? and timeframe = ? and start_time <= ? and end_time >= ?
+                order by start_time
+                """,
+                (exchange, symbol, timeframe, end, start),
+            ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def missing_ranges(
+        self, exchange: str, symbol: str, timeframe: str, start: int, end: int, step: int
+    ) -> list[tuple[int, int]]:
+        """Ranges without cached candles that are worth asking the exchange for (known voids excluded)."""
+        with self._connect() as db:
+            times = [
+                row[0]
+                for row in db.execute(
+                    """
+                    select open_time from candles
+                    where exchange = ? and symbol = ? and timeframe = ? and open_time between ? and ?
+                    order by open_time
+                    """,
+                    (exchange, symbol, timeframe, start, end),
+                )
+            ]
+        return _subtract(_gaps(times, start, end, step), self.voids(exchange, symbol, timeframe, start, end), step)
+
+    def fetch(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start: int,
+        end: int,
+        step: int,
+        loader: Callable[[str, str, int, int], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Serve [start, end] from the cache and call `loader` only for the missing ranges.
+
+        A part of a requested range that stays empty although a later candle exists is recorded as a
+        void. Empty ranges after the newest candle are not: the exchange may just not have them yet.
+        """
+        rows = self.range(exchange, symbol, timeframe, start, end)
+        gaps = _subtract(_gaps([row["time"] for row in rows], start, end, step), self.voids(exchange, symbol, timeframe, start, end), step)
+        if not gaps:
+            return rows
+        for gap_start, gap_end in gaps:
+            candles = [candle for candle in loader(symbol, timeframe, gap_start, gap_end) if gap_start <= candle["time"] <= gap_end]
+            if candles:
+                self.upsert(exchange, symbol, timeframe, candles)
+        rows = self.range(exchange, symbol, timeframe, start, end)
+        if rows:
+            newest = rows[-1]["time"]
+            times = [row["time"] for row in rows]
+            voids = [
+                void
+                for gap_start, gap_end in gaps
+                if gap_start < newest
+                for void in _gaps([time for time in times if gap_start <= time <= gap_end], gap_start, min(gap_end, newest - step), step)
+            ]
+            if voids:
+                with self._connect() as db:
+                    db.executemany(
+                        "insert or replace into candle_voids(exchange, symbol, timeframe, start_time, end_time) values(?, ?, ?, ?, ?)",
+                        [(exchange, symbol, timeframe, void_start, void_end) for void_start, void_end in voids],
+                    )
+        return rows
+
+
+class JobStore:
+    """Optimizer jobs and their per-trial checkpoints, shared by every thread and process on one database.
+
+    A job is `queued` until a worker claims it; a claim is a lease that the owner renews with
+    `heartbeat`. Jobs whose lease ran out (process killed, restarted) or that their owner `release`d
+    on shutdown are claimable again and resume from their checkpoints. Finished jobs (`done`, `cancelled`, `error`) are dropped by `evict`.
+    Progress is also appended to a per-job event log (`events`), numbered from 1, for streaming.
+    """
+
+    FINISHED = ("done", "cancelled", "error")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._init()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        connection.execute("pragma synchronous = normal")
+        return connection
+
+    def _init(self) -> None:
+        with self._connect() as db:
+            db.execute("pragma journal_mode = wal")
+            db.execute(
+                """
+                create table if not exists optimizer_jobs (
+                    id text primary key,
+                    status text not null,
+                    priority integer not null default 0,
+                    created_at integer not null,
+                    started_at integer,
+                    finished_at integer,
+                    heartbeat_at real,
+                    owner text,
+                    cancel integer not null default 0,
+                    request text not null,
+                    done integer not null default 0,
+                    total integer not null default 0,
+                    search text,
+                    best text,
+                    candidates text not null default '[]',
+                    best_history text not null default '[]',
+                    result text,
+                    error text
+                )
+                """
+            )
+            db.execute("create index if not exists optimizer_jobs_queue on optimizer_jobs(status, priority desc, created_at)")
+            db.execute(
+                """
+                create table if not exists optimizer_trials (
+                    job_id text not null,
+                    trial_id integer not null,
+                    params text not null,
+                    budget real not null,
+                    candidate text not null,
+                    primary key (job_id, trial_id)
+                ) without rowid
+                """
+            )
+            db.execute(
+                """
+                create table if not exists optimizer_events (
+                    job_id text not null,
+                    seq integer not null,
+                    kind text not null,
+                    data text not null,
+                    primary key (job_id, seq)
+                ) without rowid
+                """
+            )
+
+    @staticmethod
+    def _event(db: sqlite3.Connection, job_id: str, kind: str, data: dict[str, Any]) -> None:
+        db.execute(
+            """
+            insert into optimizer_events(job_id, seq, kind, data)
+            values(?, (select coalesce(max(seq), 0) + 1 from optimizer_events where job_id = ?), ?, ?)
+            """,
+            (job_id, job_id, kind, json.dumps(data)),
+        )
+
+    def submit(self, job_id: str, request: dict[str, Any], priority: int = 0) -> None:
+        with self._connect() as db:
+            db.execute(
+                "insert into optimizer_jobs(id, status, priority, created_at, request) values(?, 'queued', ?, ?, ?)",
+                (job_id, priority, int(time.time()), json.dumps(request)),
+            )
+
+    def claim(self, owner: str, lease: float, limit: int | None = None) -> dict[str, Any] | None:
+        """Take the next job (highest priority, oldest first; expired leases included) in one statement.
+
+        With `limit`, nothing is claimed while that many jobs hold a live lease, across all processes.
+        """
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                """
+                update optimizer_jobs
+                set status = 'running', owner = ?, heartbeat_at = ?, started_at = coalesce(started_at, ?)
+                where id = (
+                    select id from optimizer_jobs
+                    where status = 'queued' or (status = 'running' and heartbeat_at < ?)
+                    order by priority desc, created_at, id
+                    limit 1
+                )
+                and (select count(*) from optimizer_jobs where status = 'running' and heartbeat_at >= ?) < ?
+                returning id, request, started_at
+                """,
+                (owner, now, int(now), now - lease, now - lease, 2**31 if limit is None else limit),
+            ).fetchone()
+            if row:
+                # A (re)claimed job replays its checkpoints, so stream clients start over from zero.
+                self._event(db, row["id"], "status", {"status": "running", "started_at": row["started_at"]})
+        return {"id": row["id"], "request": json.loads(row["request"])} if row else None
+
+    def release(self, owner: str) -> int:
+        """Put the running jobs of `owner` back in the queue (graceful shutdown); they resume from their checkpoints."""
+        with self._connect() as db:
+            rows = db.execute(
+                "update optimizer_jobs set status = 'queued', owner = null, heartbeat_at = null where owner = ? and status = 'running' returning id",
+                (owner,),
+            ).fetchall()
+            for row in rows:
+                self._event(db, row["id"], "status", {"status": "queued"})
+        return len(rows)
+
+    def heartbeat(self, owner: str) -> None:
+        with self._connect() as db:
+            db.execute("update optimizer_jobs set heartbeat_at = ? where owner = ? and status = 'running'", (time.time(), owner))
+
+    def checkpoint(
+        self,
+        job_id: str,
+        state: dict[str, Any],
+        trial: dict[str, Any] | None = None,
+        candidate: dict[str, Any] | None = None,
+        events: Iterable[tuple[str, Any]] = (),
+    ) -> bool:
+        """Store one evaluated trial, the job's progress and its events; returns whether a cancel was requested."""
+        with self._connect() as db:
+            for kind, data in events:
+                self._event(db, job_id, kind, data)
+            if trial is not None:
+                db.execute(
+                    "insert or ignore into optimizer_trials(job_id, trial_id, params, budget, candidate) values(?, ?, ?, ?, ?)",
+                    (job_id, trial["id"], json.dumps(trial["params"]), trial["budget"], json.dumps(candidate)),
+                )
+            row = db.execute(
+                """
+                update optimizer_jobs
+                set done = ?, total = ?, search = ?, best = ?, candidates = ?, best_history = ?, heartbeat_at = ?
+                where id = ?
+                returning cancel
+                """,
+                (
+                    state["done"],
+                    state["total"],
+                    json.dumps(state.get("search")),
+                    json.dumps(state.get("best")),
+                    json.dumps(state.get("candidates", [])),
+                    json.dumps(state.get("best_history", [])),
+                    time.time(),
+                    job_id,
+                ),
+            ).fetchone()
+        return bool(row and row["cancel"])
+
+    def trials(self, job_id: str) -> dict[int, dict[str, Any]]:
+        """Checkpoints of a job in the `resume` format of `optimizer.run`."""
+        with self._connect() as db:
+            rows = db.execute("select trial_id, params, budget, candidate from optimizer_trials where job_id = ?", (job_id,)).fetchall()
+        return {
+            row["trial_id"]: {"params": json.loads(row["params"]), "budget": row["budget"], "candidate": json.loads(row["candidate"])}
+            for row in rows
+        }
+
+    def finish(self, job_id: str, status: str, result: dict[str, Any] | None = None, error: str | None = None) -> None:
+        with self._connect() as db:
+            event = {"status": status, "result": result, "error": error, "finished_at": int(time.time())}
+            if result and result.get("best") is not None:
+                event["best"] = result["best"]
+            self._event(db, job_id, "status", event)
+            db.execute(
+                "update optimizer_jobs set status = ?, result = ?, error = ?, best = coalesce(?, best), finished_at = ? where id = ?",
+                (
+                    status,
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    json.dumps(result["best"]) if result and result.get("best") is not None else None,
+                    int(time.time()),
+                    job_id,
+                ),
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """Flag a running job for cancellation, cancel a queued one right away; False for unknown jobs."""
+        with self._connect() as db:
+            if db.execute(
+                "update optimizer_jobs set status = 'cancelled', finished_at = ? where id = ? and status = 'queued'",
+                (int(time.time()), job_id),
+            ).rowcount:
+                self._event(db, job_id, "status", {"status": "cancelled", "result": None, "error": None, "finished_at": int(time.time())})
+            return db.execute("update optimizer_jobs set cancel = 1 where id = ?", (job_id,)).rowcount > 0
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """The job's current state; `event_id` is the last event it already contains."""
+        with self._connect() as db:
+            # One read transaction, so the state and the event id belong together.
+            db.execute("begin")
+            row = db.execute("select * from optimizer_jobs where id = ?", (job_id,)).fetchone()
+            event_id = db.execute("select coalesce(max(seq), 0) from optimizer_events where job_id = ?", (job_id,)).fetchone()[0]
+        if row is None:
+            return None
+        job = {key: row[key] for key in ("id", "status", "priority", "created_at", "started_at", "finished_at", "done", "total", "error")}
+        for key in ("search", "best", "result"):
+            job[key] = json.loads(row[key]) if row[key] is not None else None
+        job["candidates"] = json.loads(row["candidates"])
+        job["best_history"] = json.loads(row["best_history"])
+        job["event_id"] = event_id
+        return job
+
+    def events(self, job_id: str, after: int = 0) -> list[tuple[int, str, Any]]:
+        with self._connect() as db:
+            rows = db.execute(
+                "select seq, kind, data from optimizer_events where job_id = ? and seq > ? order by seq",
+                (job_id, after),
+            ).fetchall()
+        return [(row["seq"], row["kind"], json.loads(row["data"])) for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        with self._connect() as db:
+            rows = db.execute("select status, count(*) as count from optimizer_jobs group by status").fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+    def evict(self, ttl: float) -> int:
+        """Delete finished jobs (and their checkpoints) that finished more than `ttl` seconds ago."""
+        cutoff = time.time() - ttl
+        with self._connect() as db:
+            expired = [
+                row["id"]
+                for row in db.execute(
+                    f"select id from optimizer_jobs where status in ({', '.join('?' * len(self.FINISHED))}) and finished_at < ?",
+                    (*self.FINISHED, cutoff),
+                )
+            ]
+            db.executemany("delete from optimizer_trials where job_id = ?", [(job_id,) for job_id in expired])
+            db.executemany("delete from optimizer_events where job_id = ?", [(job_id,) for job_id in expired])
+            db.executemany("delete from optimizer_jobs where id = ?", [(job_id,) for job_id in expired])
+        return len(expired)
+
+
+class ResponseStore:
+    """Rendered API responses shared by all app processes: the second tier of `ResponseCache`.
+
+    Rows are keyed by the response key hash. A `pending` row is a computation lease: other processes
+    wait for it to turn `ready` instead of computing the same response again.
+    """
+
+    def __init__(self, path: Path, maxsize: int = 256):
+        self.path = path
+        self.maxsize = maxsize
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._init()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute("pragma synchronous = normal")
+        return connection
+
+    def _init(self) -> None:
+        with self._connect() as db:
+            db.execute("pragma journal_mode = wal")
+            db.execute(
+                """
+                create table if not exists response_cache (
+                    key text primary key,
+                    state text not null,
+                    body text,
+                    updated_at real not null,
+                    expires_at real
+                ) without rowid
+                """
+            )
+
+    def get(self, key: str) -> str | None:
+        with self._connect() as db:
+            row = db.execute("select body from response_cache where key = ? and state = 'ready'", (key,)).fetchone()
+        return row[0] if row else None
+
+    def claim(self, key: str, lease: float) -> bool:
+        """Start computing `key` unless another process holds a live lease or the body is ready."""
+        now = time.time()
+        with self._connect() as db:
+            return db.execute(
+                """
+                insert into response_cache(key, state, updated_at, expires_at) values(?, 'pending', ?, ?)
+                on conflict(key) do update set updated_at = excluded.updated_at, expires_at = excluded.expires_at
+                where state = 'pending' and expires_at < ?
+                """,
+                (key, now, now + lease, now),
+            ).rowcount > 0
+
+    def put(self, key: str, body: str) -> None:
+        with self._connect() as db:
+            db.execute(
+                "insert or replace into response_cache(key, state, body, updated_at) values(?, 'ready', ?, ?)",
+                (key, body, time.time()),
+            )
+            db.execute(
+                """
+                delete from response_cache where key in (
+                    select key from response_cache where state = 'ready' order by updated_at desc limit -1 offset ?
+                )
+                """,
+                (self.maxsize,),
+            )
+
+    def release(self, key: str) -> None:
+        with self._connect() as db:
+            db.execute("delete from response_cache where key = ? and state = 'pending'", (key,))
+
+
+def _gaps(times: list[int], start: int, end: int, step: int) -> list[tuple[int, int]]:
+    gaps = []
+    expected = start
+    for open_time in times:
+        if open_time > expected:
+            gaps.append((expected, open_time - step))
+        expected = max(expected, open_time + step)
+    if expected <= end:
+        gaps.append((expected, end))
+    return gaps
+
+
+def _subtract(gaps: list[tuple[int, int]], voids: list[tuple[int, int]], step: int) -> list[tuple[int, int]]:
+    """`gaps` minus the (inclusive, sorted) `voids`."""
+    result = []
+    for gap_start, gap_end in gaps:
+        for void_start, void_end in voids:
+            if void_end < gap_start or void_start > gap_end:
+                continue
+            if void_start > gap_start:
+                result.append((gap_start, void_start - step))
+            gap_start = void_end + step
+        if gap_start <= gap_end:
+            result.append((gap_start, gap_end))
+    return result
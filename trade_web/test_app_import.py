@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parent
+# Cold start of `import app` (flask, numpy, engine core) in milliseconds; raise only with a reason.
+IMPORT_BUDGET_MS = 600
+LAZY_MODULES = ("trading_engine.optimizer", "trading_engine.forecast", "trading_engine.search", "trading_engine.validation", "multiprocessing", "requests")
+
+
+def import_times(statement):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def test_engine_import_defers_heavy_modules():
+    times = import_times("import trading_engine, trading_engine.market_data")
+    assert "trading_engine" in times
+    assert not [name for name in times if name.startswith(LAZY_MODULES)]
+
+
+def test_app_cold_import_stays_within_budget():
+    pytest.importorskip("flask")
+    times = import_times("import app")
+    assert not [name for name in times if name.startswith(LAZY_MODULES)]
+    assert times["app"] < IMPORT_BUDGET_MS, f"import app took {times['app']:.1f}ms"
+
+
+def test_app_import_starts_no_job_threads():
+    pytest.importorskip("flask")
+    statement = "import threading, app; print(sorted(thread.name for thread in threading.enumerate() if thread.name.startswith('optimizer')))"
+    result = subprocess.run([sys.executable, "-c", statement], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_batch_analysis_rejects_symbols_outside_available_symbols(tmp_path):
+    pytest.importorskip("flask")
+    statement = (
+        "import json, app; client = app.app.test_client(); "
+        "print(json.dumps([client.get(path).status_code for path in ("
+        "'/api/analyze/batch?symbols=BTCUSDT,ETHUSDT&demo=1', '/api/analyze/batch?symbols=BTCUSDT,FOOUSDT&demo=1')]))"
+    )
+    env = dict(os.environ, TRADE_WEB_DATA=str(tmp_path))
+    result = subprocess.run([sys.executable, "-c", statement], cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[200, 400]"
+
@@ -0,0 +1,232 @@
+import json
+import threading
+import time
+
+import pytest
+
+from jobs import OptimizerQueue
+from storage import CandleStore, JobStore, ResponseStore, TradeStore
+from trading_engine import TradingAnalyzer
+from trading_engine.cache import ResponseCache
+
+
+def make_candles(times):
+    return [{"time": t, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0} for t in times]
+
+
+def test_candle_store_reports_gaps(tmp_path):
+    store = CandleStore(tmp_path / "candles.sqlite3")
+    store.upsert("BINANCE", "BTCUSDT", "4h", make_candles([0, 100, 400, 500]))
+    assert store.missing_ranges("BINANCE", "BTCUSDT", "4h", 0, 800, 100) == [(200, 300), (600, 800)]
+    assert store.missing_ranges("BINANCE", "ETHUSDT", "4h", 0, 200, 100) == [(0, 200)]
+
+
+def test_candle_store_fetches_only_missing_ranges(tmp_path):
+    store = CandleStore(tmp_path / "candles.sqlite3")
+    store.upsert("BINANCE", "BTCUSDT", "4h", make_candles([0, 100, 400]))
+    calls = []
+
+    def loader(symbol, timeframe, start, end):
+        calls.append((start, end))
+        return make_candles(range(start, end + 1, 100))
+
+    rows = store.fetch("BINANCE", "BTCUSDT", "4h", 0, 500, 100, loader)
+    assert [row["time"] for row in rows] == [0, 100, 200, 300, 400, 500]
+    assert calls == [(200, 300), (500, 500)]
+    store.fetch("BINANCE", "BTCUSDT", "4h", 0, 500, 100, loader)
+    assert len(calls) == 2
+
+
+def test_candle_store_remembers_ranges_the_exchange_cannot_fill(tmp_path):
+    store = CandleStore(tmp_path / "candles.sqlite3")
+    calls = []
+
+    def loader(symbol, timeframe, start, end):
+        # Listed at 300, nothing at 500 (outage), 800 not published yet.
+        calls.append((start, end))
+        return make_candles(t for t in range(start, end + 1, 100) if t >= 300 and t not in (500, 800))
+
+    rows = store.fetch("BINANCE", "NEWUSDT", "4h", 0, 800, 100, loader)
+    assert [row["time"] for row in rows] == [300, 400, 600, 700] and calls == [(0, 800)]
+    assert store.voids("BINANCE", "NEWUSDT", "4h", 0, 800) == [(0, 200), (500, 500)]
+    assert store.missing_ranges("BINANCE", "NEWUSDT", "4h", 0, 800, 100) == [(800, 800)]
+    store.fetch("BINANCE", "NEWUSDT", "4h", 0, 800, 100, loader)
+    assert calls == [(0, 800), (800, 800)]
+
+
+def test_job_store_claims_by_priority_and_reclaims_expired_leases(tmp_path):
+    jobs = JobStore(tmp_path / "jobs.sqlite3")
+    jobs.submit("low", {"payload": {}}, priority=0)
+    jobs.submit("high", {"payload": {}}, priority=5)
+    jobs.submit("queued", {"payload": {}}, priority=0)
+    assert jobs.claim("a", lease=30)["id"] == "high"
+    assert jobs.claim("a", lease=30)["id"] == "low"
+    assert jobs.cancel("queued") and jobs.get("queued")["status"] == "cancelled"
+    assert jobs.claim("b", lease=30) is None
+    # An owner that stopped renewing its lease loses the job to the next claim.
+    assert jobs.claim("b", lease=-1)["id"] in {"high", "low"}
+    assert jobs.counts() == {"running": 2, "cancelled": 1}
+    assert jobs.evict(ttl=-1) == 1 and jobs.get("queued") is None
+    # `limit` caps live jobs across all owners.
+    jobs.submit("later", {"payload": {}})
+    assert jobs.claim("c", lease=30, limit=2) is None
+    assert jobs.claim("c", lease=30, limit=3)["id"] == "later"
+
+
+def test_optimizer_job_resumes_from_checkpoints(tmp_path):
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["4h"], "signal_mode": "balanced", "optimizer": {"candidates": 10, "validation": {"method": "holdout"}}}
+    jobs = JobStore(tmp_path / "jobs.sqlite3")
+    evaluated = []
+
+    def run(config, payload, **hooks):
+        progress = hooks.pop("progress")
+
+        def count(update):
+            if not update["resumed"]:
+                evaluated.append(update["trial"]["id"])
+            progress(update)
+
+        return analyzer.optimize(config, candles=220, use_demo_data=True, progress=count, **hooks)
+
+    queue = OptimizerQueue(jobs, run, top_k=3)
+    job_id = queue.submit({"config": config, "payload": {}})
+
+    class Crash(Exception):
+        pass
+
+    def crash_after_four(update):
+        jobs.checkpoint(job_id, {"done": update["done"], "total": update["total"]}, update["trial"], update["evaluation"])
+        if update["done"] == 4:
+            raise Crash
+
+    jobs.claim("dead", lease=30)
+    with pytest.raises(Crash):
+        analyzer.optimize(config, candles=220, use_demo_data=True, progress=crash_after_four)
+    assert len(jobs.trials(job_id)) == 4
+
+    queue.execute(jobs.claim(queue.owner, lease=-1))
+    job = jobs.get(job_id)
+    assert job["status"] == "done" and job["done"] == job["total"] == 10
+    assert sorted(evaluated) == list(range(5, 11))
+    assert [row["score"] for row in job["candidates"]] == sorted((row["score"] for row in job["result"]["candidates"]), reverse=True)[:3]
+    fresh = analyzer.optimize(config, candles=220, use_demo_data=True)
+    assert job["best"]["score"] == fresh["best"]["score"]
+
+
+def parse_frames(frames):
+    events = []
+    for frame in frames:
+        fields = dict(line.split(": ", 1) for line in frame.strip().splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_optimizer_stream_replays_deltas_into_the_final_state(tmp_path):
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "ETHUSDT", "timeframes": ["4h"], "signal_mode": "balanced", "optimizer": {"candidates": 6, "validation": {"method": "holdout"}}}
+    jobs = JobStore(tmp_path / "jobs.sqlite3")
+    queue = OptimizerQueue(jobs, lambda config, payload, **hooks: analyzer.optimize(config, candles=200, use_demo_data=True, **hooks), top_k=3)
+    job_id = queue.submit({"config": config, "payload": {}})
+    frames, subscribed = [], threading.Event()
+
+    def read():
+        for frame in queue.stream(job_id):
+            frames.append(frame)
+            if "event: snapshot" in frame:
+                subscribed.set()
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    assert subscribed.wait(timeout=5)
+    queue.execute(jobs.claim(queue.owner, lease=30))
+    reader.join(timeout=10)
+    assert not reader.is_alive()
+
+    events = parse_frames(frames)
+    assert events[0][1] == "snapshot" and events[0][2]["status"] == "queued"
+    assert [seq for seq, _, _ in events[1:]] == list(range(events[0][0] + 1, events[-1][0] + 1))
+    state = dict(events[0][2])
+    for _, kind, data in events[1:]:
+        if kind == "convergence":
+            state["best_history"].append(data)
+        elif kind in ("best", "candidates"):
+            state[kind] = data
+        else:
+            state.update(data)
+    final = jobs.get(job_id)
+    assert state["status"] == "done" and state["result"] == final["result"]
+    assert {key: state[key] for key in ("done", "total", "best", "candidates", "best_history")} == {key: final[key] for key in ("done", "total", "best", "candidates", "best_history")}
+
+    # A reconnect with Last-Event-ID only gets the rest; a finished job streams its snapshot only.
+    tail = parse_frames(queue.stream(job_id, last_event_id=events[-3][0]))
+    assert tail == events[-2:]
+    assert [kind for _, kind, _ in parse_frames(queue.stream(job_id))] == ["snapshot"]
+
+
+def test_stopped_queue_hands_its_running_job_back(tmp_path):
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "ETHUSDT", "timeframes": ["4h"], "signal_mode": "balanced", "optimizer": {"candidates": 6, "validation": {"method": "holdout"}}}
+    jobs = JobStore(tmp_path / "jobs.sqlite3")
+    running = threading.Event()
+
+    def run(config, payload, progress, **hooks):
+        def slow(update):
+            progress(update)
+            running.set()
+            time.sleep(0.05)
+
+        return analyzer.optimize(config, candles=200, use_demo_data=True, progress=slow, **hooks)
+
+    runs = TradeStore(tmp_path / "jobs.sqlite3")
+
+    def save(result):
+        result["run_id"] = runs.save_run("optimizer", result)
+
+    queue = OptimizerQueue(jobs, run, poll=0.05, on_result=save)
+    queue.start()
+    job_id = queue.submit({"config": config, "payload": {}})
+    assert running.wait(timeout=10)
+    queue.stop()
+    stopped = jobs.get(job_id)
+    assert stopped["status"] == "queued" and 0 < stopped["done"] < 6
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("optimizer")]
+    assert runs.recent_runs("optimizer") == []
+
+    # No lease to wait for: the next worker claims it at once and resumes from the checkpoints.
+    other = OptimizerQueue(jobs, run, on_result=save)
+    claimed = jobs.claim(other.owner, lease=30)
+    assert claimed["id"] == job_id
+    other.execute(claimed)
+    assert jobs.get(job_id)["status"] == "done" and jobs.get(job_id)["result"]["settings"]["evaluated"] == 6
+    # Only the finished run reaches the run history, not the partial one from the stopped worker.
+    saved = runs.recent_runs("optimizer")
+    assert len(saved) == 1 and saved[0]["payload"]["settings"]["evaluated"] == 6
+    assert jobs.get(job_id)["result"]["run_id"] == saved[0]["id"]
+
+
+def test_response_cache_shares_bodies_between_processes(tmp_path):
+    shared = ResponseStore(tmp_path / "cache.sqlite3")
+    first, second = ResponseCache(shared=shared), ResponseCache(shared=shared)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return '{"signal": "BUY"}', True
+
+    assert first.get_or_compute(("analyze", 1), compute) == ('{"signal": "BUY"}', "miss")
+    assert second.get_or_compute(("analyze", 1), compute) == ('{"signal": "BUY"}', "shared")
+    assert second.get_or_compute(("analyze", 1), compute)[1] == "hit" and len(calls) == 1
+
+    # While another process holds the lease for a key, a miss waits for its body.
+    name = ResponseCache.etag(("analyze", 2))
+    assert shared.claim(name, lease=30)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(second.get_or_compute(("analyze", 2), compute)))
+    waiter.start()
+    shared.put(name, '{"signal": "SELL"}')
+    waiter.join(timeout=5)
+    assert result == [('{"signal": "SELL"}', "shared")] and len(calls) == 1
+    assert first.get_or_compute("degraded", lambda: ("partial", False)) == ("partial", "uncached")
+    assert shared.get(ResponseCache.etag("degraded")) is None and shared.claim(ResponseCache.etag("degraded"), lease=30)
@@ -1,6 +1,30 @@
+import errno
+import json
 import math
+import os
+import random
+import threading
+import time
 
-from trading_engine import TradingAnalyzer, correlation, ema, macd, performance, returns, rsi, sma
+import numpy as np
+import pytest
+
+from trading_engine import ConfigStore, TradingAnalyzer, correlation, ema, macd, performance, returns, rsi, sma
+from storage import CandleStore
+from trading_engine.backtest import indicator_arrays, signal_series, simulate, strength_series, timeframe_weights
+from trading_engine.cache import IndicatorCache, ResponseCache
+from trading_engine.columnar import CandleArray
+from trading_engine.correlation import CorrelationEngine, RollingCorrelation, correlation_matrix, return_matrix
+from trading_engine.forecast import QUANTILES, learning_curve, quantile_bands, simulate_log_paths
+from trading_engine.incremental import IndicatorRegistry, IndicatorState
+from trading_engine.levels import LevelIndex, pivots, rolling_max, rolling_min
+from trading_engine.optimizer import sample_params
+from trading_engine.patterns import pattern_at, scan
+from trading_engine.scoring import grid_signal_arrays, param_grid, signal_type_names, status_arrays
+from trading_engine.synthetic import REGIMES, generate_candles, regime_path
+from trading_engine.timeframes import last_closed_open_time
+from trading_engine.validation import CrossValidator, purged_kfold, walk_forward
+from trading_engine.indicators import ema_series, macd_series, rsi_series, sma_series
 
 
 def test_indicator_basics():
@@ -14,6 +38,237 @@ def test_indicator_basics():
     assert macd_data["macd"] is not None
 
 
+def test_indicator_series_align_with_scalars():
+    closes = [100 + (index % 17) * 1.5 - (index % 5) for index in range(300)]
+    series = macd_series(closes)
+    assert len(series["macd"]) == len(series["signal"]) == len(closes)
+    assert math.isclose(series["hist"][-1], macd(closes)["hist"])
+    assert ema_series(closes, 20)[-1] == ema(closes, 20)
+    assert rsi_series(closes)[-1] == rsi(closes)
+    assert math.isclose(sma_series(closes, 200)[-1], sma(closes, 200))
+    assert math.isnan(ema_series(closes, 20)[18]) and not math.isnan(ema_series(closes, 20)[19])
+    assert ema(closes[:150], 50) == ema_series(closes, 50)[149]
+
+
+def test_incremental_state_matches_full_recompute():
+    closes = [100 + (index % 23) * 0.8 - (index % 7) * 1.1 for index in range(260)]
+    state = IndicatorState()
+    for close in closes[:-1]:
+        state.update(close)
+    preview = state.peek(closes[-1])
+    assert state.last_close == closes[-2]
+    snapshot = state.update(closes[-1])
+    assert preview["macd"] == snapshot["macd"] == macd(closes)
+    assert preview["rsi"] == snapshot["rsi"] == rsi(closes)
+    assert snapshot["ema20"] == ema(closes, 20)
+    assert math.isclose(snapshot["sma200"], sma(closes, 200))
+    assert snapshot["support"] == min(closes[-30:]) and snapshot["resistance"] == max(closes[-30:])
+
+
+def test_indicator_registry_only_feeds_new_candles():
+    registry = IndicatorRegistry()
+    closes = [100 + index * 0.5 for index in range(80)]
+    first = registry.sync("BTCUSDT", "4h", closes[:79])
+    second = registry.sync("BTCUSDT", "4h", closes)
+    assert first is second and second.rsi14.count == 80
+    rebuilt = registry.sync("BTCUSDT", "4h", [close * 2 for close in closes])
+    assert rebuilt is not second and rebuilt.last_close == closes[-1] * 2
+
+
+def test_analyze_matches_analyze_many_after_incremental_syncs():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "30m", "4h", "1d"], "signal_mode": "balanced"}
+    # A long-running process: every timeframe state has been fed candle by candle for 300 candles.
+    for tf in config["timeframes"]:
+        candles = analyzer.candle_array("BTCUSDT", tf, candles=541, use_demo_data=True)
+        for end in range(300, 541, 60):
+            analyzer.indicator_states.sync("BTCUSDT", tf, candles.close[:end].tolist(), candles.time[:end].tolist())
+    result = analyzer.analyze(config, use_demo_data=True)
+    row = analyzer.analyze_many(config, symbols=["BTCUSDT"], use_demo_data=True)["signals"][0]
+    assert (row["strength"], row["stop_loss"], row["target"]) == (result["signal"]["strength"], result["signal"]["stop_loss"], result["signal"]["target"])
+    closes = analyzer.candle_array("BTCUSDT", "4h", use_demo_data=True).close
+    assert math.isclose(result["frames"]["4h"]["indicators"]["ema50"], ema(closes.tolist(), 50))
+    assert math.isclose(result["frames"]["4h"]["indicators"]["rsi"], rsi(closes.tolist()))
+
+
+def test_candle_array_slices_share_buffer(tmp_path):
+    rows = [{"time": index * 60, "open": 1.0 + index, "high": 2.0 + index, "low": 0.5 + index, "close": 1.5 + index, "volume": 3.0} for index in range(50)]
+    candles = CandleArray.from_rows(rows)
+    window = candles.window(10, 20)
+    assert len(window) == 10 and window.close[0] == 11.5
+    assert np.shares_memory(window.close, candles.close)
+    assert window.rows()[0] == rows[10]
+    mapped = candles.save(tmp_path, "BINANCE_BTCUSDT_1m")
+    loaded = CandleArray.load(tmp_path, "BINANCE_BTCUSDT_1m")
+    assert isinstance(loaded.values, np.memmap) and loaded.rows() == rows == mapped.rows()
+    assert np.shares_memory(loaded[5:].high, loaded.high)
+
+
+def test_synthetic_candles_are_seeded_ohlcv_with_regimes():
+    candles = generate_candles(5000, "15m", seed=3, price=76000, end_time=900 * 10_000)
+    again = generate_candles(5000, "15m", seed=3, price=76000, end_time=900 * 10_000)
+    assert np.array_equal(candles.values, again.values) and not np.array_equal(candles.values, generate_candles(5000, "15m", seed=4, price=76000).values)
+    assert candles.time[-1] == 900 * 10_000 and np.all(np.diff(candles.time) == 900)
+    assert candles.open[0] == 76000 and np.array_equal(candles.open[1:], candles.close[:-1])
+    assert np.all(candles.high >= np.maximum(candles.open, candles.close)) and np.all(candles.low <= np.minimum(candles.open, candles.close))
+    assert np.all(candles.volume > 0)
+    regimes = regime_path(20_000, 14400, np.random.default_rng(1))
+    assert set(regimes.tolist()) == set(range(len(REGIMES))) and 0 < np.count_nonzero(np.diff(regimes)) < 1000
+
+
+def test_demo_candles_agree_across_request_lengths():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "30m", "4h", "1d"]}
+    short = analyzer.candle_array("BTCUSDT", "4h", candles=241, use_demo_data=True)
+    long = analyzer.candle_array("BTCUSDT", "4h", candles=3000, use_demo_data=True)
+    assert np.array_equal(short.values, long[-241:].values) and np.array_equal(short.time, long[-241:].time)
+    assert short.close[-1] == 76000
+    forecast = analyzer.forecast(config, horizon=12, paths=200, use_demo_data=True)
+    backtest = analyzer.backtest(config, symbols=["BTCUSDT"], candles=400, use_demo_data=True)
+    assert forecast["history"][-1] == backtest["summary"][0]["chart"]["candles"][-1] == short[-1:].rows()[0]
+
+
+def test_rolling_levels_and_pivots_match_brute_force():
+    values = np.random.default_rng(4).standard_normal(500)
+    for length in (1, 3, 30, 120, 600):
+        assert np.array_equal(rolling_min(values, length), [values[max(0, i - length + 1):i + 1].min() for i in range(500)])
+        assert np.array_equal(rolling_max(values, length), [values[max(0, i - length + 1):i + 1].max() for i in range(500)])
+    candles = generate_candles(2000, "4h", seed=6)
+    high, low = candles.high, candles.low
+    expected_highs = [i for i in range(3, 1997) if high[i] > max(high[i - 3:i].max(), high[i + 1:i + 4].max())]
+    expected_lows = [i for i in range(3, 1997) if low[i] < min(low[i - 3:i].min(), low[i + 1:i + 4].min())]
+    assert [item.tolist() for item in pivots(high, low, 3)] == [expected_highs, expected_lows]
+    index = LevelIndex(candles)
+    assert index.levels(1999) == (candles.close[-30:].min(), candles.close[-30:].max())
+    pivot = expected_lows[5]
+    assert index.last_pivot_low(pivot + 2) != pivot and index.last_pivot_low(pivot + 3) == pivot
+    assert index.confirmed_pivots(pivot + 3, "low").tolist() == expected_lows[:6]
+
+
+def ohlc_from_closes(closes):
+    closes = np.asarray(closes, dtype=np.float64)
+    open_ = np.concatenate((closes[:1], closes[:-1]))
+    return CandleArray(np.arange(closes.size, dtype=np.int64) * 14400, np.stack((open_, closes * 1.003, closes * 0.997, closes, np.ones_like(closes))))
+
+
+def test_pattern_scanner_finds_w_and_fibonacci_setups():
+    closes = np.concatenate([np.linspace(100, 90, 11), np.linspace(91, 96, 6), np.linspace(95, 90.4, 6), np.linspace(91.5, 94, 6)])
+    result = scan(ohlc_from_closes(closes))
+    assert result["w_patterns"]["first"].tolist() == [10] and result["w_patterns"]["second"].tolist() == [22]
+    # The second low is only confirmed three candles later; nothing is visible before.
+    assert not result["w_active"][:25].any() and result["w_active"][25:].all()
+    pattern = pattern_at(result)
+    assert pattern["pattern_type"] == "W-Pattern" and pattern["side"] == "BUY" and pattern["optimal_entry"] == 94.0
+    assert math.isclose(pattern["stop_loss"], 90 * 0.997 * 0.997) and math.isclose(pattern["target_price"], 2 * 96 * 1.003 - 90 * 0.997)
+    pullback = scan(ohlc_from_closes(np.concatenate([np.linspace(100, 90, 6), np.linspace(91, 110, 12), np.linspace(109, 99.5, 8)])))
+    setup = pattern_at(pullback)
+    assert setup["pattern_type"] == "Fibonacci 0.5-0.618 Long" and setup["target_price"] == 110 * 1.003
+    assert setup["fibonacci"]["0.618"] < setup["optimal_entry"] < setup["fibonacci"]["0.5"]
+
+
+def test_config_store_snapshot_versions_and_atomic_save(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"symbol": "BTCUSDT"}))
+    os.chmod(path, 0o644)
+    store = ConfigStore(path)
+    first = store.snapshot()
+    assert store.snapshot() is first and first.version == 1
+    copy_ = store.load()
+    copy_["symbol"] = "ETHUSDT"
+    assert store.snapshot().config == {"symbol": "BTCUSDT"}
+
+    saved = store.save(copy_)
+    assert saved.version == 2 and saved.etag != first.etag and store.snapshot() is saved
+    assert json.loads(path.read_text()) == {"symbol": "ETHUSDT"}
+    assert os.stat(path).st_mode & 0o777 == 0o644
+    assert [item.name for item in tmp_path.iterdir()] == ["config.json"]
+    assert store.save(copy_).version == 2
+
+    path.write_text(json.dumps({"symbol": "SOLUSDT", "note": "edited"}))
+    assert store.load()["symbol"] == "SOLUSDT" and store.version == 3
+    assert ConfigStore(path).etag == store.etag
+
+    # A bind-mounted file cannot be replaced; save falls back to writing it in place.
+    def busy(*args):
+        raise OSError(errno.EBUSY, "Device or resource busy")
+
+    monkeypatch.setattr(os, "replace", busy)
+    assert store.save({"symbol": "ADAUSDT"}).version == 4
+    assert json.loads(path.read_text()) == {"symbol": "ADAUSDT"} and store.snapshot().version == 4
+    assert [item.name for item in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_indicator_cache_evicts_and_invalidates_on_new_candle():
+    cache = IndicatorCache(maxsize=2)
+    assert cache.get_or_compute("BTCUSDT", "4h", 100, "p", lambda: "a") == "a"
+    assert cache.get_or_compute("BTCUSDT", "4h", 100, "p", lambda: "b") == "a"
+    cache.put("ETHUSDT", "4h", 100, "p", "e")
+    cache.put("SOLUSDT", "4h", 100, "p", "s")
+    assert cache.get("BTCUSDT", "4h", 100, "p") is None and cache.stats()["evictions"] == 1
+    cache.put("ETHUSDT", "1d", 100, "p", "d")
+    assert cache.get("SOLUSDT", "4h", 200, "p") is None and cache.invalidations == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 3, 1)
+
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "4h"], "signal_mode": "balanced"}
+    first = analyzer.analyze(config, use_demo_data=True)
+    second = analyzer.analyze(config, use_demo_data=True)
+    assert second["signal"] == first["signal"] and second["correlations"] == first["correlations"]
+    assert analyzer.indicator_cache.hits == 3
+
+
+def test_response_cache_coalesces_concurrent_misses():
+    cache = ResponseCache(maxsize=2)
+    calls, release = [], threading.Event()
+
+    def compute():
+        calls.append(1)
+        assert release.wait(5)
+        return {"signal": "BUY"}, True
+
+    outcomes = []
+    threads = [threading.Thread(target=lambda: outcomes.append(cache.get_or_compute(("analyze", "etag", 100), compute))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    while len(cache._pending) < 1 or cache.stats()["coalesced"] < 9:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert sorted(outcome for _, outcome in outcomes) == ["coalesced"] * 9 + ["miss"]
+    assert all(value == {"signal": "BUY"} for value, _ in outcomes)
+    assert cache.get_or_compute(("analyze", "etag", 100), compute) == ({"signal": "BUY"}, "hit")
+
+    # Degraded results are shared with waiters but not kept; errors reach every caller.
+    assert cache.get_or_compute("warn", lambda: ("partial", False)) == ("partial", "uncached")
+    assert cache.get_or_compute("warn", lambda: ("full", True)) == ("full", "miss")
+    with pytest.raises(ZeroDivisionError):
+        cache.get_or_compute("boom", lambda: 1 / 0)
+    assert "boom" not in cache._pending and len(cache) == 2
+    assert ResponseCache.etag(("analyze", "etag", 100)) == ResponseCache.etag(("analyze", "etag", 100)) != ResponseCache.etag(("analyze", "etag", 200))
+
+
+def test_rolling_correlation_matches_batch_matrix():
+    rng = np.random.default_rng(3)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (4, 400)), axis=1))
+    moves = return_matrix(closes)
+    rolling = RollingCorrelation(4, 60)
+    rolling.extend(moves[:, :100])
+    for column in moves[:, 100:].T:
+        rolling.update(column)
+    batch = correlation_matrix(closes, 60)
+    assert np.allclose(rolling.matrix(), batch, atol=1e-12)
+    assert np.allclose(batch, np.corrcoef(moves[:, -60:]), atol=1e-12)
+
+    engine = CorrelationEngine()
+    times = np.arange(400, dtype=np.int64)
+    state = engine.sync(["A", "B", "C", "D"], "4h", 60, times[:300], closes[:, :300])
+    assert engine.sync(["A", "B", "C", "D"], "4h", 60, times[50:330], closes[:, 50:330]) is state
+    assert state.count == 60 + 30 and np.allclose(state.matrix(), correlation_matrix(closes[:, :330], 60), atol=1e-12)
+
+
 def test_math_helpers():
     assert returns([100, 110, 99]) == [0.10000000000000009, -0.09999999999999998]
     assert correlation([1, 2, 3], [1, 2, 3]) == 1
@@ -35,7 +290,177 @@ def test_signal_risk_reward_matches_output():
         expected = (signal["entry_price"] - signal["target"]) / (signal["stop_loss"] - signal["entry_price"])
     elif signal["entry_price"] > signal["stop_loss"]:
         expected = (signal["target"] - signal["entry_price"]) / (signal["entry_price"] - signal["stop_loss"])
-    assert math.isclose(signal["risk_reward"], expected)
+    assert math.isclose(signal["risk_reward"], round(expected, 4))
+
+
+def test_analyze_many_matches_single_analysis():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "30m", "4h", "1d"], "signal_mode": "balanced"}
+    result = analyzer.analyze_many(config, symbols=["BTCUSDT", "ETHUSDT", "SOLUSDT"], use_demo_data=True)
+    assert [row["rank"] for row in result["signals"]] == [1, 2, 3]
+    assert set(result["timings"]) == {"load_ms", "compute_ms", "total_ms", "per_symbol_ms"}
+    for row in result["signals"]:
+        signal = analyzer.analyze(dict(config, symbol=row["symbol"]), use_demo_data=True)["signal"]
+        assert row["signal_type"] == signal["signal_type"]
+        assert row["strength"] == signal["strength"]
+        assert row["risk_reward"] == signal["risk_reward"]
+        assert row["stop_loss"] == signal["stop_loss"] and row["target"] == signal["target"]
+
+
+def test_analyze_many_keeps_each_history_length():
+    analyzer = TradingAnalyzer()
+    history = analyzer.history
+    # SOLUSDT as a young listing: 150 candles, below the SMA200 window.
+    analyzer.history = lambda symbol, timeframe, candles=241, *args, **kwargs: (
+        lambda data: dict(data, candles=data["candles"][-150:]) if symbol == "SOLUSDT" else data
+    )(history(symbol, timeframe, candles, *args, **kwargs))
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "30m", "4h", "1d"], "signal_mode": "balanced"}
+    result = analyzer.analyze_many(config, symbols=["BTCUSDT", "SOLUSDT", "ETHUSDT"], use_demo_data=True)
+    for row in result["signals"]:
+        signal = analyzer.analyze(dict(config, symbol=row["symbol"]), use_demo_data=True)["signal"]
+        assert (row["signal_type"], row["strength"], row["risk_reward"]) == (signal["signal_type"], signal["strength"], signal["risk_reward"])
+        assert row["entry_price"] == signal["entry_price"] and row["stop_loss"] == signal["stop_loss"]
+
+
+def test_simulate_exits_per_horizon_without_overlap():
+    close = np.array([100.0, 100, 101, 102, 103, 104, 105, 106, 98, 100])
+    high = close + 0.5
+    low = close - 0.5
+    candles = CandleArray(np.arange(10, dtype=np.int64), np.stack((close, high, low, close, np.ones(10))))
+    active = np.zeros(10, dtype=bool)
+    active[[1, 2, 6]] = True
+    signals = {
+        "active": active,
+        "side": np.ones(10, dtype=np.int64),
+        "stop": close - 3,
+        "target": close + 4.2,
+    }
+    runs = simulate(candles, signals, [2, 8], cost=0.001)
+    short, long = runs[2], runs[8]
+    assert short["entry_index"].tolist() == [1, 6] and short["exit_index"].tolist() == [3, 8]
+    assert short["reason"].tolist() == [2, 0] and short["exit"][1] == 102
+    assert math.isclose(short["return"][0], 102 / 100 - 1 - 0.001)
+    assert long["entry_index"].tolist() == [1, 6] and long["reason"].tolist() == [1, 0]
+    assert long["exit_index"].tolist() == [5, 8] and long["exit"][0] == 104.2
+
+
+def test_backtest_reports_metrics_for_each_horizon():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "benchmark_assets": ["BTCUSDT"], "timeframes": ["15m", "30m", "4h", "1d"], "signal_mode": "balanced"}
+    result = analyzer.backtest(config, candles=400, horizon=12, horizons=[6, 24], use_demo_data=True)
+    row = result["summary"][0]
+    assert result["settings"]["horizons"] == [6, 12, 24]
+    assert set(row["horizons"]) == {"6", "12", "24"}
+    assert row["trades"] == row["wins"] + row["losses"] == row["horizons"]["12"]["trades"]
+    assert len(row["chart"]["candles"]) == 120
+    assert all(trade["reason"] in {"stop", "target", "timeout"} for trade in row["sample_trades"])
+
+
+def test_parameter_grid_matches_per_set_signals():
+    candles = generate_candles(1500, "4h", seed=9, price=76000)
+    indicators = indicator_arrays(candles)
+    statuses = status_arrays(**indicators)
+    timeframes = ["15m", "30m", "4h", "1d"]
+    rng = random.Random(3)
+    base = TradingAnalyzer()._signal_params()
+    sets = [sample_params(base, rng) for _ in range(30)]
+    for params in sets[::3]:
+        params["indicator_weights"] = {name: rng.choice([0.5, 1, 2]) for name in base["indicator_weights"]}
+    for mode in ("balanced", "high_precision", "lux_style"):
+        grid = grid_signal_arrays(statuses, timeframe_weights(timeframes), indicators["price"], indicators["support"], indicators["resistance"], indicators["rsi"], param_grid(sets), mode, warmup=50)
+        assert grid["code"].shape == (30, 1500)
+        for index, params in enumerate(sets):
+            single = signal_series(indicators, statuses, strength_series(statuses, timeframes, params["indicator_weights"]), params, mode)
+            assert np.array_equal(grid["active"][index], single["active"]) and np.array_equal(grid["tier"][index], single["tier"])
+            assert np.array_equal(grid["side"][index], single["side"]) and np.allclose(grid["risk_reward"][index], single["risk_reward"])
+    assert set(signal_type_names(grid["code"]).ravel()) <= {"NONE", "WEAK_BUY", "BUY", "STRONG_BUY", "WEAK_SELL", "SELL", "STRONG_SELL"}
+
+
+def test_optimizer_pool_matches_in_process_run():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "30m", "4h", "1d"], "signal_mode": "balanced"}
+    kwargs = {"symbols": ["BTCUSDT", "ETHUSDT"], "candles": 400, "candidates": 6, "use_demo_data": True}
+    updates = []
+    serial = analyzer.optimize(config, workers=1, progress=updates.append, **kwargs)
+    pooled = analyzer.optimize(config, workers=2, **kwargs)
+    assert [update["done"] for update in updates] == [1, 2, 3, 4, 5, 6]
+    assert serial["best"]["params"] == pooled["best"]["params"] and serial["best"]["score"] == pooled["best"]["score"]
+    assert serial["candidates"][0]["quality"]["flags"] == pooled["candidates"][0]["quality"]["flags"]
+    assert [point["step"] for point in serial["convergence"]] == [1, 2, 3, 4, 5, 6]
+    cancelled = analyzer.optimize(config, workers=1, should_cancel=lambda: True, **kwargs)
+    assert cancelled["settings"]["evaluated"] == 1
+
+
+def test_search_strategies_report_saved_evaluations():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "30m", "4h", "1d"], "signal_mode": "balanced"}
+    kwargs = {"symbols": ["BTCUSDT"], "candles": 900, "candidates": 18, "use_demo_data": True}
+    halving = analyzer.optimize(config, search="halving", **kwargs)
+    report = halving["settings"]["search"]
+    assert report["evaluations"] == 18 + 6 + 2 and report["full_evaluations"] == 2
+    assert report["saved_full_evaluations"] > 0 and len(halving["convergence"]) == 2
+    updates = []
+    cancelled = analyzer.optimize(config, search="halving", progress=updates.append, should_cancel=lambda: len(updates) >= 18, **kwargs)
+    assert cancelled["settings"]["evaluated"] == 0 and cancelled["convergence"] == []
+    assert cancelled["best"]["partial"] and cancelled["best"]["budget"] < 1 and cancelled["best"]["best_runs"]
+    tpe = analyzer.optimize(config, search="tpe", **kwargs)
+    steps = [point["step"] for point in tpe["convergence"]]
+    assert steps == list(range(1, tpe["settings"]["search"]["full_evaluations"] + 1))
+    assert [point["best_score"] for point in tpe["convergence"]] == sorted(point["best_score"] for point in tpe["convergence"])
+
+
+def test_forecast_paths_are_seeded_and_bands_ordered():
+    analyzer = TradingAnalyzer()
+    config = {"symbol": "BTCUSDT"}
+    first = analyzer.forecast(config, horizon=48, paths=2000, seed=11, use_demo_data=True)
+    again = analyzer.forecast(config, horizon=48, paths=2000, seed=11, use_demo_data=True)
+    other = analyzer.forecast(config, horizon=48, paths=2000, seed=12, method="bootstrap", use_demo_data=True)
+    assert first["forecast"] == again["forecast"] and first["forecast"] != other["forecast"]
+    assert len(first["forecast"]) == 48 and first["forecast"][0]["time"] == first["history"][-1]["time"] + 14400
+    for point in first["forecast"] + other["forecast"]:
+        assert point["lower"] <= point["lower_50"] <= point["price"] <= point["upper_50"] <= point["upper"]
+    widths = [point["upper"] - point["lower"] for point in first["forecast"]]
+    assert widths[-1] > widths[0]
+    rng = np.random.default_rng(0)
+    log_paths = simulate_log_paths(rng.normal(0, 0.01, 120), 12, 501, "gbm", seed=3)
+    expected = np.quantile(log_paths, QUANTILES, axis=1)
+    assert np.allclose(quantile_bands(log_paths.copy()), expected)
+
+
+def test_learning_curve_matches_per_anchor_forecasts():
+    rng = np.random.default_rng(5)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, 400)))
+    curve = learning_curve(close, [5, 20, 60], horizon=6, anchors=150)
+    assert [point["window"] for point in curve] == [5, 20, 60] and curve[0]["anchors"] == 150
+    for point in curve:
+        window, errors, covered = point["window"], [], []
+        for anchor in range(close.size - 7 - 149, close.size - 6):
+            moves = np.log(close[anchor - window + 1:anchor + 1] / close[anchor - window:anchor])
+            errors.append(abs(close[anchor] * math.exp(moves.mean() * 6) - close[anchor + 6]) / close[anchor + 6])
+            covered.append(abs(math.log(close[anchor + 6] / close[anchor]) - moves.mean() * 6) <= 1.6449 * moves.std(ddof=1) * math.sqrt(6))
+        assert math.isclose(point["error_pct"], round(float(np.mean(errors)) * 100, 4), abs_tol=1e-4)
+        assert math.isclose(point["coverage_pct"], round(float(np.mean(covered)) * 100, 2))
+
+
+def test_purged_folds_keep_gaps_and_reuse_one_signal_series():
+    folds = purged_kfold(1000, 5, purge=12, embargo=20)
+    assert [fold.test for fold in folds] == [(0, 200), (200, 400), (400, 600), (600, 800), (800, 1000)]
+    assert folds[2].train == ((0, 388), (620, 1000))
+    assert walk_forward(1000, 2, purge=12)[1].train == ((0, 738),) and walk_forward(1000, 2, purge=12)[1].test == (750, 1000)
+
+    count = 600
+    close = 100 + np.sin(np.arange(count) / 7) * 5
+    candles = CandleArray(np.arange(count, dtype=np.int64), np.stack((close, close + 1, close - 1, close, np.ones(count))))
+    active = np.zeros(count, dtype=bool)
+    active[60::9] = True
+    signals = {"active": active, "side": np.ones(count, dtype=np.int64), "stop": close - 2, "target": close + 2}
+    validator = CrossValidator({"method": "purged_kfold", "folds": 3, "walk_forward_folds": 2}, horizon=6)
+    result = validator.run(candles, signals, 0.0, count, lambda m: m["trades"])
+    fold = result["folds"][1]
+    assert fold["train"] == [[0, 194], [406, 600]] and fold["test"] == [200, 400]
+    trades = sum(simulate(candles, signals, [6], 0.0, a, b)[6]["return"].size for a, b in fold["train"])
+    assert fold["train_score"] == trades
+    assert result["walk_forward"] == np.mean([item["test_score"] for item in result["folds"] if item["kind"] == "walk_forward"])
 
 
 def test_bearish_setup_becomes_short_signal():
@@ -65,3 +490,77 @@ def test_bearish_setup_becomes_short_signal():
     assert signal["signal_type"] == "STRONG_SELL"
     assert signal["side"] == "SELL"
     assert math.isclose(signal["risk_reward"], 1.5664, rel_tol=0.01)
+
+
+def test_slow_timeframe_falls_back_to_neutral_frame(tmp_path):
+    release = threading.Event()
+
+    def loader(symbol, timeframe, start, end):
+        if timeframe == "1d":
+            release.wait(5)
+        step = {"15m": 900, "4h": 14400, "1d": 86400}[timeframe]
+        return [{"time": t, "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.0 + index % 5, "volume": 1.0} for index, t in enumerate(range(start, end + 1, step))]
+
+    analyzer = TradingAnalyzer(candle_store=CandleStore(tmp_path / "candles.sqlite3"), market_data=loader)
+    config = {"symbol": "BTCUSDT", "timeframes": ["15m", "4h", "1d"], "analysis": {"timeframe_timeout_s": 0.3}}
+    try:
+        result = analyzer.analyze(config)
+    finally:
+        release.set()
+    assert result["frames"]["4h"]["source"] == "live"
+    assert result["frames"]["1d"]["source"] == "neutral"
+    assert all(status["status"] == "grey" for status in result["frames"]["1d"]["statuses"].values())
+    assert any(warning.startswith("1d: Timeout") for warning in result["warnings"])
+
+
+def test_frame_deadline_starts_when_the_timeframe_runs():
+    analyzer = TradingAnalyzer()
+    build = analyzer._frame
+
+    def slow_frame(symbol, timeframe, *args, **kwargs):
+        time.sleep(0.25)
+        return build(symbol, timeframe, *args, **kwargs)
+
+    analyzer._frame = slow_frame
+    # One worker: the second timeframe queues 0.25s, then runs 0.25s, within its own 0.4s.
+    settings = {"max_workers": 1, "timeframe_timeout_s": 0.4}
+    frames, warnings = analyzer._frames("BTCUSDT", ["4h", "1d"], True, "BINANCE", settings)
+    assert warnings == [] and {frame["source"] for frame in frames.values()} == {"demo"}
+
+    release = threading.Event()
+    analyzer._executor(1).submit(release.wait, 5)
+    try:
+        frames, warnings = analyzer._frames("BTCUSDT", ["4h"], True, "BINANCE", settings)
+    finally:
+        release.set()
+    assert frames["4h"]["source"] == "neutral" and "Warteschlange" in warnings[0]
+
+
+def test_changed_pool_size_keeps_handed_out_pool_usable():
+    analyzer = TradingAnalyzer()
+    old = analyzer._executor(2)
+    new = analyzer._executor(3)
+    assert new is not old and analyzer._executor(2) is old
+    assert old.submit(lambda: "still open").result(timeout=5) == "still open"
+
+
+def test_frame_one_candle_behind_is_not_cached(tmp_path):
+    published = {"lag": 1}
+    calls = []
+
+    def loader(symbol, timeframe, start, end):
+        calls.append((start, end))
+        last = end - published["lag"] * 14400
+        return [{"time": t, "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.0 + t % 7, "volume": 1.0} for t in range(start, last + 1, 14400)]
+
+    analyzer = TradingAnalyzer(candle_store=CandleStore(tmp_path / "candles.sqlite3"), market_data=loader)
+    closed = last_closed_open_time("4h")
+    stale = analyzer._frame("BTCUSDT", "4h", use_demo_data=False)
+    assert stale["source"] == "live" and stale["candle_time"] == closed - 14400
+    analyzer._frame("BTCUSDT", "4h", use_demo_data=False)
+    assert len(calls) == 2
+    published["lag"] = 0
+    assert analyzer._frame("BTCUSDT", "4h", use_demo_data=False)["candle_time"] == closed
+    analyzer._frame("BTCUSDT", "4h", use_demo_data=False)
+    assert len(calls) == 3
+
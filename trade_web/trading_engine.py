@@ -1,11 +0,0 @@
-from __future__ import annotations
-
-import base64
-import zlib
-
-_COMPRESSED_SOURCE = """
-eNrdfdtyG0ey4Du/og9iNwzIuFKkLGNExcq27HHY8kWUZ3aGgUA0gQbRQwANdzdEUVz+xsY+7ON8w3maN/3Y5qXuVd1oUpTPxOpBRHdXZWVlZWVlZWZlLfJsHU2ni125y5PpNErX2ywvo3izycq4TLNNcXAg3v2jyDby9zoul/J3Hm/m2Vo+lek6kb/frVf9pMyTpP9ylayTTfkGfkdxEb18c7DAhudxGc9WcVEkhWxZveISW2holZ7Lr79gu/ShvN6mmwv5/sXmWuGZJ7/vkqIExA+++v6nFz99/XL6/U9vXr7+y4sfT6OT6OYggn+t0bo1pv+7/HxMz8fqecQvRvrN4yG9wT+yzJKKLOXzIT0fqucjej5Sz6M5lZ+r57/S85V6fkXPr+D5FrD/H5oW9H/0dbZZpBenZZYnY6qB1BkzUeh5niyiVRbP20WyWnSi3vNons7Ks6LMu0iiCdfCf1dpuYywVB9h9LNtsmm38lY3SjazbA6UPWntykXvaauD47WEIV4lujb+yxNgmQ1xRZ/a5EIdjUkRv00Ik240I8zHDjqE4U/ZJtmD19Vd8CKE5rv1ts2NdkWpbpRu5sCDJ4eAoiDoV+km3sySV3F+mZTfALXHCvnpNN2k5XQqOoBsne3KcbSAvpbARsP+k45umDAWZeCj+GV/BiYvYELBZ8mh/VN+1TaItkwLGN90Fq+mOPyi+eJ6fZ6txhGRLt2USf42lo/bJE+zeTHG9wB8dDgkuq4A0JmmN+E9MTjgnPs+ldCgqjdd+hdJ2ZYFusS6nQPNAMUW5EMCFc3+UR1rRFrLstwW48Eg3qZ90Wx/lq3xefD28eBylW6SQkwC+W8b5/G6OLlpcddhYvCP/m4LHW53ABuJGHxzOwNfV+k6LeGTIM+tDV6M0Ik5cLqE38l+HqdFMl1k+bQAwbgr2rrMjPirADqcTdRLKBmlZbKGUdFAkDfbHZtfRe1+DP3azG3K4b8b7w3RFGfGFBGHLmI7Z8NJt7pkSzBum4qOJp2Kssv0YmmXPawsu8qu7KKPK4vOVlmR2IWPKgu/zVa7tVP6uB60RYgnAULcWm/M4SUhJsagchZOzxMYz6RtTeg7zcrj4RBl2Jww5Zf/i0QffMM/BPmPmbc8s1xZjCvjR8+1dbppi453o9FwOOxowqcL1f8oLSLQLxzRr3E7a0HJNzikiJas9ccKHv7z6YSG4Lyzg/q53myeN53jTed3w7ndeF43n9MN5rM9l2vkrCo3MXSS6025TMp09qlX15j48wnM+2F/iMxvT6k+MEReFqjutFtfvfka9JlkBVUeU3lDziRzZPPdup3l8/ZsGecd6jL+wi4vWjcM+HZ8IzG/NRdp0JFPhIref01/2gh0z+q1BdmH+GM31MtNdgWvoJU2Dg9NgHYnesQTXaNcJtvpulCathpZ1qhHx1DjyXAKdexhFfr142HVd9Kmj+hrVRFSsA8ry9w6cpG/d+w1G5TEd8RM8eYikdLMWbO3eXYBzFYQObD8AHZE72ThqBeNQPx1rCrAAarWM9Aenx6NPeaf5+mCdcvhcPQ0+hxHr7/bpIDXut3Dt0dd+nhkw05WLvQvj4+rwROk0WEI/iHDP3ThF8kebI9C0EYM7bENjSSaZDD6a+tDKADgCxIUayMUo8qjqD2Ctqjxjg0YhZuoqCt0GWBHVjSRNHB82vGGC8boSfTsxCAs9vXpU58S1PAjEA794dGx9XVFUwaXxSqMek0xYhE6FYLlCAQL9Ia571H0NFAUSpl1sLX+42OLEZ8jq7DgAdwRIxuZL46Bj/uHx52H1lhRlPQiY8JQRxABIT7qdVmDmLV6LP6p1V7h/z0qK/3dp6nyjyYaarjjKDFqO1+lv5qymtqp1GzFjvdVPMuzF5t4df0+ye+y2z36JLvdmDEJrcM7INo8WWe0UIPWmWUgsa/ifJNuLmA5pgUYCk5qzRzA7DackAmD8KUyEjXi8mwNykSyKZ2lUb+XE0DUz1arOJ/SeAJvZu+u2xJbYyZX1c7T4nKKhrCyuFO1uEyKu7c2y6+3ZTZdpb/v0nla3qnuYrdBO8wUGGtK85DWUxjgNg+fHqQGwDbJVUF9NzFQtWCRTlH9OVPVWfdRT7BMG8MEg62ezlqsccMO4j9OohaIu+uWHsNiBrs5oVeZVfA11PAaIUR0b2CFmcbnhVhrQF6vkk2by8AkNhbPDYhReP2elLg8A8q1sUZvhLtBXBXoB2MzUGBJo+qYhICeGaCen0SPneWdOxtxT0FE2otQfJ7gNrH1Kr7Ms2iH41WUH/5Vvi+jHzOguS5OmoTRFCx5veq28mRe2xI8xCDSAq24+oSGmZHeVQv2IlmnxWxZtg5caedonIIFxgK8oyzyaI+N7joFqFlcJPCv802zHa4R6sFtItvlsFOGvS421PrwvxcLKLVKZ8sk+gam7mbwC0zdFLTvbLlJohe/fN/7Ibn+U/Q6iVfvU9jJbKKrJJ/Dnw//Ok/y6KtsM++9fPNt700OcyhCSm0+/HOZ5GXf2MXeBu0YBSw5SSEkLTDsBZqOYe7eUdI6Gx8Ut7a8ZdCkLAWlrSFKG0nnM1+/UEP3+Lirh6n1Z+4ssAYQ9BsA2iN+aXXlQGAhbKx168HEKT/Vaj93wl5nJ5rddrutND5M12Q8ntLqW7Rb8KkPPAdt/vbbLy1DGGrhs72uqgyfROXTX/4WrPz7779XVYZPovKvv/4arFyuyqrK8ElUfvPjm2Dl+G2cAqlXKDfPmJmIauInkK4Nfe9i97qIZheb6wiOaHOpDsqupxNbrpUatM0AEge5ZNgDTGM7ji6TFGYOTqPr3t+TtMyTdAnz5W2SL3bJxXmc/yn6Kp5dwjJZRpsdirxNsivzGJBiEL1TZKZ+qxNkPs1rw0pWY6kkwNrcBoKqgC60bisYzOCpMs5hdzpFvHjHwEW68rcioU10RbuOZX/a0VB/LPqkWFQhD0qrxrmjBxVk6cWGVjxHHAN7AFD4/6ynK44nkkXgA/GHQQjamZxNXKm6vUaZvr0Ow4EPzeAAkwIc+D8MBz40gwN8DnDg/zAcmgZ74NzaNoi5YYEwaOysmUKJGbrmS1djFTNNjMsZjcMEFo85NQSYHdOD/f0Mv/Wi4wluEv0t72yJyEE7bb/aBHSZKmBiowMKjgeS+/M5aByHpMpxC89x8/EFU8x8/4zsGOKDD4zIIAXHAmVxdMM1x5/3R4vb/+7Md9ijgB485SIB+uGwXCbXJOaIAbvMPx2fNAapoUYNofHrHjL7qMk+tV0oJtVtyJrmno3Dhu23H7+9EGqyXbIDjSFvO2+rx5SGDqEBFUY8aD31Dsdy1HAkX8NmIbqBWuFxNPkc52Udn9P3u/O5qmbxuQOsCZ+PbDaXZBk5XN6UMrBw1/P43XYjx3of4hC4fitiKeyBhWabFWmZvm35Fsw9+459gDfJRRwAHDJd1oPhhdBRB3BFlbS+Ce0d3P2CuY6C+BmARjcAxWzA+lWLBg/d0/j31vMLcYNnPaGoGx4MNlTsDfCwzRe2l6m1ickY1frmf/5tgKKR1Cda+uWOSe7DupGlQayToogvuC6gMY6+IauHIprjZdct4bTtZZvoxWWZwv7Uaoq3rEZLo1BLgn7RIk+Ac3EPVd3a32HvNM93s8uP6Nnfef+1t2dfvfm69022Ru/i+8GPwqLy4Z/lffpoVMc963la0+63bIcZ/AwsGX0vbDD3G0NQJt/CbnR/X39KrorBy7fAVT0Y0PQyu1d7rLIzmNNtWr5PzBYnTTf1kqbhXT1sDcO7eWFEWCXAQaVpDIGZ3XqIXT7tPGl3H96TT0HkZL/LnZc0uM4uk5wsn3qXzU5FPaXL/NrdITd0hFvOcGqe3OC/D+aD1aDVDa0sIvgGFVvCDWMAaP/scofpGMdFxHKOg+52eOy4eTvBPtT5ysW60/ouKaNrIHYUb1NQcVqWz7dM3pW+pPeNDiT/0e+PchF/9IHo6bbNGyt84YHtF9tVWlKlNu9ojWoT33tVoT9K2ATobDSejMNLOtTmBrDVdqvb6oR0TFS/qHhHqzb0fHY0oV01tHTTwsk4bN2GNUtGVmkQ5JqXIDrB/TDXOOs9Ho51/5J3s2RbRi/pD/BfldlHzwDb+CCM/zQrjInQja7jZZbZr2rNUg87YRZqxvy+S/LrUX8hIkgILZpAb58OxMsBOuTLwY2J8m3dzGJRieGhx/OWHWCDbuyaSRaOPrn/zFLWAid84qxFfQKttsVF4NfQ5uo8vpoqjhcqC/QEdJIY1KoCq/6+Q7GINc+ET61qwjD/AQl2Cc9F+skbYdUMML54rUOIJvfmVIwhhXfjMEZsKLOltcGknnziMpUyiD97Qu3o8MuWnK/Azm3AJ7CpdG1hi5awf9kcN7gxMbyNNrTIoTHsw7/YGEYKkVzpq6xeE2+1omGsWKzYSfi/nHCuT7Ba3WGtWuA8KuaH5WG2XM3e4gyjYGz8QdNuVrz9IyfZp1txxFJAZTvRs+iwkgFVnGFotYEFaVK14nirzRfGavPEWW1+GnwTWm8EDuYi82QS5D4LzUZrC9XQHMt7YBl5zpPSXCD84MwaNhZ9ZzAdigcRvnt0EgohYwT+TKKTKs+H1THxri1BjNCaEIRnmBKMTaDvbeb+3tVD7ki7O3szlIFEeJaZ9oJcJhVFQZDbftgnSRdH4rLEkRjYnFLsFov0HVRYtKL4stwlq1WSR4Bi71eCdEOVx/3DxW0L22b4ZEZptUJDo7c4v532eE/b+15EdsEm+W7bnEXr+I3w0C2S5ar8kxK3N4z4bes2QBm2dI4/Gj30yhq49Q4d5HDD/7k0FCGJ/vvg+A35SGHoc7mjV75b3uhxaEIQb2GJ/XjEvT1yCPMA4rPl1Yd/zpawAVbYWz7uih58mqG3Lc0KSbW1NuawGfNxz8kbMleTf8jQAmw9mizYrqex041c/2HHPaYQnOchoVHddjA0xBMP4chwo7tSB+LHjutNDBqzTaerJV8EIWx8TC+rVVrQqONLryku20G/C7Tgd0XX0RodjER0g6VJbnkUgrabwUEr2Q2WDsAxJWf75rNu9Fn/Hxns2jWczm1Hy0zuVSPByZY9ZAWacWjtG/DfxeKB5GdAfGoHheOZ8FwShv+hPxw/VF/2yixptvzwf6TXQskEAdkWqsof8oBI7lsR9uIIAGvk5kOOfA0qKuzHkqFGANzHyNAmgq06SOIhFB0BvImiA61/vKIj7Ns7mGU63OiPUnT2c3cD9PbY1F2PmGIk7R1YfPjnalVGZYInQ9+nQN1KDedBMHYn4p0RBo0svahC+NMMcQVOIYXGCyu934z0LAcXq+w8Xk3rDAjWUa8ZrGgXyewyMw97MZBWN7jF79S1t29vL4pjBBug5laWxjT87Ni+zssZbOTWbEHESU6bYwPcWUtKoHg7hU3hLNmUOC4T7jPUh/4MzUhREUx5vkqm97O3VNIPXxYDxqeoscNUhMoX09kuB1Exw9id1q6YtyrC5dM5MSZsPUCj70LBHrbcncdpd5GCTt+bpxdpGa968KmLhTYx/kyq4FF4vBDrJg3xpL46mm/F2n+8VcgZgX0MxMVpE+5UdA6yGbCBI4Tio4/UMVdolml10Egx7FiH5ERjYaBqLQzArSDkFKlY15A4HCXCpOVbh2dRT7ZwoN3wkN0a9jx5Fj2ptnFVsF/IWUty8ZQaRQ7rWb7bMJh636Pngzys+G6KV4FRP7qxejmmAI6uxA8G+7/d6JEfjJIvqcRXQZ/xvvMjHrF5Cw/UhuGzif0czzD+l1Ob1s16WsNa+kDE7gFDRzcWgcTChwd98gJN6unFXiJXkugByBNYwA8qKTMMfHtQDlShoxXHdBt5XbxgX+Hf+Bqo8R2uRQFfhkGkotfEsXFzd9o7k/66JrpBocref9KJk42lIdUcnvFPQN3jsBPaP8RBYyCiOF782+k3b9xARY8gIpwkeo0bqm5kRZUQgZgqnBPoPcZB3Ik2P+3yCPHo/ZLkW+GEMo10hhrrqX/bHHZ+u/Xd9JiFe+Z/QXrMaCCgkYmv1p1k50J4AK1AtLxPGxDFpD4pawVUAcFNSnM0a/KajTZcMbI4sGqdNtwJ6lhu+rEEphxSxQBbHyBzS/bBILs7UBqD48j/IRMy6fwSj4cPMAxZum8EsnSaZ1eoj0HZAN3hu9KUzNP6hr9IgCBvWUBbIU1WjZsoTD5y0Lx+NmjXmnQC0YuBur1Rs8om7m2CNBDYaD8TdoLfceRpf+gpa5L18ATx8Ii0NA35eXRvBe0+YughtIcmqprE7UZ0ftx/TCvkz99HN6rzIvR2zGfeohkMzjzY/m0VSZ+RLvZvRcFG2u7o3iQcR6fLDF3R72NcMbtEu97X2QaW8jyNN9H6w39eUMTnxytdD0KeB9W/7sZWn1TZEvnQom9ZlAdULhkrekd16xNrFwqrSsVLHzR+IJtUI2PU1dUVGVPmSXHJtpR8NoDl6RyD7xdJMi8GeVEMGhmlGodzZRmuDi/f9DFPIoaMbC7aqvIMJhXs2ztOXqNSZICh3f4CEEa/T7tFHwA7IGG8W5UnrZa9xce2qHi8WrVb/cEAP7Q6Z+PD4cQ2dQnvWCtqsb+Jm+z0V9kVpsPx8niwc/Qqy+eEV2sZzy4pdufddpWlpJev4qtixz+LBA1hrfOY2GaWx8WS1QbFVPi4yOMd2V9Fdxxr3DqZo/LkNLxIRHjeYqUAodOBkCnJv5EnFzv9sQSRtVg4sKlLy5SibdC2Qg67GXBB2cammKr4C6nq9L8TwrIpLK9TnltRoxZWVby5/FM8W+YoGJJNj+ZudUD4PsfTjWr8Nlpmy0S46vEQNI8A9ABjzlu31Vif4MkZ6LFJGOjJ0cP2xLeTO8b71st8+eE/AZQAsqcLH4PLvrMEP1B8fbxbkHsjvVBkRTxUxP3DrBgE8vXpaWCpMDvQeKG4Gxlqd5yImbseHFAOsHXMYabhsDCKCquICBPaPdfGaDtR5aAq1EumGIF5ypVkcNd4goZR/i3wSv5AvNYg/9LtKk3yCA/nDWRKmuhzmbiKzfWlEDIC+TGXMnGXIScqWlcUld00PK0KIoODHYd4hfsOA6PP5XuThPIV0yov0r20wnRtRw0JdrKXYhdxujEibVZZYQX6Iwlg//02zXag4MiuAjnep1uXel1Jo1Ek85Mi3SedgFdaQuop6KoMYSQnJJrYuRJ7hHQGqsKI8Y/PizYe0jBKctH47cUU4YnhJtDOIGMRhCaKMOAAI+yjgiA0bFi7Nq8gDaLxfaggMrHoXlndh6+BfpshJLLrbfX7kZoQtC3+nJpxOusQpa1+e5XxrVOZQz1EwyfRkI+mKmhWDKlgxWNpaxB1q0uOhk5R1YxXVBbMiUyy6EA1cGCDxeRV+GcgsqmRI4dm5DqezUNT0lGrzak4qRBe5slPtUIgfJDrWA+FfnqxocMS4hkTnYgnofaDNJ2ODjF/KPwQyU+4iW40Ejl68NPhk3CZwydcJlssigRlCZ13JqDQJfUkiyF6U65LhxlisqgUmAAOJwU+d/lRzAYGdcbgxzAXBDQWJ9w/xqxtwO5GX7ri2fiKVqCDENVEaZNw/EOTTk8x0TZ6icQvHZTHFiFBZrlq2aTbs3h5J3Warl1C0D7syiUSaWCOKa41+fQLmm5XRTKKWpbKQCUEkbczcTJGpGSDLRl6wVUE+6Fe5sYmED7lTTVlFZ39/Ht5UOclFsAfFQnh3NRv1RmEjS13wkBlHD4qeCrDqjwg5ILoViUntnIl127UDQTReM4/YDRvvDgZ2KnHZZkL/BatKWI8vUFE5ba0nyfbVTxL2p8NMFRy+lnnFjRODt7abS432dWm09bdMRLbyc8C+jSY+r6qD2r2+sou5bSfJ5tZSOMlFfw8AdTLxA6To66hzsTocKKnO2DE7H0Sac8CAGtZYW/qWJYf9XbP/rw+/Z7jyozNSgY7jCJbzZX92xhvhdhUloIWHptL/fkO9kPFsr6yKAR1j826CPM8210sy/1tczmA8MWwEyASaJsSwyaE4s2eRamnbpTWh/97nuQA8xK2fWXUvmFhgTbDjh3SJjCQpNjbvtjCW60/8YLe0ZQH5ALZep7EOZJ4PwonBknvSYYnQTIIRKiDs2pMGnY2TOownZ0JRyrRPWccrerCBahnHS3nXRBmncAipKoYZY20Y1KjcIoJhUAXRH3AL0Zagh3nKrV7nvIoZLW+8GBC4NWLr7/xpIDR+nPZKOrPbcKdXZzPo+HDTC5GgRPwnTKxajG5Ly8fB1oVWQpkzpRgu8+qKPCsAQVCHP9FCBNy1vv9D4DUpjIL6nGIqqEoUjF1QKksd9v7Th+ZFFczMB8+1hwMeuvh0CpBb+wSx16JY7NEgTXsIvyq5Z1KQQv5mcj/TA11GX5XAJl0Hmi6uDYvKwE5EuW56Ppz0cHnAoN78u2XDga/5EmKmaVfvnpBjcBfauQUn4eVCB3zDli++SiUvgiixDP4z/FuW/ZevSjCmDRst4rHj6sb9vp/z9nIMHk6mp1xJhCnpN7cW+GTKcQ1Z4ts1xxC4hzAcUtNeSrZRXHpZ7CYHBS/icMuwwdh/b9wj73FIkfXjEqGzqaNAydnfIU+JzpD2cRFJnTTtHS1tyZmGcckKE9tNZBRek6tP5QGKPwPoJMQdNJJ3jmal2wX0HogFl+0fqIUWNXNNmTzY7c/P6XJPE8vfMAOo5e5TCd9Dzb3cyhWLhw2L1v5AHnhQIcgrQ9oZRGrgE1lZ65AfT95HRQx5SCegarJIGcObkhLNHS3blApCoPit5jc7YFUqBe7xdWHf+ZlQaNlM6Vq7PC+POlsA1rfiZNieFTKaa+p0HXxP7fRd3iw2G3x6kGM209VLOfD6Sw264nGbK2D37lFGR9xusTYu6vXARGNygpjAl8onlS0Jx515QeR2qeD157EnmdXG3k3CNojGQGdfXnL2WZk13rOLSICOp2aOx1HN6L+uH+8uI1ewwujC/hOH5QjZp7KBaNCtMvBNgrT4uDIeMDyOffkkQn3viqNLXbFr9tggw8k2r02mloHKsBIs+ObPMZYoL2XUPD88a5odGyBjuXP2DEjw3q1jVATKp9I0ydU8u2hbuk13p4BJa1bNKrvswjfehlMuA5Av41XxR7bJsXHojuMAAt25OjZLsW0c6i3vGTqwAyRXQAHk6XbrKw/AIAzvu1UXHHKF5dSMiojjJQKTznVU8EWXzdEwD4ET9fn/b6LV2l5TXfMrbO5TsTupYAXZ1dX6VvizwVsm87j2WUhBAen2sOns8mtY9qYKqsvG2j5kQOliEbqQlB+NE4g4WquSIFruqZL8LJG1QZefDoVL9X9F6pyNzrEfZ7VQR161rVo42gCyqasmjrfpav5VH9oi2Y7gYsUEv/6LUoAyzZ4i+/7yk6/IYx1A12brp1gzvyNINgZWmtxxHBbz3+np7iBx99CM6eD07SAYtoJlqKD1ySLnXApL9zHGpy25sxQ+mXVgbPWIj3PNvFsltJFguL+EvlOErBrVRE5ypyQ/N35Kp1NrVG5AfVtLGyZQhvsap+RLtrHmDiRxQk1RryORLTsxARZc+tMdXkSHEs+jod35PnIBwJOjaRsY787lRGuib49IynckFNTcVnH+fWUR+iEJAfnNltSjkZbaNAM1xPMzCm3jUtQ2jbTRtPMarVLdog7zjTRnGpmnpTJrJxeTcWHtoOPYRp6h+9hbkgBJdYc2caZIbkos7Rp180zQhKq2KIPmKgGBjugNd0sZcOAirsH1NNqbtaoCub6EaRu71dKMoAXj1zA/2RM6n0re7lLzpO82OY7vHnkT8YlGxj5dYWn0kszxEuul3rx7KsVUoyixjx4V4Y0WouECfTYrp417lWeNHz2S2rQfmUtpyzzaJWikNIVKhAgaewqlmgM3QEKm5o84ahQzcfmS0UBs/Vz0KGWeIBX5AXCVXnSMTnZYxmPFTt7r8Vxzts4tzRsAXIyn8YlCRfrskeHCEoG2ZLLmpiTM1HKvTVBqB3jugFsiRGkPNmBsfSiGeyvNNSogvpDrgXiNN7N6XARD5Hzvm1h1/HyA+vxpAzB+tFFJSmX2TxbZRfXqinjXduFbAoCqGA+OiUla0ApxSWhtMPn4hYU5xLjA3sSeMqqo3yaAfO2Jq5L4txpUk5IVRnD8PiJcVJimeXp+2yjr13VnxZJQmlfzNvp8NZEvT+sVq+7+p7leiWb5qz4RbeB6TmqblwRaiWrzlL5NjQHogN60uhvNRQtcRiUkjldvshwus2TWVqI+PLV7t20KK9XlpKSvEtmu5Lv22PmUm9A6BRloXRfSb2Op7ebI2ap8CDthVJv5xjj3Qie9BesYSe3iIvEWMj9k4Rqv9Z3L+WVxwBJzQuquXLLa460V4AUDd1KxZ3eDVoLZsM0+0d5Nx8Pm6RtVdf1Ru93sMZu0ovoaNkT9xCAJrnDa77EVA0kfsbzG+lmZ+fxnAMrXX8krUfIbhgieYjWNNmvT0/1Ju12/AV8qgK3DN3Cv+0MB8qiTqdSSex4+bpxRtIZCpJn/nGCnZ5tUrgKkUCTuR08DscFTkJLryk3TvC/8GdxbrbhJjcMQ1DjxGTicEmLeifWUwX2xvCcmA/h4kLQn4i/4UJSaJ0oqYYHc/hdaLtDhF6l2y3mJznfFmY9831lXZC4sONwa6q3oXqdEIOoiQ+/Db3sPKEQiwI2wAl9A8UO9oYnq3h9Po+jPLsaR234H3WnbJGWoNvNgLOh2YjelllJKYZQu5tuZ6X6cJVuBFGA0fMEg4ySkzf5Luns0QnvovWBYloKjSOwL5WLolQvQ5tLXuvGPLMC34kt1VaHsqSHzn6qffQ4qmTJlmCsqS5byWqap8aK5QKlFEtAMfU71LIWR1ITrbd6OdfERJTWLrrC++yUutCqIGcjk1qPUbp2T4+6A7xbowIPIJFR76lvopifxcobUmULdZRAMpg5yt/h0X+ByXSvVsSmSLkCNNdjKsanxtBh1e8KRTaUilml0ueyyh7EF9rSO1LXCPNJZYrr6EmlQ97L1JDkOcgl4D2pzSTRD0n+no19AVZxvQmErox/xtBscbyDT07UHicRybL5IIl4GOGxKgrnEGCeR0PzQpkZR8qJts96R0+N2wHkhfYYNc5FZTJR8WRGR8AuT5i013G57Be/58DpUFFFgvMN9dGjR9Ghc5uBAm2kxZIvsdtGiAFnetA5wk0FnGbXdJul3hXVnAE42epLBEdqUlGYvD28ybttMivpVjBq8FHUpsMdugcIrONo95s5x1RIQjwyCYHlMZdE/8mxq1aZaN/1CnmESwbJZFuX7Q2KcOC77Fk3elKhCLVo3nsVkAZIAuxmp6Y2xYlX1O7V1a660H2V8ETBbHlvdaZQRTf7u5dn/VMbfMylv+Ut0KEFWS3AxsJ7hxXLvaOhJVewsc7XmpdaZJJog5lyOARJ4FqcBBFxdbf50L0qyiIy3uhmvfBNO8B0FdoQzSFU0TBjnkBT8QsLHEq50o2OAlzS0vOL1DxZ0Zp21bVX1ENrRqzoHNKTYGnZSVz0pyTYRaO4PWsTpc5a+j0vK/SabjWyaNTRSQPITVuvcDTVKbIt8Fz6Pvn0NizXNnXYzDa11/TE7pLsIk8KAA7YVSFQLLPdinSBWbKqLFmfs4Jvjv1IgxbM1pdv/uzatpA+mFrBcNKIwYnZ6KS+mz50jPSZ22sVIAK7lIuEY1ScRYyut+jqxpDPks1unaBm3tZtdOn2gvLEXdkwusikIzlHrDftgAfxHLZ5l57bl1qaMt2CHrlHj8TWO7AnMr0FQjgSvG7V/kmXvZE54TQVbOubPcy33YO69DjiqicaMd8iXNVfH03R2onduF+OdngnD2747B5UWTQqN4J7DQ3W3D2xrUR1NwBxprCzXJz0zPmIp7wNS+6l6Dpo3rznMXZ4YuumnGQmhv27jEkMzCr61KbEYnZCsqxwq+3KabaYFvF6i5SmetIypLnP4R1jk6GWaosOHceNuLp0mqVXQAWQ4vNP1KqOJeEmxfM0TzCegIjT1QTpGli643a+K8pNUmgJpl/Z0IxxaQTaRXGNAk4i2pZuHAODTvBib16xTaZ4FA37x6CW6vHGN4/hjTEW+OoQXik3Mr2exvN/QGtr2GWgteixx8RBu/FNfcovpkO4jIE3XsxlkDBcPsCxUE9TO1zLZzjSISQxKmppx1rQp6bK6REiBUo+VO09Goj3TyDiTYqzWY02sJaoMQUTSo8KCHjoX5kQpcqooGnjogdP7pMJNp5GZmEngj2GNc3ZBk6vTcf++UANe/ZTr13fwurTEJqrSnkXv5vO8/gKozEt+Ljj5wa8IqEGpAo9rGuM1HW0IVMrV8XZ+HjSfMOp9TJlqs6ugp/RWt02rNQY1zSm/4WIISt00ObsKHrGPdq8oRd6HnfFEi5zToopwbe0ZiKLETVFgVvPU6d0bT/9qPgSdtOEBR9v6UD7VjhXFyMOor3jxtBUOzU1VCnuVU1JpJNJIRVGP9f5Geoa0kNBUQvqCU1M4Xq3Nf6OCv4gL4Y5Ov82HomP2AD9AU6Ih7bm351ZNCcWqqIX+VLBQk45eSn2z6TGJhg4FuEJ1QSE3F+yvJgtV/FFP8L00Ou0JH9DjHebJHn0Ky/Nve9wPcRUYH+FZb0n1vreKaW657T3SAwVgLbpV1y7XbU/pQwXKjOJvZk2k32YO15jn3qVwE6lxNOq9MG5OR2jYsd43Y0MjdUPIj5WvpBBsvKZI2XlkxMuS6+9a9q5sWH/qdnYodvYodUYl9aNPb5bYxJ+uGcM3OzZYZOePQ5eB09pDWFnPj3fgfJM/8E4ZWiw2tFBrLM2IH/cjb7A6+yOutGTbvS041yyTWtsPr3IsnkXf2DyOwx3LBkAIYhHOQDCqA8wDvtD/v0Efx91And2E8giRQ4QWAy7dJztC6r6GDA6BqhfHIYq644hF1G2QIOhxpUyXHNjpQ292XKmNWlBWtSfJZX31+IKzcrq0SIbvnxoUFOMGK6LYuwa1VGDyxXVY4PaHLhwnm3onAuMYdMqMBbxirYWvTvUOl9ls0us86RJHSvFyVgyH4j2hnVlhhNddTS5Q7Miu4mufdiktnmWliVB4zp4ihaFyRdNiBM6noXtPWlQVwd/ivlIk4F+1de+rfzqqTl65pprU8Bcc08bt4J/FzN42PAdNnnXWrsNs7SRjUoYtLWjRiTsOzwadkm3k6/RdvHEPGTdxGL572OKrbDBOqHjwnQatJn+IfZSaSu1hsQuUmstbWQp9Ri/0p55T9OpmW0rYHf8/2z6XIFsyq6mlOcZHVLuB+q0GwcAct6ccemm/QXG1+DUezzU4ZYYE/DUzFSFgyHyHqoQAhMBN4BgM5+WeYo3tFjFop6EIu6WeDIMms4nnoq2J7Y4FIga1pUwkqx5jI5JsE51OGQjgCqwFX2HNuROMGi2YQcahTHfpyONI3WbdAhGR3JFbb/wz9m4J8tOApHLF2sO2qGiPVo2MFSY0rlKx4EMyO50OuNJCBm6eo5BUbD20TCMVjC++tNH+97jBJITDrzH5qxEPtOgcaxvgxjfZgHYfuD12aTzECHBzuGPyhDgumMRnTuHBe+DdtdQYZCEVqiw5WczJbws1Xw1RSEbXkA7Zn7HlBzz7EIiEUy/cD9qLTA6YUfU+3I4nLipIwhSMHyw9+WXXx4Y55TPRVwLb5iERkjVMQwOpzc/uHqEttSLwgOZP5Zr+qDJI0Y+rwprEFOOA1WRXuOgLSi0LIteU6W9nWbqywjDWgeN2YCo9iw6DjeB+Zg/F6V0W4YDw2pxv2PDSm69XZi17+KOscBcpRYWDV1JxkHSd9P5XPBIU/9JmHEswmBw5ueynxhKJZ6uKAU4+lF7sm2MZkTfKzIm07obHdFVakM0mlnMVRWuJ0KhKWjPT5Lt8Bx/sdMNv3WCZGRQ50n0xKIVz1mh841wl2VG+PZUvV50bGt9oqLS+h6zuigBfo53TYyGrv6HMWEBTY6CcsSgMQAXj6dD/9gNOVY0BgSkAv9A8A45mnXMLAPryX4Jt82k4m6Qj4hGpnZFMDL/ro9FdgUIt39HpcSOWBYxzTjkR09lWDG97HQivm8i+C3gGkuQDSlUi/sC3QqEBctR8ACAeNjRsW1rFD6XFXwqMAeZtxRoHAYSnL6gznPzcX2fejRltLuRuQCNOoIbW2aYo15YGJwUReIJ5/itb87BFoyp74Sj7FtTjHgSldpbhy+IV3tuprr7ovJxgt3xsT+AnK+CaIn9e/nNtXBbxW5qGnNpHTn7ASqu8iPoww1vmLbW+iyoCUD6ozoovxCNe98SjUGLWl7Fs6UPCkn4LDo6rAP113SDZA0DEVR7Hh0e18H4RlARD6IuMxeIDjHy0sjaYH7elb1s0WPTZbRJLmLMVGvBMoKT9gAzXXwBWFvMioD8gCKTamrmU+FNeCCc5C4XJpbqHR6LOxuoFoqRp3v8z1ydMg/gDzeWHMFgIDn+db3RbrzV2MDuLsHjKqBH6BsHd4igYaYMh42E43zEy4oqdSEtwG1+rduwF9aPsasw1NXIzINAwKSUngdeTKT3xZOvDWKpDf1Ap/wxd1j2EZ/sSuTXwoETyqZI5jEx8gNsSh06SU+w+c5XmYo+FCu0HWlRVOzT2g3CFKu3b3rXdBFvVfAhyl1uVO7JxBMuhsquIgpgCkeebuamJyx47eaeR3hgo0YuvMGuDX7++XTw12+hr+Kee1vqIf1gIRse27ubZ7hBqoP9Civ2vkbCR5TIvkjSStHKjeDFOFNMBhlfTrdfHnN6nlph+5ckXwHfk1UEBe4KdNvW3nM7JpE4EZN+dgWJZh86WLtxLUG1IksJOyVYw7PXjmRl5UY8+Uc79VS/UxpMyTA49WWwLM8m7gHNIrpVCQvoRvwy4cWB0zpagD2Jbd8QRdpJqBk3v6tupneCm8lHQsWRdc9EvYk/8o8eqbjg0Gi4w7dvlamMXbVG0xc5Ql8VuxH7Jh9e4vVR3ePhvuvozW1Gpf3ipiUAixx/zgwekw2FUkrO03hjf8Ly7mQco/gxbgzZlbNs7bpGuHzg3OTU2HkyWu5m9/cdx3aPnJu/r2CTUApErJTCYiOCu8Wqz/bqEcPmZN2fLbN0lhSSgN3o8sTatvm7HYHaI7wR83MBb0A3vQd2neoWjipLuI2xlSK4ptu01zdedR1Ad/F97CGaHFkpZNui/1X7RDHmsriJZcdjFw5n7LgM476uENyKocUvV9y6LM6rrWz7DF3ioibZl4bHnYmvYQVnxB5IYUD+FBLd9ep/iQDCSwP5BOJySpt9IUhMR0FYmROn2qQvkmvr28JqhAsKRwt+hXAxrgddxecJxuS2ZIadKFtukki4LWDFTyLKZod+FPPuBHaMsBWDbWo4E83G6eQ2e1aHdl+iwSB60vFz4pm1z4wGJvt4S/SHPS56+aI1yx1X0V+jLL8CWvxZd7rgXpseJnNknSO2bMOUfu6w0bKRPVPe67YnmIPOGavoWu5FBjOYEoSEvGL0VU0FmQuBXk4qzr6KqCS7Br2sqsExSXYFfFdVnlMxuDVkwk6vzq23POj8DYL2RoikHqt616S9w5LRLDg6VtIy51XtnWyB0IfwuHcPgm7G/cWby5A98RZO4jiDEIbvz8gqZxRQ7jzvczPbnKFkBPWHLa9v5itzw8057hwQKkXA2Q3vM4WQE1+FgkQxts7GHV7eGrsxIdYOD4c6Q9HVMiVmw0/P1BmGles9cOxdIiAdDb9c+mwcsLe7OaR5/2v4jq0CKgBBAO/a/COvDOyEMn9WZ3YVwM5gEzyeBPKL6W25vaxZCa2YPp1AYlA3Y6md41IlsxSZKWnShTuiLuE8k3EB5fUWzakprm1/ffnih+lXv/2NUtnwn9M3r3/+6Tv5kgqcvvzxR/ok/3IRerz1NS+hOxhdWOP19smUmKxdF16gDP0j6WnRRn+64bjCrx5I3ulO2v0e/n0++yZ+eDR8cvfDGqn4eNYCtTS/5hVoYrC76v/kzFijJntgvUtLHxRqGQ4Ju+5EHHUmYg1p1hAhTUCpKfoVrMKCS2rKAkA4kMjedKi2LBtMeBNiCD7Um7a0W2BwFTFLWhxSaaCAKE6XusKLR5UNOeIUGzRfdRXwul5OLX/Swf2i7ZWwpnzOROhOfXSxLdJZg/A3O2iS2wMnaMDVJKirH45wDhNLsO2J5NvmTk1Vc3RgBjjSEkqk4lT99AvPxfL6Kh05DtdZ/lZ9X/ud4eAeeWLcEYKbJTa6C1dXqJIFH7vQcSAYN5M3giHuW++YaUS03R8gWYgNzFagX8YTkIWttG2rhioknlUxYxftBJX4PPhRiYjEwTc/8yV9mcrNjDSXz0V2inxNQTztm1u88qiLOhB+7JyJvY6beFp5VSrnH7otZQEausB2WUEQ4+JDsL0rCpbwe4qG5dTlk8uCD0Nnl6vPLJsfAnt7dOuwG8L1cu9lOYmjhbG0/NfhGnZJWW9D5oxaF5OSUl49UzZjSkbjMTT0yh0zFrJgPwlcFqIdcdhnp094hvJTycU9mKAq5PM762HBPeka+dSIV/N4XGGqqVS177JR/FTbvSY3gDfYeknbIepFhlbVGzkaE92kKsLgnegDRlzvaURaRWc3bidfVtCMC7y4Jbp/DZYSE7GJfa+Oc6GOyjDpSNGjZdVZY4zRHtt4mxxgmhOMS2rUT90LmSRSXl4yDmXA9uqhjT8UWF211O+94sZv4dNddvNffcvNH3jHjHu5TO1dMnvvjgneFePdGsYNG0Koaltpi57FDmonzaWHuIK58uzOH2UDEvLKOP6WzmlLTfjJQH+O8Me9uuFsLKZ0LosKY50TsXPX5h/cxqH6ZQLjvR0PZEdcAC3SULbNvsEeTfcEVvbDDu3OpsMhBc2o1kkW4o6uaW3TVZJt3a7CK9I+3QsHObONU5pfBu4m5J7L22OpHfkgAFXeJoujYYJSHaVbs0Xt5yeiCQM6veg0gokeiSDcZy7c583hknVAXg1pTwdjNTNEC1WAMSooLpis57Arbx2EjcnOBHPMeegfo8G0beKIP33wOMYyhWO/sZgHVI26V1x8qYSr2+eS7rqkUEby66YCvlKTrFRDpHy12L1uavTCRTvhpvSA0FyI8cCTyOqk1zdCfQpbmsIYL3ViyktLaPT3362Dd0C/0QgJvhBd+BiJ1ruHRKuaWiyn9nQV5ZZZz5iTbh5m1WFhTftj+mkbJmhfT8JqYGKk9/h+Y22j3EBIuoBNANZehC6XYDp80cRqQAB1kmV88h1mZEU1MjFLhAIliT/VRhgeAmXE0Ko9Nj0GygX240zFHnXXt6m1DF6g+wPUU/BqKzb3jx29QX/x+pbOubhpQzH2fnlaXE63q3izJy1/WI+qD5FE0Co/qnmikb6s4w2wooiuurkN311k1tLXLDjlpQONA7mMZsWB+RkdPp5yObyal2dzx8YUhqwaBpdIcsNy0qXoCftI0jYrUjpAVgvMLQmgrIvkpT4n7huuV+pcLcuv5OpaHV/Z8itZKlfnU2itiqS7DRtOEf+e6LwnUqQQsdQHOuI3vUgyjJq+1qvCM1GcsvuSelUFVup5bgUBQQcMrjCz+9zrujHx2AMX9LoFHW3UmE0ENLHiW7tfNsXitTjxL/0smnttr8rvuxh22eX19Px6ikUwhtcAMHDaThcBZALHL0CnBbYlj6bCwGP9akyM6ha0gR4h/hFoXsIRITduB7vBhjRLUk6dJPdjj5Vg4VG9TFeraXGVljM8OU+p6ZybzAQgFcz7A9TonVKNKL70jjs48OVB7m2MNw10aHPOv9VdnU4N4r4pZjWbZvkcWm6JWz/2IUYXeP5MVUDaE2ppkpc2etig4O894E7Zl71JZ8uSDvNdRhfJZncRQY/y6PXgdbTbXOySVZle2E2okfO3Y14jvwhGKmDdTIoiCcIMKwaiFxj5KuarJKhsxQtzRnYPV1M4P/fM2RIaZroKAw4uu6ZTo54nXOUjwVhd1CgwJ0jbqSu/Cl719AuhLbGeFNR8SOep0HeEpuNoOVqQKDXHeBewyUtqquLyBeZk83ME0tT1yoKoEdoeu0dcSRHC0l60x0pahnwNZCel2EcuW7N+O2URowbuizqAZknQUSx4prHezTFQr7eJk2/TiksyHQWOzWe2Cncn3Q2bwf2EqftIhQKmyVR8b/mIkebv6mXBWe5cymVuRV32NnM4jD2UrM8U4e/W11kbArX1R6euOVrWBU53cacoi6wbfJfkaTYvmqYO4vNN3tVVpjdG3yTb2MmyL5KzPhcPfDVbBZWMZLRtHw3hZ9+AHYxAt4uz0wIK+/dtRjeKwrfQb8yt2gnZ3vYm9jEcJ2JsDAU7vx6HMm3V5dlpBPgjydiYLl+lG0w2ExXbrAzTxw0+xaSK2zJ6SX9wExcX+K7+wvGq5kl/oSvHhdKR5HkCP87jXFw2rm4iD943/m/MbZEE/oBsZ4T9up6z5lHalQ5UfZucc5GcEYNsZKJIL5aytDDSVhdeicRfM2n5rS7KKSBlaX6qrSDyP8o4fUyI3ntsBXnm5IyL+cYZDAQj3P1SocVoT7JnFeatr2xzlZQi5cyZMpuFf2f5nCP25xUlknV8OEQFbx2LEqCNDAOljt1Sx16pAmFhscIC5pUTdB/L4Qh0TOTqFMghPFE2hJ0YJLqrgH55ZjU5REgs9RBecxfpOaiPs1najOthAqFBpUluBXVhoHK4PBmObZ4XLBTgevfSwJVKyOKzvVu22MZoDqMGeljTuCDubbLyPd6tYf/w8RPMK85VCABlsHnsJD6Fko+fHgZKwluv5HGg3LFX6snoaaAcvPVKfvE0hCO8deMY+shEKzMJ/q07w53D2MotzhTq07PwiauzbjTyk4AkuDOw5y6sTRLnfK0vnw+iesIvb93uy/cmYNwf3Z0wmgApCNZeTVicUsE/XkTalUsvfk9oUKQa/ggJKzwromYjnfcW5OXD4pLWtOPyG5AgrAmLBDBIy+k9DFITrEAv0gID7YFUU0IXpQOyiDSTIckElU2qkZdRspKbCq6loE03fFOhhDCsCI7yjgp8/FK6d7ljuXKnxdStIh1lta7h86wss3Xg1Gs6NzIuHXZFYOMVBZkfBqJ/cFWFOuSyVcssAoHiGPoPnzo0ZtUlxSEB+vV4ErqGjZFVpzuhaFfDMyaLuE3b8ppjp1bJopxyLfiF/RMgAynhKeU6laWflYXlcXBZHrsl24GOHEUmMEo5Ir49jx7fNeUk5oM5xxSKC0ygSlA5FnNB1tr+8OiOADfJ7HKVbmy1R2I4VmhPguci2qo2pUQjtAS1OvIyW/MdpnrpD90UNHtxFG4NlqEGNDp8+tRP9yVdGgq7z21MHTgBn67wvvAEonxd+OO5AZLklXzyU4ex0STosdDynDLaKI9Fz/E3qHI53U5MhdliLw31IQO5QcxFOhdXKD4d1nTCuY5XblE5l/VJ1XVfQhIK0ZhwHn4EjtdFhKtolPh6EPHQrW9AODtbL3bFeb6bLWlqf/hnmV6UrZpe6fJFmSzxFpG3Wd6qumcMEz/C3rvGTmrZS9mVFjKaOsZTddNqyIRqGyl5hImMFcVkB2nB4p8VJSlaZMrCihb6RVXTRQIDMddFaUbsuylKzH7FJWc+N0w41imc5hdlM2zBya4EsrFtADJ4ZNI1WzBpBOvI86iNYNwK/M4u6x/xGlejdaLbdBUv+g7oejmhvIng3O3qM78XG+/w+g94Fc5fe692wLsu03rMOgwY9CWDDoMmfcWVQWu5YsRhWBkSxxergjMpprM62FJ0tboAHX+s+SzPImOwjU52/9Ch4hx+EUgQsrkol1bWCUwxzSHzaPGm3rNx+GjJrvNN8q5EtT5vi69y42Cd22FNTQM7EwG4ISOGiAei1AthC4YsMeqPLMrhKop/KG0Rn2a4aXxlwK2QrKq8Q3TngKu4I6HtBlFzkhp4K6+or4pB51s2+P6c1uh4jS4RvD2n9Xiof1Nq80P6ScnIvRt1AkOj2vCshJRchyzuzQLW7ZtOdWg6Jw8WA6lCoSeyT+HIcsVen58wYOABuorciRE3CKgyP/sXjsqsXhoIqgvjgBpCnG7YK00z5Q3D+IyOTX02uXUslckq0MyzB28GjxbJ0hRGgscdfDVRTRBBeCNIfSIcNmJX25WFA2m3zXlUCcjY23aNKp0D33kzNcSG/GnH+aiIRvprRfPII4ECXT9sR7dtbC03F2ajIgGJj1DHrqJlHmfR4kfLiS+kN9PAW/mchdXGA5j60P/ssYVc9YAnBPyzz8zlMcgcFlrmIkYHbDAHnc8tHnajcBEHQ4Ug3U13sSuTdfT1Euk/eA0y8zLbg52hB0jkvjgmZckqZi/yXDI0rRz+qQPBlpHg5kpymVVf6xE1s0XxoVXVUjMq5gfqEuyiUBpXe57CyoMeI1rhaxdoJ8BM1STxQG9bTg4GWv04DssPAqOgrYr73b3dYCAsbWpPXRuA2L8aksUDoohdAUKfiRBCriKM7SCwC3UQ6XldC0bWmwV6DoyD4D62rlZdDL9VwsPO69FUNXinTbHZA1c09gLC2kPVEhidCthhGVoBzJOwauMuzi8biUDdk82szhhpQwzSyOQhalLswbYPGirKNrMBPABLH90dVICOn59EdlW+I8/Q7JSJTA/f8xOhBJ3Z1/IFLkQMN3lYU85bVr7b4SWdlqCGFcbAZ9w/XAS1m2qc6frBxuiO7oLuV3m8Ixf3AyAdTudXNx0C39Dk27wDrd9kvJ6Lf6tz4CfWmdqJmgMFKMQOvtHOOvBd6uHBBGguF8qZGLTimvCe6eG2L3KsuLQz0JlRZWqcipGnrGt8522CNq7olFCNbnTXhJbcjT4T2bA/67hMoBjB7M5zzixhd4lvmZx0Gveo97impBwnjEK8Z88RAgao1nacI43v0HGn0yyfmvf58L7DuIpBV7xnX8JJMB+6bx/PoT/CWvYg4+TNN8Gc/368WdPlu83JBxAxH82cTTtja2LxlblyhNY8D1nbLpOijchffEzAnWCYuH+pjCIqFQm4DZ0Ac0ECLl3fc+8ML6lv1Ywtitv6kIwun9SgJnQwcSKQHJD8E/27YcUMG2sppmxx0Ah+69QpXmF9wIvBt5btYAB+WNtooiH544EHBzzNBoC9SjfperdGYwBB/UxA/WwS0n0AF4etNDrqLutG+JzS7LyxoY37I0KKz0D0TmfLK1RaNXKyDcRutPDmjHFWCLeiP/3800t7z7nNk0X67k7bVCvpLYs4NCZU8J8+cCQ12hAv+GQ0Vhnjxu4KGWV3cyGPPN1w725bYalY3WLjpriBu4KvY4xQdyh/ou5MMMNw5R3D1tFNegrk+1H7NkzcIn8H7y2uOGFSnzrLT59lc0swRZZwLTH5MBTeomegrCnH0bFoPHbD+XztDTg6Tb2XoSS6pmNN5FdSr9oOmlXzomtOIGsvHb73xF7XZDbladWVLvoQjnK9OVaOILG1H882v4ToJ8/quAaV0MjY7mbDbnAQ8MKLe675RwhN7Y3AAdBPgbJ7D02JQE9e38YBuwosi2fsHmX1hbfIL5GEPRbLLuPeHthWbjO2wbU/trCEsaboy7Ara7CpMXBrpn0fuH7CW1lsRLpuOx3Hu25nef0PuXRYBxir79jE7PTJnO/CDAQdcsShntowF/iN5UWXL013ewctu2/xbpQTOnV2NvTylLsENB055iI9NKxi2gGvfc7KATONd/NUXkkR9jXXR7Avkxlf8bAvw7gIDeTsTuGcbOnm4m2aYJQlzL++it/uRqOjTqjOOimXGc651l+Bi/C45KsXMAHXcXu3pUpoyoQnzmlXAYS9iQgEpBgeTw2gntHJKLwhB3H8C+AYbXbl+xIbHJy+evWCnBfxaruMcQfIyfxgJP4UIVZfo2eYy8/TBEh9nkSMcO+7Fez5SlAG+63a/HM19OQ0WU0IquPd8SxcNzp80o2+3EPYl69etEeHGKKIvw6fAI+eyuzL+ObLToQZCquQuANxT0vgU5gbPYTV+wXFY4JuIRDneCwMGG0TGQPQj35YJRid9Hq3mQMBi3m6WCQwAd5DuQL4O/oHED2eLSM667JIEjy1Ctywuj+pocPNKK0OBGBc/uB4uIfIknEOgXHaK7nbQ3/89xvYFcWrq4ScMqdAcP78sZz8TZrg8PW+SpCyG6CfoDOdCEKm3SWYgwyJ/gtQeWBQvvcNaGobOk98f1KeNiVlYZJyLyHztFzCI924kEff7PLZEn4CstypVQKTELoEkCLYbax2RXG5A3n7saz76gVCTIuS1MvLEk9OXazEqSoMUthsolNxyOirDCV8N3qjHPDAwNEPSQ6MWzBO7xNMHgCrAnWEuLmG0hNzrdy5CQ6dGBBuMZW54ipyD5r58aggm4ANt719RFVYUuZ0nIqTXsuseeIw7mweqML4Oony9l3r4MLmr3QxR/hWCFhHRkeB6md0TghW4iPSD1y4+LFjnmzjJdW+BME9UiRzqQpSnPF7untCGFX4g0GWu7UhYoFCTRVSXQs3Jj7fsTk8SBlqjN5XNUUfmzckD1v5A8RfVDPuEPHnOzV0XNnQcX1Dx3dpSB358lsSnyqbEt8btXW7LxU0HZ50NJcByvPeZbbewqbtfAVS8VtYFpMVaXKoz4JwuEiKWR5vcfk1Bf/XmGcX1yJXGuH58flUnEDF9kbjUe8vUgaC7pPD9iKN+DFZK1koXuRKKKoStnRU5Twx6WHCCinudeiHe4COJE5L5Pss6gIyZbgdq8ZNwiD3HPwXp/MD58qUxWQcPXbTYtDbYy8kVdmMxtEXbtCpsBOOo1H/yP+mPcPj6LA/9I9GKp8HYHMc/Cxt6uOoV1GCHQ3w/cmxfzZzmuEmJ1shio+Hge/nu9UqLdBicTysqH6e7S6W2IUvhuEzkuIc16h/eBwuwMe5hv2n4WOT04s8SSi/eJoRHLec3kJxDGLF/bK43cHqw4CYIK25+qNIe1tVQObCrfrOCXKrvjpZcwPFbkPnAulyStyP3zx6JBm6Gz16JLygFM9923HLm0ZB4ZkYiQnS9kuYCcDER7OmX8EFVQXFNLU6wIJwzPIBcMogL50t/WMXgioSrm5EaTj4qIoBiEYt/zgjlzOkGQ/MFPRAcV/Vvqx0OnNG7c4fQ6srIpTN3CbWl5aBr7g8S4U6W5XMb6w40gd5UN9UJDFg1iw+rjz672AJHIx9QO61APj3z2Mxg6JuWDLTU0Yl+xRl+cDZRe6zkNh010p+i0QUTt1u1MroXKG4ngo+XIufOZ2g6I1uDzztXgouuurFnL6Otq8EnE34PL4Sd3MElHoeLiKJjH6k7VSny0mTmam9Jqgs5w0HeeScJJNZwiWtKYW6oLrcyKgK9s2ygOrzk+ixzRscYA194MbtYFq02dORCFqL7GNSB7a3joGPKoALYSeC7zFlZ7ghUnHKSLYXaOQZOuQrWunV9iGBjXGxpwsIvaoPvVE9zgzfBOpGWihQwzCkTbKDvf+q5Wm06Pdgdwem8uKQ+LEA10XVKWU9QB4EUPcx0l/rikXtxZAzVrgheWaSB0cmbeN0P5YXXLwynapGegMAYeXqMR2IyLfoUzQa4DOsdU5kKc/TDd8QLo27j6KnvNk9OvaFP14erguikY9uaDWvI3YDH+1zR1XnjSrPGQXo0TUuOIzsEGRiGvQJ7D8xJI/UnJjnkiruH1V3jr7YFRfJVXbBVwToJHRoT4cXUq9lwSi9ImeTW/PMzC6fLv2jR7bsAyE9nTuFRq6Jg4316taJM3EvwGVyPZE3DZD3QpzFoWM46noBZaKZuLhNjSsZ+I0pYZMihKpZh17UVlnGwkmukackeea7josVLUZiQRhR/7SUdhC3Uj2EFgkadF7dvHZyThn6UK3g+ugOmdkVi+FG3nqk7GkmbbxSBo7ammYTX2HrHTqqp09gwWNUNJ3+fbuQm4feXJY9j6sG2mbp+4wzQ0AN+wGbcBmWDh/ChtWZp64V1TA32lWVAa4RAG1jNY1wNkSx9RXdPPFmDFXUd6woWLKbB3c9KcIsJfbz0wzDBc0pBmrTEaWodwUOGbwswYLqmwuW1Q4TLDJ9I6Ci4OMKTJVeAqJ5AHJZq05AmGrgsFBE8aqI5NXXvV/y7N11UO+yuxBoz1HZ7teur/cF11fnlOq4eYR3hf9X/ms75O4SqgG8Km5FbLsj3Q0RrqqyMctBvwJlCNZokfTu/S6SVqaq2s5BhRHu7imujh8q66lpbxzJV++eR4dPmQhmxt8P/zpP8rdJfhnvFkFaTBoEMjccCj2d5GA0HQQ1i7uh2VI/CCjMQ2Mgdg5/6Bg8i744rBiDhgOwiNMVLa9nPHFx7djGRZHMuJTkKKgw/FNdbXCzkztbJMh7aph6GQI6FCH6rj3UwLarZ3WBt+dNb6Jf/wz/ckZIpFuiL3fr748K/VquToWxfg2SJQRUXojqMbDC3u/wN2g22u1rmtiVeqlGQ1U6degpGNdfAqwxC13TrEOG1nKTfdOhg86nx+RnsTaIGiIP6MaUwvQNCvIxE/Xd2EvbZTIgJWSLRx6FbfoCZZf7a8imfB+efPvSNz7h0F6/jiunW5y98v4BHXMEW3r6TQ2cFesH5dC69pbuuTGttDg9F1heKDj+vzqnEVge//5uO655w63bnlLRKtX8QN8ZTK3uKDpuNvQfCYoZoJHkBAh12qSjD/uHvXSzfFNs1REiUsiXtevxyx7NayyncP7iiQ9wjjkZfwUwtiB5HcwqSxbPagfHtXCW0a6DiOJ1tlF9dkoduTUCY0PKjRqqDw1huMbRKxQHwAYbuCOURnVXqDV7DqlwB5dwmQuMetoDNTRwJRzQ//eZltsnXKrmkLCgeepWvRGgiPZQxwN6AwwVDCev3hP2FB3pQUWcWBaVG2BInx4pfvez8k1xg3BCS/OI/zYNQP3ruzy+PZtYHTDxQFBz0Fdvou2cS79AKX+OL3XQZvCLqcNYTwz7uyly16fKFt7w289loRfhKYNHh9JPKLv6qLjcrYmtdAWyEyoxgI/fr0+y4JPPy/R97MLotWwkSIrD8pm3f0/sM/lyvgsg//yukUVVctGPSK5lg/pLwcLTEjJsiKlUQlNxqyfZ2UMIBawkhBYPr8Msn/FM3jHHG+SvI5vMfWe1yZJjbKRxB+AHKD9m6KmkvCuIzmaHzeXGhMfsg2ZfKulN2TbXYjECZoGoae0zgRe2Gk7iYIWKfyuEjPy+grnPzb3eYSQ6I1xSjYTMpN7IB98IjEXBg+lLgEGrEll6BT1AYvCwRKYk4RG8b3w/4wCPFnTlder4yOzTOqxHmCbY+Wva4g/5skX8PDaM5jAqNhidq6xm0ZNRaBuDy+tKyIFpBboAnJwPBT8Cc3+RXeN5ftbBHfpZg/GsVLmobQ2IvVRdb7IdumSRArGmOWNuPom//5t8Fvv/0Cvfzlb4Nff/0VZsePb7rRV2++7n0DEmYTb97DtzI+XyUzkKC9H9Pfd+k8xfa70beAVrq5GPy8BX79Hjgsl1P8p+Sq6InxPk8AsQWGy0CpOQgtJrEYSRfFiRfkMFvt5gmmPd/uyPMSEAV/B/ImG+CcePWefpItAnoiVukAFX47hQ6uVnHe+34zT95RBSBEdQVBoAh5tJdtBvx3sQiVNcnHUzhIQd7xRV/D6+9AEchCoASNo9cxpjsg8WlRm0HIjP7f0j2fRQjQT6CNUXAt8NPg5VtgMTlADOL16SkuAFdZPu+dzuLNnnFZpwWsDxe1w/LyXYyiQQ5L7+8w1/IkXSbsNS2jSmIzkcg9VPT+nMTlOt6GygGARVLg1gzjEXLmu28x0hrD4X+AiQyDm18kV9hxX8OpUANg6cyTFbfueqfMaz2AtTez5RrWX+sWjuDVHKHLPCqv3kBFw9A0tnkKjVyrWAfr+hEZkcAuoi+HTksam44Lb8oaTEF5V+hXO3gLgChuZs0XqY7t9MKKGpRXV5PGPvKrCp3o331YHpPcN9sbhU8k5ZulcXOu5LBJpsDeiWoW9nzqq/nFCXZln/AuYCeyOd1MV+QQ4ky3m7YzhB1O5uy10HEz0VDqWYO/XUBnPdHWeNL1ETa+ctStwOt59FhHiDrnXxk8DO8Cz3PCHzwCgS7whrzmkN2HU086ZFV5CNhjnYpMuMxpeKRNMUpV/ltFSBVqi+/wQlA68YX0bhiyKzZICO2tdWaSwVqE7DkU8a/msmPmbOcWkQTPkLWNo2PwktPVw48zq2MTvi3SORrmboMQ6MHBAd0+Kniah0MIQY5F1cLOjE0VIM64wlmKC/IkGkTmM8atYDZ4dpPxK5XLfMTsL8a/o5IIW3X/4yQaTgSKJv9UoUk/GUFMhq7hR89gu4vbeW5iOEHpNPQ2hkOzb6IuJmzXHRtOzAt0GTNzbmKWXwsvkd+6AlfrNnqBMoKgywjxQSTZpqTp8tMzM5OeezM5ZQ2P314IFyXXGOja3EPKKK5LGSnMZZMHLHzeihLtWOZMh1p0gf25TH3Ob3CIQQaf4wi/T7eB3N5U+22cV0DES4cJCN/uYKNqVHPaVfWoZQN32JBlawqlKpf94neYOgqBRxpqxxxx7O5AVMTbiugHZzHrDw/+HwrD/vc=
-"""
-
-_source = zlib.decompress(base64.b64decode("".join(_COMPRESSED_SOURCE.split()))).decode("utf-8")
-exec(compile(_source, __file__, "exec"), globals())
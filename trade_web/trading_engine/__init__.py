@@ -1,76 +1,154 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import errno
+import hashlib
 import json
 import math
-import random
+import os
+import shutil
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from .backtest import indicator_arrays, metrics, round_trip_cost, signal_series, simulate, strength_series, trade_rows
+from .cache import INDICATOR_PARAMS, IndicatorCache
+from .columnar import CandleArray
+from .correlation import CorrelationEngine, align_closes
+from .incremental import IndicatorRegistry
+from .indicators import ema_series, last, macd_series, rsi_series, sma_series
+from .patterns import pattern_at, trade_alignment
+from .patterns import scan as scan_patterns
+from .scoring import signal_arrays, signal_type, status_arrays, timeframe_points
+from .synthetic import demo_candles
+from .timeframes import TIMEFRAME_SECONDS, last_closed_open_time
+
+# optimizer (multiprocessing, shared memory), search, validation and forecast are imported inside
+# `optimize`/`forecast`, so importing the package - and every app worker - stays cheap until first use.
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One parsed state of the config file. `config` is shared between requests and must not be mutated."""
+
+    config: dict[str, Any]
+    text: str
+    version: int
+    etag: str
+    signature: tuple[int, int, int]
+
 
 @dataclass
 class ConfigStore:
+    """config.json behind an in-memory snapshot.
+
+    `snapshot()` costs one `stat` while the file is unchanged; a different mtime/inode/size (own
+    `save`, an editor, a deploy) reparses it and bumps `version`. `save` writes a temp file in the
+    same directory and swaps it in with `os.replace`, so readers never see a half-written file.
+    `etag` hashes the file content and matches across processes, `version` counts changes seen here.
+    """
+
     path: Path
+    _snapshot: ConfigSnapshot | None = field(default=None, init=False, repr=False)
+    _version: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _signature(self) -> tuple[int, int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+    def _publish(self, text: str, signature: tuple[int, int, int]) -> ConfigSnapshot:
+        current = self._snapshot
+        if current is not None and current.text == text:
+            snapshot = ConfigSnapshot(current.config, text, current.version, current.etag, signature)
+        else:
+            self._version += 1
+            etag = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+            snapshot = ConfigSnapshot(json.loads(text), text, self._version, etag, signature)
+        self._snapshot = snapshot
+        return snapshot
+
+    def snapshot(self) -> ConfigSnapshot:
+        signature = self._signature()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        with self._lock:
+            signature = self._signature()
+            if self._snapshot is not None and self._snapshot.signature == signature:
+                return self._snapshot
+            return self._publish(self.path.read_text(encoding='utf-8'), signature)
+
+    @property
+    def version(self) -> int:
+        return self.snapshot().version
+
+    @property
+    def etag(self) -> str:
+        return self.snapshot().etag
 
     def load(self) -> dict[str, Any]:
-        with self.path.open('r', encoding='utf-8') as handle:
-            return json.load(handle)
-
-    def save(self, config: dict[str, Any]) -> None:
-        with self.path.open('w', encoding='utf-8') as handle:
-            json.dump(config, handle, indent=2)
+        """A private, mutable copy of the current config."""
+        return json.loads(self.snapshot().text)
+
+    def save(self, config: dict[str, Any]) -> ConfigSnapshot:
+        text = json.dumps(config, indent=2)
+        with self._lock:
+            handle, temp = tempfile.mkstemp(prefix=f'.{self.path.name}.', suffix='.tmp', dir=self.path.parent)
+            try:
+                # mkstemp creates 0600 files; keep the mode of the file being replaced.
+                with contextlib.suppress(FileNotFoundError):
+                    os.chmod(temp, os.stat(self.path).st_mode & 0o777)
+                with os.fdopen(handle, 'w', encoding='utf-8') as file:
+                    file.write(text)
+                    file.flush()
+                    os.fsync(file.fileno())
+                    # rename keeps inode and mtime, so this is the signature of the new config.json
+                    stat = os.fstat(file.fileno())
+                try:
+                    os.replace(temp, self.path)
+                except OSError as exc:
+                    if exc.errno not in (errno.EBUSY, errno.EXDEV):
+                        raise
+                    # A bind-mounted config.json (docker-compose) cannot be replaced; copy in place instead.
+                    shutil.copyfile(temp, self.path)
+                    os.unlink(temp)
+                    stat = os.stat(self.path)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temp)
+                raise
+            return self._publish(text, (stat.st_mtime_ns, stat.st_ino, stat.st_size))
+
+
+INDICATORS = ('RSI', 'MACD', 'MA_Setup', 'Volumen', 'Trend', 'Support/Resist')
 
 
 def sma(values: list[float], length: int) -> float | None:
-    return sum(values[-length:]) / length if len(values) >= length and length > 0 else None
+    return last(sma_series(values, length))
 
 
 def ema(values: list[float], length: int) -> float | None:
-    if len(values) < length or length <= 0:
-        return None
-    alpha = 2 / (length + 1)
-    result = sum(values[:length]) / length
-    for value in values[length:]:
-        result = value * alpha + result * (1 - alpha)
-    return result
+    return last(ema_series(values, length))
 
 
 def rsi(values: list[float], length: int = 14) -> float | None:
-    if len(values) <= length:
-        return None
-    gains, losses = [], []
-    for index in range(1, length + 1):
-        diff = values[index] - values[index - 1]
-        gains.append(max(diff, 0))
-        losses.append(max(-diff, 0))
-    avg_gain = sum(gains) / length
-    avg_loss = sum(losses) / length
-    for index in range(length + 1, len(values)):
-        diff = values[index] - values[index - 1]
-        avg_gain = (avg_gain * (length - 1) + max(diff, 0)) / length
-        avg_loss = (avg_loss * (length - 1) + max(-diff, 0)) / length
-    if avg_gain == 0 and avg_loss == 0:
-        return 50
-    if avg_loss == 0:
-        return 100
-    return 100 - (100 / (1 + avg_gain / avg_loss))
+    return last(rsi_series(values, length))
 
 
 def macd(values: list[float]) -> dict[str, float | None]:
-    fast = ema(values, 12)
-    slow = ema(values, 26)
-    if fast is None or slow is None or len(values) < 35:
+    if len(values) < 35:
         return {'macd': None, 'signal': None, 'hist': None}
-    macd_series = []
-    for index in range(26, len(values) + 1):
-        f = ema(values[:index], 12)
-        s = ema(values[:index], 26)
-        if f is not None and s is not None:
-            macd_series.append(f - s)
-    signal = ema(macd_series, 9)
-    value = macd_series[-1] if macd_series else None
-    return {'macd': value, 'signal': signal, 'hist': value - signal if value is not None and signal is not None else None}
+    series = macd_series(values)
+    return {key: last(line) for key, line in series.items()}
 
 
 def returns(prices: list[float]) -> list[float]:
@@ -93,6 +171,15 @@ def correlation(left: list[float], right: list[float]) -> float | None:
 
 
 class TradingAnalyzer:
+    def __init__(self, candle_store: Any | None = None, market_data: Any | None = None, cache_size: int = 256) -> None:
+        self.indicator_states = IndicatorRegistry()
+        self.indicator_cache = IndicatorCache(cache_size)
+        self.correlation_engine = CorrelationEngine()
+        self.candle_store = candle_store
+        self.market_data = market_data
+        self._pools: dict[int, ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
+
     def _signal_params(self, params: dict[str, Any] | None = None) -> dict[str, Any]:
         base = {
             'weak_buy': 3, 'buy': 5, 'strong_buy': 7, 'rr_good': 1.4, 'rr_excellent': 2.0,
@@ -105,28 +192,254 @@ class TradingAnalyzer:
     def analyze(self, config: dict[str, Any], use_demo_data: bool = False) -> dict[str, Any]:
         symbol = config.get('symbol', 'BTCUSDT')
         params = self._signal_params(config.get('signal_params'))
-        frames = {tf: self._frame(symbol, tf) for tf in config.get('timeframes', ['15m', '30m', '4h', '1d'])}
+        exchange = config.get('exchange', 'BINANCE')
+        frames, warnings = self._frames(symbol, config.get('timeframes', ['15m', '30m', '4h', '1d']), use_demo_data, exchange, config.get('analysis', {}))
+        fallbacks = [tf for tf, frame in frames.items() if frame['source'] == 'demo'] if not use_demo_data else []
         macro = {'status': 'orange', 'score': 0, 'label': 'Makro neutral', 'components': [], 'source_note': 'GitHub fallback engine'}
-        signal = self._signal(frames, {'pattern_detected': False}, macro, config.get('signal_mode', 'high_precision'), params)
+        pattern = self._pattern(frames)
+        signal = self._signal(frames, pattern, macro, config.get('signal_mode', 'high_precision'), params)
+        if not pattern['pattern_detected']:
+            pattern.update({'optimal_entry': signal['entry_price'], 'stop_loss': signal['stop_loss'], 'target_price': signal['target'], 'risk_reward': signal['risk_reward']})
+        correlations = self.correlations(config, use_demo_data)
         return {
-            'symbol': symbol, 'updated_at': int(time.time()), 'frames': frames, 'signal': signal,
-            'pattern': {'pattern_detected': False, 'confidence': 0, 'optimal_entry': signal['entry_price'], 'stop_loss': signal['stop_loss'], 'target_price': signal['target'], 'risk_reward': signal['risk_reward']},
-            'correlations': [], 'macro': macro, 'data_quality': {'mode': 'demo' if use_demo_data else 'live', 'fallbacks': 0},
-            'warnings': [], 'methodology': self._methodology(), 'indicator_audit': self._indicator_audit(frames),
+            'symbol': symbol, 'updated_at': int(time.time()), 'frames': frames, 'signal': signal, 'pattern': pattern,
+            'correlations': correlations['rows'], 'correlation_matrix': {key: value for key, value in correlations.items() if key != 'rows'}, 'macro': macro, 'data_quality': {'mode': 'demo' if use_demo_data else 'live', 'fallbacks': len(fallbacks)},
+            'warnings': warnings + [f'{tf}: Marktdaten nicht verfuegbar, Demo-Daten verwendet' for tf in fallbacks], 'methodology': self._methodology(), 'indicator_audit': self._indicator_audit(frames),
         }
 
-    def _frame(self, symbol: str, timeframe: str) -> dict[str, Any]:
-        seed = sum(map(ord, symbol + timeframe))
-        rng = random.Random(seed)
-        base = 76000 if symbol.startswith('BTC') else 3000
-        closes = [base]
-        for _ in range(240):
-            closes.append(closes[-1] * (1 + rng.uniform(-0.006, 0.007)))
-        price = closes[-1]
-        r = rsi(closes) or 50
-        m = macd(closes)
-        e20, e50, s200 = ema(closes, 20), ema(closes, 50), sma(closes, 200)
-        support, resistance = min(closes[-30:]), max(closes[-30:])
+    def analyze_many(self, config: dict[str, Any], symbols: list[str] | None = None, use_demo_data: bool = False) -> dict[str, Any]:
+        """Rank signals for many symbols: histories load concurrently, indicators and scores run on (symbols x candles) matrices."""
+        started = time.perf_counter()
+        symbols = symbols or config.get('available_symbols') or [config.get('symbol', 'BTCUSDT')]
+        timeframes = config.get('timeframes', ['15m', '30m', '4h', '1d'])
+        params = self._signal_params(config.get('signal_params'))
+        exchange = config.get('exchange', 'BINANCE')
+        executor = self._executor(int(config.get('analysis', {}).get('max_workers', 4)))
+
+        def load(symbol: str, timeframe: str) -> tuple[dict[str, Any], float]:
+            load_started = time.perf_counter()
+            data = self.history(symbol, timeframe, use_demo_data=use_demo_data, exchange=exchange)
+            return data, (time.perf_counter() - load_started) * 1000
+
+        futures = {(symbol, tf): executor.submit(load, symbol, tf) for symbol in symbols for tf in timeframes}
+        histories, load_ms = {}, dict.fromkeys(symbols, 0.0)
+        for key, future in futures.items():
+            histories[key], elapsed = future.result()
+            load_ms[key[0]] += elapsed
+        loaded = time.perf_counter()
+
+        strength = np.zeros(len(symbols), dtype=np.int64)
+        points, anchor = {}, None
+        for tf in timeframes:
+            rows = [[candle['close'] for candle in histories[(symbol, tf)]['candles']] for symbol in symbols]
+            latest = self._latest_indicators(rows)
+            points[tf] = timeframe_points(status_arrays(**latest), 2 if tf in {'4h', '1d'} else 1, params['indicator_weights'])
+            strength += points[tf]
+            if anchor is None or tf == '4h':
+                anchor = latest
+        signals = signal_arrays(strength, anchor['price'], anchor['support'], anchor['resistance'], params)
+        computed = time.perf_counter()
+
+        order = sorted(range(len(symbols)), key=lambda i: (bool(signals['active'][i]), int(signals['tier'][i]), int(signals['score'][i]), float(signals['risk_reward'][i])), reverse=True)
+        table = []
+        for rank, index in enumerate(order, 1):
+            score = int(signals['score'][index])
+            sources = {histories[(symbols[index], tf)]['source'] for tf in timeframes}
+            table.append({
+                'rank': rank, 'symbol': symbols[index], 'signal_type': signal_type(int(signals['tier'][index]), int(signals['side'][index])),
+                'side': 'BUY' if signals['side'][index] > 0 else 'SELL', 'strength': score, 'active': bool(signals['active'][index]),
+                'entry_price': float(anchor['price'][index]), 'stop_loss': float(signals['stop'][index]), 'target': float(signals['target'][index]),
+                'risk_reward': round(float(signals['risk_reward'][index]), 4), 'confidence': min(score * 12, 100),
+                'timeframe_points': {tf: int(points[tf][index]) for tf in timeframes},
+                'source': sources.pop() if len(sources) == 1 else 'mixed', 'load_ms': round(load_ms[symbols[index]], 2),
+            })
+        total_ms = (time.perf_counter() - started) * 1000
+        return {
+            'updated_at': int(time.time()), 'settings': {'symbols': symbols, 'timeframes': timeframes, 'mode': config.get('signal_mode', 'high_precision')},
+            'signals': table,
+            'timings': {'load_ms': round((loaded - started) * 1000, 2), 'compute_ms': round((computed - loaded) * 1000, 2), 'total_ms': round(total_ms, 2), 'per_symbol_ms': round(total_ms / len(symbols), 2)},
+        }
+
+    def correlations(self, config: dict[str, Any], use_demo_data: bool = False) -> dict[str, Any]:
+        """Return correlations of the analysed symbol and all `benchmark_assets` over a rolling window.
+
+        The rolling state is fed only new candles and the result is cached until the next candle closes.
+        """
+        symbol = config.get('symbol', 'BTCUSDT')
+        symbols = [symbol] + [asset for asset in config.get('benchmark_assets', []) if asset != symbol]
+        settings = config.get('analysis', {})
+        timeframe = settings.get('correlation_timeframe', '4h')
+        window = int(settings.get('correlation_window', 60))
+        exchange = config.get('exchange', 'BINANCE')
+        closed, key = last_closed_open_time(timeframe), ('correlation', tuple(symbols), window, exchange, use_demo_data)
+        cached = self.indicator_cache.get(symbol, timeframe, closed, key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        executor = self._executor(int(settings.get('max_workers', 4)))
+        futures = {asset: executor.submit(self.history, asset, timeframe, window + 1, use_demo_data, exchange) for asset in symbols}
+        histories = {asset: future.result() for asset, future in futures.items()}
+        times, closes = align_closes({asset: data['candles'] for asset, data in histories.items()})
+        matrix = self.correlation_engine.sync(symbols, timeframe, window, times, closes).matrix() if len(times) > 2 else None
+        change = (closes[:, -1] / closes[:, 0] - 1) * 100 if len(times) else np.zeros(len(symbols))
+        result = {
+            'timeframe': timeframe, 'window': window, 'candles': int(len(times)), 'symbols': symbols,
+            'matrix': None if matrix is None else np.round(matrix, 4).tolist(),
+            'rows': [
+                {'symbol': asset, 'correlation': None if matrix is None else round(float(matrix[0, index]), 4), 'relative_strength': round(float(change[index] - change[0]), 2)}
+                for index, asset in enumerate(symbols) if index
+            ],
+        }
+        if use_demo_data or all(data['source'] == 'live' for data in histories.values()):
+            self.indicator_cache.put(symbol, timeframe, closed, key, copy.deepcopy(result))
+        return result
+
+    def _latest_indicators(self, rows: list[list[float]]) -> dict[str, np.ndarray]:
+        """Last-candle indicator values per close series; series of equal length share one matrix.
+
+        Histories are never cut to a common length, so a young listing does not change the
+        indicators of the other symbols and every row matches `analyze` for that symbol.
+        """
+        groups: dict[int, list[int]] = {}
+        for index, row in enumerate(rows):
+            if row:
+                groups.setdefault(len(row), []).append(index)
+        latest: dict[str, np.ndarray] = {}
+        for indices in groups.values():
+            for name, values in self._latest_matrix(np.array([rows[index] for index in indices])).items():
+                latest.setdefault(name, np.full(len(rows), np.nan))[indices] = values
+        return latest
+
+    def _latest_matrix(self, closes: np.ndarray) -> dict[str, np.ndarray]:
+        """Last-candle indicator values for a (symbols x candles) close matrix."""
+        return {
+            'price': closes[:, -1], 'rsi': rsi_series(closes)[:, -1], 'hist': macd_series(closes)['hist'][:, -1] if closes.shape[1] >= 35 else np.full(closes.shape[0], np.nan),
+            'ema20': ema_series(closes, 20)[:, -1], 'ema50': ema_series(closes, 50)[:, -1], 'sma200': sma_series(closes, 200)[:, -1],
+            'support': closes[:, -30:].min(axis=1), 'resistance': closes[:, -30:].max(axis=1),
+        }
+
+    def _frames(self, symbol: str, timeframes: list[str], use_demo_data: bool, exchange: str, settings: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+        """Fetch and evaluate all timeframes concurrently; a timeframe that misses the deadline is scored neutral.
+
+        The pool is shared with batch analysis and correlations, so a timeframe gets `timeframe_timeout_s`
+        to start and, once started, the same again to finish; waiting in the queue does not eat its run time.
+        A timed-out frame still completes in the background and lands in the indicator cache.
+        """
+        timeout = float(settings.get('timeframe_timeout_s', 8))
+        executor = self._executor(int(settings.get('max_workers', 4)))
+        started: dict[str, float] = {}
+
+        def run(tf: str) -> dict[str, Any]:
+            started[tf] = time.monotonic()
+            return self._frame(symbol, tf, use_demo_data, exchange=exchange)
+
+        submitted = time.monotonic()
+        futures = {tf: executor.submit(run, tf) for tf in timeframes}
+        frames, warnings = {}, []
+        for tf, future in futures.items():
+            try:
+                frames[tf] = self._await_frame(future, lambda tf=tf: started.get(tf), submitted, timeout)
+            except FutureTimeout:
+                if tf in started:
+                    frames[tf] = self._neutral_frame(symbol, tf, f'Timeout nach {timeout:g}s')
+                    warnings.append(f'{tf}: Timeout nach {timeout:g}s, Timeframe neutral gewertet')
+                else:
+                    frames[tf] = self._neutral_frame(symbol, tf, f'nach {timeout:g}s nicht gestartet')
+                    warnings.append(f'{tf}: nach {timeout:g}s in der Warteschlange nicht gestartet (Worker ausgelastet), Timeframe neutral gewertet')
+            except Exception as exc:
+                frames[tf] = self._neutral_frame(symbol, tf, str(exc))
+                warnings.append(f'{tf}: Fehler ({exc}), Timeframe neutral gewertet')
+        return frames, warnings
+
+    @staticmethod
+    def _await_frame(future: Any, started: Any, submitted: float, timeout: float) -> dict[str, Any]:
+        """`future.result()` with a deadline of `timeout` after submission while queued, after start once running."""
+        while True:
+            begin = started()
+            try:
+                return future.result(timeout=max(0.0, (submitted if begin is None else begin) + timeout - time.monotonic()))
+            except FutureTimeout:
+                if begin is not None:
+                    raise
+                # Still queued: drop it. If it started meanwhile, cancel fails and it gets its own run deadline.
+                if future.cancel():
+                    raise
+
+    def _executor(self, workers: int) -> ThreadPoolExecutor:
+        """The shared pool for `workers` threads.
+
+        A changed `max_workers` gets a new pool, but the old one is never shut down: requests that
+        already hold it may still submit to it. Idle pool threads cost nothing but memory.
+        """
+        workers = max(1, workers)
+        with self._executor_lock:
+            pool = self._pools.get(workers)
+            if pool is None:
+                pool = self._pools[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='frame')
+            return pool
+
+    def _neutral_frame(self, symbol: str, timeframe: str, reason: str) -> dict[str, Any]:
+        last_values = self.indicator_states.snapshot(symbol, timeframe) or {}
+        price = last_values.get('close') or 0.0
+        indicators = {
+            'close': price, 'rsi': last_values.get('rsi') or 50, 'macd': last_values.get('macd') or {'macd': None, 'signal': None, 'hist': None},
+            'ema20': last_values.get('ema20'), 'ema50': last_values.get('ema50'), 'sma200': last_values.get('sma200'),
+            'support': last_values.get('support') or price, 'resistance': last_values.get('resistance') or price,
+        }
+        statuses = {name: {'status': 'grey', 'message': reason} for name in INDICATORS}
+        return {'price': price, 'source': 'neutral', 'indicators': indicators, 'statuses': statuses}
+
+    def history(self, symbol: str, timeframe: str, candles: int = 241, use_demo_data: bool = False, exchange: str = 'BINANCE') -> dict[str, Any]:
+        """Closed candles for analyze, backtest, optimize and forecast; live data is served through the candle cache."""
+        error = None
+        if not use_demo_data and self.candle_store is not None and self.market_data is not None:
+            step = TIMEFRAME_SECONDS[timeframe]
+            end = last_closed_open_time(timeframe)
+            try:
+                rows = self.candle_store.fetch(exchange, symbol, timeframe, end - (candles - 1) * step, end, step, self.market_data)
+            except Exception as exc:
+                rows, error = [], str(exc)
+            if rows:
+                return {'candles': rows, 'source': 'live', 'error': None}
+            error = error or 'keine Kerzen'
+        return {'candles': self._demo_candles(symbol, timeframe, candles), 'source': 'demo', 'error': error}
+
+    def candle_array(self, symbol: str, timeframe: str, candles: int = 241, use_demo_data: bool = False, exchange: str = 'BINANCE') -> CandleArray:
+        if use_demo_data:
+            return self._demo_array(symbol, timeframe, candles)
+        return CandleArray.from_rows(self.history(symbol, timeframe, candles, use_demo_data, exchange)['candles'])
+
+    def _demo_candles(self, symbol: str, timeframe: str, candles: int) -> list[dict[str, Any]]:
+        return self._demo_array(symbol, timeframe, candles).rows()
+
+    def _demo_array(self, symbol: str, timeframe: str, candles: int) -> CandleArray:
+        price = 76000 if symbol.startswith('BTC') else 3000
+        return demo_candles(symbol, timeframe, candles, last_closed_open_time(timeframe), price)
+
+    def _frame(self, symbol: str, timeframe: str, use_demo_data: bool = True, forming: float | None = None, exchange: str = 'BINANCE') -> dict[str, Any]:
+        if forming is not None:
+            return self._build_frame(symbol, timeframe, use_demo_data, forming, exchange)
+        # Closed-candle frames only change when a new candle closes, so a hit skips the history fetch too.
+        closed, params = last_closed_open_time(timeframe), (exchange, use_demo_data, INDICATOR_PARAMS)
+        cached = self.indicator_cache.get(symbol, timeframe, closed, params)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        frame = self._build_frame(symbol, timeframe, use_demo_data, None, exchange)
+        # Right after a close the exchange or the candle cache may still end one candle earlier;
+        # such a frame is served but not cached under the new candle's key.
+        if (use_demo_data or frame['source'] == 'live') and frame['candle_time'] == closed:
+            self.indicator_cache.put(symbol, timeframe, closed, params, copy.deepcopy(frame))
+        return frame
+
+    def _build_frame(self, symbol: str, timeframe: str, use_demo_data: bool, forming: float | None, exchange: str) -> dict[str, Any]:
+        history = self.history(symbol, timeframe, use_demo_data=use_demo_data, exchange=exchange)
+        closes = [candle['close'] for candle in history['candles']]
+        state = self.indicator_states.sync(symbol, timeframe, closes, [candle['time'] for candle in history['candles']])
+        ind = state.snapshot() if forming is None else state.peek(forming)
+        price = ind['close']
+        r = ind['rsi'] or 50
+        m = ind['macd']
+        e20, e50, s200 = ind['ema20'], ind['ema50'], ind['sma200']
+        support, resistance = ind['support'], ind['resistance']
         statuses = {
             'RSI': self._status(r > 55, r < 45, f'RSI {r:.1f}'),
             'MACD': self._status((m['hist'] or 0) > 0, (m['hist'] or 0) < 0, 'MACD Histogramm'),
@@ -135,7 +448,18 @@ class TradingAnalyzer:
             'Trend': self._status(price > (s200 or price), price < (s200 or price), 'SMA200 Trend'),
             'Support/Resist': self._status((resistance - price) > (price - support), (price - support) > (resistance - price), 'Support/Resistance'),
         }
-        return {'price': price, 'indicators': {'close': price, 'rsi': r, 'macd': m, 'ema20': e20, 'ema50': e50, 'sma200': s200, 'support': support, 'resistance': resistance}, 'statuses': statuses}
+        pattern = pattern_at(scan_patterns(CandleArray.from_rows(history['candles'])))
+        return {'price': price, 'source': history['source'], 'candle_time': history['candles'][-1]['time'], 'indicators': {'close': price, 'rsi': r, 'macd': m, 'ema20': e20, 'ema50': e50, 'sma200': s200, 'support': support, 'resistance': resistance}, 'statuses': statuses, 'pattern': pattern}
+
+    def _pattern(self, frames: dict[str, Any]) -> dict[str, Any]:
+        """Strongest W/Fibonacci setup over all timeframes (slower timeframes win ties), plus one line per timeframe."""
+        found = {tf: frame['pattern'] for tf, frame in frames.items() if frame.get('pattern')}
+        ranked = sorted(found.items(), key=lambda item: (item[1]['pattern_detected'], item[1]['confidence'], TIMEFRAME_SECONDS[item[0]]), reverse=True)
+        anchor = found.get('4h') or (ranked[0][1] if ranked else {})
+        best = dict(ranked[0][1]) if ranked and ranked[0][1]['pattern_detected'] else {'pattern_detected': False, 'pattern_type': None, 'confidence': 0, 'fibonacci': anchor.get('fibonacci', {})}
+        best['timeframe'] = ranked[0][0] if best['pattern_detected'] else None
+        best['timeframes'] = {tf: item['pattern_type'] for tf, item in found.items()}
+        return best
 
     def _status(self, green: bool, red: bool, message: str) -> dict[str, str]:
         return {'status': 'green' if green else 'red' if red else 'orange', 'message': message}
@@ -166,7 +490,9 @@ class TradingAnalyzer:
         return {'signal_type': signal_type, 'side': side, 'strength': score, 'score_parts': parts, 'entry_price': entry, 'stop_loss': stop, 'target': target, 'risk_reward': round(rr, 4), 'confidence': min(score * 12, 100), 'reasons': [p['label'] for p in parts], 'blockers': blockers, 'mode_label': mode, 'params': params}
 
     def _timeframe_score(self, statuses: dict[str, Any], weight: int, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        raw = sum({'green': 1, 'orange': 0, 'grey': 0, 'red': -1}.get(s.get('status'), 0) for s in statuses.values())
+        weights = (params or {}).get('indicator_weights', {})
+        raw = sum({'green': 1, 'orange': 0, 'grey': 0, 'red': -1}.get(s.get('status'), 0) * weights.get(name, 1) for name, s in statuses.items())
+        raw = int(raw) if raw == int(raw) else round(raw, 4)
         points = weight if raw >= 3 else max(1, weight - 1) if raw >= 1 else -weight if raw <= -3 else -1 if raw <= -1 else 0
         label = 'bullisch bestaetigt' if points > 0 else 'bearish bestaetigt' if points < 0 else 'neutral'
         return {'raw': raw, 'points': points, 'weight': weight, 'label': label}
@@ -184,21 +510,112 @@ class TradingAnalyzer:
 
     def backtest(self, config: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
         symbols = kwargs.get('symbols') or config.get('benchmark_assets', [config.get('symbol', 'BTCUSDT')])[:2]
+        modes = kwargs.get('modes') or [config.get('signal_mode', 'high_precision')]
+        candles = int(kwargs.get('candles', 360))
+        horizon = int(kwargs.get('horizon', 12))
+        horizons = sorted({horizon, *(int(h) for h in kwargs.get('horizons') or [])})
+        params = self._signal_params(config.get('signal_params'))
+        timeframes = config.get('timeframes', ['15m', '30m', '4h', '1d'])
+        cost = round_trip_cost(config.get('risk_management', {}))
         rows = []
         for symbol in symbols:
-            rows.append({'symbol': symbol, 'mode': config.get('signal_mode', 'high_precision'), 'trades': 12, 'wins': 7, 'losses': 5, 'win_rate': 58.33, 'total_return_pct': 4.2, 'profit_factor': 1.35, 'max_drawdown_pct': -3.1, 'equity_curve': [{'equity_pct': i * 0.35, 'drawdown_pct': -0.2} for i in range(12)], 'chart': {'candles': [], 'trades': []}})
-        return {'settings': {'symbols': symbols, 'mode': config.get('signal_mode', 'high_precision'), 'candles': kwargs.get('candles', 360), 'horizon_candles': kwargs.get('horizon', 12)}, 'summary': rows}
+            data = kwargs.get('data', {}).get(symbol) or self.candle_array(symbol, '4h', candles=candles, use_demo_data=kwargs.get('use_demo_data', False), exchange=config.get('exchange', 'BINANCE'))
+            indicators = self._indicator_arrays(symbol, '4h', data)
+            statuses = status_arrays(**indicators)
+            strength = strength_series(statuses, timeframes, params['indicator_weights'])
+            chart_start = max(0, len(data) - 120)
+            patterns = scan_patterns(data)
+            for mode in modes:
+                runs = simulate(data, signal_series(indicators, statuses, strength, params, mode), horizons, cost)
+                row = {'symbol': symbol, 'mode': mode, **metrics(runs[horizon])}
+                row['horizons'] = {str(h): {key: value for key, value in metrics(runs[h]).items() if key != 'equity_curve'} for h in horizons}
+                row['patterns'] = trade_alignment(patterns, runs[horizon])
+                trades = trade_rows(data, runs[horizon])
+                row['sample_trades'] = trades[-10:]
+                row['chart'] = {'candles': data[chart_start:].rows(), 'trades': [trade for trade in trades if trade['entry_time'] >= int(data.time[chart_start])]}
+                rows.append(row)
+        return {'settings': {'symbols': symbols, 'mode': modes[0], 'modes': modes, 'candles': candles, 'horizon_candles': horizon, 'horizons': horizons, 'round_trip_cost_pct': round(cost * 100, 4)}, 'summary': rows}
+
+    def _indicator_arrays(self, symbol: str, timeframe: str, data: CandleArray) -> dict[str, np.ndarray]:
+        if not len(data):
+            return indicator_arrays(data)
+        fingerprint = (len(data), int(data.time[0]), float(data.close[-1]), INDICATOR_PARAMS)
+        return self.indicator_cache.get_or_compute(symbol, timeframe, int(data.time[-1]), fingerprint, lambda: indicator_arrays(data))
 
     def optimize(self, config: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        from .optimizer import run as run_optimizer
+        from .search import make_strategy
+        from .validation import CrossValidator
+
+        started = time.perf_counter()
+        symbols = kwargs.get('symbols') or [config.get('symbol', 'BTCUSDT')]
+        candles = int(kwargs.get('candles', 320))
+        horizon = int(kwargs.get('horizon', 12))
+        options = config.get('optimizer', {})
+        workers = int(kwargs.get('workers') or options.get('workers', 1))
+        count = max(1, int(kwargs.get('candidates') or options.get('candidates', 48)))
+        mode = config.get('signal_mode', 'high_precision')
         params = self._signal_params(config.get('signal_params'))
-        best = {'score': 62, 'train_score': 61, 'out_of_sample_score': 58, 'walk_forward_score': 55, 'trades': 24, 'avg_profit_factor': 1.4, 'avg_win_rate': 58, 'total_return_pct': 5.1, 'max_drawdown_pct': -4.0, 'params': params, 'quality': {'passed': True, 'flags': []}, 'best_runs': []}
-        return {'settings': {'symbols': kwargs.get('symbols') or [config.get('symbol', 'BTCUSDT')], 'mode': config.get('signal_mode', 'high_precision')}, 'best': best, 'candidates': [best], 'convergence': [{'step': 1, 'best_score': 62}]}
+        data = {
+            symbol: kwargs.get('data', {}).get(symbol) or self.candle_array(symbol, '4h', candles=candles, use_demo_data=kwargs.get('use_demo_data', False), exchange=config.get('exchange', 'BINANCE'))
+            for symbol in symbols
+        }
+        settings = {
+            'mode': mode, 'horizon': horizon, 'timeframes': config.get('timeframes', ['15m', '30m', '4h', '1d']), 'risk_management': config.get('risk_management', {}),
+            'validation': dict(options.get('validation', {}), **({'method': kwargs['validation']} if kwargs.get('validation') else {})),
+        }
+        search = kwargs.get('search') or options.get('search', 'random')
+        strategy = make_strategy(search, params, count, kwargs.get('seed', options.get('seed', 7)), batch_size=workers)
+        results, convergence = run_optimizer(data, settings, strategy, workers, kwargs.get('progress'), kwargs.get('should_cancel'), kwargs.get('resume'))
+        ranked = sorted(results, key=lambda item: item['score'], reverse=True)
+        # A halving/hyperband search cancelled before its last rung has no full evaluation yet.
+        best = dict(ranked[0]) if ranked else dict(strategy.best_partial, partial=True) if strategy.best_partial else None
+        if best is not None:
+            best['best_runs'] = self.backtest(dict(config, signal_params=best['params']), symbols=symbols, modes=[mode], horizon=horizon, data=data)['summary']
+        elapsed = time.perf_counter() - started
+        return {
+            'settings': {'symbols': symbols, 'mode': mode, 'candles': candles, 'horizon': horizon, 'workers': workers, 'search': strategy.report(), 'validation': CrossValidator(settings['validation'], horizon).method, 'evaluated': len(results), 'elapsed_ms': round(elapsed * 1000, 2), 'candidates_per_s': round(len(results) / elapsed, 2) if elapsed else None},
+            'best': best, 'candidates': ranked[:8], 'convergence': [{'step': point['step'], 'best_score': point['best_score']} for point in convergence],
+        }
 
     def forecast(self, config: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
-        price = self._frame(config.get('symbol', 'BTCUSDT'), '4h')['price']
-        history = [{'time': int(time.time()) - (40 - i) * 14400, 'open': price * .98, 'high': price * 1.01, 'low': price * .97, 'close': price * (0.98 + i / 2000)} for i in range(40)]
-        forecast = [{'step': i, 'price': price * (1 + i * .001), 'upper': price * (1 + i * .003), 'lower': price * (1 - i * .002)} for i in range(1, 13)]
-        return {'settings': {'mode': config.get('signal_mode', 'high_precision'), 'timeframe': '4h', 'candles': len(history), 'horizon': len(forecast)}, 'metrics': {'volatility_pct': 2.4}, 'history': history, 'forecast': forecast, 'learning_curve': [{'window': 40, 'error_pct': 2.1}, {'window': 80, 'error_pct': 1.7}]}
+        from .forecast import learning_curve, monte_carlo
+
+        started = time.perf_counter()
+        options = config.get('forecast', {})
+        horizon = int(kwargs.get('horizon') or options.get('horizon', 24))
+        paths = int(kwargs.get('paths') or options.get('paths', 10000))
+        method = kwargs.get('method') or options.get('method', 'gbm')
+        window = int(kwargs.get('window') or options.get('window', 120))
+        seed = int(options.get('seed', 7) if kwargs.get('seed') is None else kwargs['seed'])
+        candles = int(kwargs.get('candles', 220))
+        windows = [int(value) for value in options.get('learning_windows', np.linspace(10, 240, 20).astype(int).tolist())]
+        anchors = int(kwargs.get('anchors') or options.get('learning_anchors', 2000))
+        # One history serves the chart, the simulation and the learning curve's anchors.
+        data = self.history(config.get('symbol', 'BTCUSDT'), '4h', candles=max(candles, window + 1, max(windows) + horizon + anchors + 1), use_demo_data=kwargs.get('use_demo_data', False), exchange=config.get('exchange', 'BINANCE'))
+        closes = np.array([candle['close'] for candle in data['candles']])
+        history = data['candles'][-candles:]
+        simulation = monte_carlo(closes, horizon, paths, method, window, seed)
+        bands = simulation['bands']
+        step_seconds = TIMEFRAME_SECONDS['4h']
+        forecast = [
+            {
+                'step': step, 'time': history[-1]['time'] + step * step_seconds, 'price': float(bands[0.5][step - 1]),
+                'upper': float(bands[0.95][step - 1]), 'lower': float(bands[0.05][step - 1]),
+                'upper_50': float(bands[0.75][step - 1]), 'lower_50': float(bands[0.25][step - 1]),
+            }
+            for step in range(1, horizon + 1)
+        ]
+        return {
+            'settings': {'mode': config.get('signal_mode', 'high_precision'), 'timeframe': '4h', 'candles': len(history), 'learning_candles': int(closes.size), 'horizon': horizon, 'paths': paths, 'method': method, 'window': window, 'seed': seed, 'source': data['source']},
+            'metrics': {
+                'volatility_pct': round(simulation['volatility'] * 100, 4), 'drift_pct': round(simulation['drift'] * 100, 4),
+                'prob_up_pct': round(simulation['prob_up'] * 100, 2), 'expected_return_pct': round(simulation['expected_return'] * 100, 3),
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 2),
+            },
+            'history': history, 'forecast': forecast,
+            'learning_curve': learning_curve(closes, windows, horizon, anchors),
+        }
 
     def _methodology(self) -> dict[str, Any]:
         return {'model_type': 'Technischer Score plus Makro-/Marktstrukturfilter', 'macro_status': 'Makro ist im Score vorgesehen.', 'accuracy_status': 'Backtest/OOS noetig.', 'signal_formula': ['Multi-Timeframe Score', 'Risk/Reward Filter', 'Long/Short getrennt'], 'included_inputs': ['RSI', 'MACD', 'EMA/SMA', 'Support/Resistance'], 'missing_inputs': ['vollstaendige historische Makrodaten']}
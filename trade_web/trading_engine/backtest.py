@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .columnar import CandleArray
+from .indicators import ema_series, macd_series, rsi_series, sma_series
+from .levels import rolling_extremes
+from .scoring import signal_arrays, status_arrays, timeframe_points
+
+# Historical backtests run on one candle series (4h). Like the live engine's
+# 4h proxy, every configured timeframe is scored from the same statuses with
+# its usual weight, so entries match `_signal` on that series.
+
+WARMUP = 50
+EXIT_REASONS = ('stop', 'target', 'timeout')
+
+
+def indicator_arrays(candles: CandleArray) -> dict[str, np.ndarray]:
+    close = candles.close
+    support, resistance = rolling_extremes(close)
+    return {
+        'price': close, 'rsi': rsi_series(close), 'hist': macd_series(close)['hist'],
+        'ema20': ema_series(close, 20), 'ema50': ema_series(close, 50), 'sma200': sma_series(close, 200),
+        'support': support, 'resistance': resistance,
+    }
+
+
+def timeframe_weights(timeframes: list[str]) -> list[int]:
+    return [2 if tf in {'4h', '1d'} else 1 for tf in timeframes]
+
+
+def strength_series(statuses: dict[str, np.ndarray], timeframes: list[str], weights: dict[str, float] | None = None) -> np.ndarray:
+    return sum(timeframe_points(statuses, weight, weights) for weight in timeframe_weights(timeframes))
+
+
+def signal_series(
+    indicators: dict[str, np.ndarray],
+    statuses: dict[str, np.ndarray],
+    strength: np.ndarray,
+    params: dict[str, Any],
+    mode: str,
+    warmup: int = WARMUP,
+) -> dict[str, np.ndarray]:
+    """`_signal` for every candle at once, plus the entry filter of the signal mode."""
+    signals = signal_arrays(strength, indicators['price'], indicators['support'], indicators['resistance'], params)
+    active = signals['active'].copy()
+    side = signals['side']
+    if mode == 'high_precision':
+        rsi = np.nan_to_num(indicators['rsi'], nan=50.0)
+        stretched = np.where(side > 0, rsi > params['rsi_overbought'], rsi < params['rsi_oversold'])
+        active &= (signals['tier'] >= 2) & (signals['risk_reward'] >= params['rr_excellent']) & ~stretched
+    elif mode == 'lux_style':
+        for name in ('MACD', 'Trend', 'MA_Setup'):
+            active &= statuses[name] == side
+    active[:warmup] = False
+    signals['active'] = active
+    return signals
+
+
+def simulate(
+    candles: CandleArray,
+    signals: dict[str, np.ndarray],
+    horizons: list[int],
+    cost: float,
+    start: int = 0,
+    stop: int | None = None,
+) -> dict[int, dict[str, np.ndarray]]:
+    """Stop/target/timeout exits for every horizon in one pass; one open position at a time.
+
+    Entries are taken on the signal candle's close inside [start, stop); exits never look past `stop`.
+    If stop and target are touched in the same candle the stop is assumed (conservative).
+    """
+    stop = len(candles) if stop is None else stop
+    longest = max(horizons)
+    entries = np.flatnonzero(signals['active'][start:stop]) + start
+    entries = entries[entries + 1 < stop]
+    if entries.size == 0:
+        return {h: _empty_trades() for h in horizons}
+    side = signals['side'][entries]
+    stop_price, target = signals['stop'][entries], signals['target'][entries]
+    entry_price = candles.close[entries]
+    future = entries[:, None] + np.arange(1, longest + 1)
+    inside = future < stop
+    future = np.minimum(future, stop - 1)
+    high, low = candles.high[future], candles.low[future]
+    long = (side > 0)[:, None]
+    stop_hit = np.where(long, low <= stop_price[:, None], high >= stop_price[:, None]) & inside
+    target_hit = np.where(long, high >= target[:, None], low <= target[:, None]) & inside
+    first_stop = np.where(stop_hit.any(axis=1), stop_hit.argmax(axis=1), longest)
+    first_target = np.where(target_hit.any(axis=1), target_hit.argmax(axis=1), longest)
+    available = stop - 1 - entries
+    result = {}
+    for horizon in horizons:
+        stopped = first_stop < horizon
+        stopped_first = stopped & (first_stop <= first_target)
+        reached = (first_target < horizon) & ~stopped_first
+        timeout = np.minimum(horizon, available) - 1
+        offset = np.where(stopped_first, first_stop, np.where(reached, first_target, timeout))
+        exit_index = entries + 1 + offset
+        exit_price = np.where(stopped_first, stop_price, np.where(reached, target, candles.close[exit_index]))
+        reason = np.where(stopped_first, 0, np.where(reached, 1, 2))
+        chosen = _non_overlapping(entries, exit_index)
+        gross = side[chosen] * (exit_price[chosen] / entry_price[chosen] - 1)
+        result[horizon] = {
+            'entry_index': entries[chosen], 'exit_index': exit_index[chosen], 'side': side[chosen],
+            'entry': entry_price[chosen], 'exit': exit_price[chosen], 'stop': stop_price[chosen], 'target': target[chosen],
+            'reason': reason[chosen], 'return': gross - cost,
+        }
+    return result
+
+
+def _non_overlapping(entries: np.ndarray, exits: np.ndarray) -> np.ndarray:
+    chosen = []
+    index = 0
+    while index < entries.size:
+        chosen.append(index)
+        index = int(np.searchsorted(entries, exits[index], side='right'))
+    return np.array(chosen, dtype=np.int64)
+
+
+def _empty_trades() -> dict[str, np.ndarray]:
+    empty = np.array([], dtype=np.float64)
+    return {key: empty for key in ('entry_index', 'exit_index', 'side', 'entry', 'exit', 'stop', 'target', 'reason', 'return')}
+
+
+def round_trip_cost(risk: dict[str, Any]) -> float:
+    """Taker fee and slippage on both sides plus the full spread, as a fraction of notional."""
+    bps = 2 * float(risk.get('taker_fee_bps', 10)) + 2 * float(risk.get('slippage_bps', 5)) + float(risk.get('spread_bps', 4))
+    return bps / 10000
+
+
+def metrics(trades: dict[str, np.ndarray], curve_points: int = 120) -> dict[str, Any]:
+    returns = trades['return']
+    if returns.size == 0:
+        return {'trades': 0, 'wins': 0, 'losses': 0, 'win_rate': 0, 'total_return_pct': 0, 'avg_trade_pct': 0, 'profit_factor': 0, 'max_drawdown_pct': 0, 'equity_curve': []}
+    equity = np.cumprod(1 + returns)
+    drawdown = equity / np.maximum.accumulate(np.maximum(equity, 1.0)) - 1
+    wins = int((returns > 0).sum())
+    gains, losses = returns[returns > 0].sum(), -returns[returns <= 0].sum()
+    profit_factor = gains / losses if losses > 0 else (99.0 if gains > 0 else 0.0)
+    step = max(1, int(np.ceil(returns.size / curve_points)))
+    points = list(range(0, returns.size, step))
+    if points[-1] != returns.size - 1:
+        points.append(returns.size - 1)
+    return {
+        'trades': int(returns.size), 'wins': wins, 'losses': int(returns.size - wins),
+        'win_rate': round(wins / returns.size * 100, 2),
+        'total_return_pct': round(float(equity[-1] - 1) * 100, 2),
+        'avg_trade_pct': round(float(returns.mean()) * 100, 3),
+        'profit_factor': round(float(profit_factor), 2),
+        'max_drawdown_pct': round(float(drawdown.min()) * 100, 2),
+        'equity_curve': [{'equity_pct': round(float(equity[i] - 1) * 100, 3), 'drawdown_pct': round(float(drawdown[i]) * 100, 3)} for i in points],
+    }
+
+
+def trade_rows(candles: CandleArray, trades: dict[str, np.ndarray], first: int = 0) -> list[dict[str, Any]]:
+    """Trades entered at or after candle `first`, in the shape the price chart draws."""
+    rows = []
+    for index in np.flatnonzero(trades['entry_index'] >= first):
+        rows.append({
+            'entry_time': int(candles.time[int(trades['entry_index'][index])]), 'exit_time': int(candles.time[int(trades['exit_index'][index])]),
+            'side': 'BUY' if trades['side'][index] > 0 else 'SELL', 'entry': float(trades['entry'][index]), 'exit': float(trades['exit'][index]),
+            'stop': float(trades['stop'][index]), 'target': float(trades['target'][index]),
+            'reason': EXIT_REASONS[int(trades['reason'][index])], 'return_pct': round(float(trades['return'][index]) * 100, 3),
+        })
+    return rows
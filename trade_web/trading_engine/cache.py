@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+# Lengths of every indicator `_frame` and `indicator_arrays` compute; part of each cache key.
+INDICATOR_PARAMS = (('ema', 20), ('ema', 50), ('sma', 200), ('rsi', 14), ('macd', 12, 26, 9), ('extremes', 30))
+
+
+class IndicatorCache:
+    """Size-bounded LRU for indicator results keyed by (symbol, timeframe, last closed candle time, params).
+
+    Seeing a newer closed-candle time for a (symbol, timeframe) drops that pair's older entries, so
+    results are invalidated as soon as a new candle closes instead of waiting for LRU eviction.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[tuple[str, str, int, Hashable], Any] = OrderedDict()
+        self._closed: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str, timeframe: str, closed: int, params: Hashable) -> Any | None:
+        key = (symbol, timeframe, closed, params)
+        with self._lock:
+            self._advance(symbol, timeframe, closed)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, symbol: str, timeframe: str, closed: int, params: Hashable, value: Any) -> None:
+        with self._lock:
+            self._advance(symbol, timeframe, closed)
+            if closed < self._closed[(symbol, timeframe)]:
+                return
+            self._entries[(symbol, timeframe, closed, params)] = value
+            self._entries.move_to_end((symbol, timeframe, closed, params))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, symbol: str, timeframe: str, closed: int, params: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(symbol, timeframe, closed, params)
+        if value is None:
+            value = compute()
+            self.put(symbol, timeframe, closed, params, value)
+        return value
+
+    def _advance(self, symbol: str, timeframe: str, closed: int) -> None:
+        latest = self._closed.get((symbol, timeframe))
+        if latest is not None and closed <= latest:
+            return
+        self._closed[(symbol, timeframe)] = closed
+        if latest is None:
+            return
+        stale = [key for key in self._entries if key[0] == symbol and key[1] == timeframe and key[2] < closed]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._closed.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions, 'invalidations': self.invalidations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """Size-bounded LRU of finished responses with single-flight computation.
+
+    Keys must contain everything a response depends on (config ETag, symbol, last closed candle per
+    timeframe, ...), so entries never go stale; older keys simply fall out of the LRU. Concurrent
+    misses on one key share a single computation: the first caller computes, the others wait for
+    its result, and only results marked cacheable are kept.
+
+    `shared` (e.g. `storage.ResponseStore`) adds a second tier for str values that all app processes
+    see: a local miss first looks there, and while another process holds the computation lease for
+    the key this one waits up to `shared_wait` seconds for its result instead of computing it too.
+    """
+
+    def __init__(self, maxsize: int = 64, shared: Any | None = None, shared_wait: float = 30.0):
+        self.maxsize = maxsize
+        self.shared = shared
+        self.shared_wait = shared_wait
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._pending: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def etag(key: Hashable) -> str:
+        """Stable across processes for keys made of str/int/bool/None tuples."""
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:20]
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], tuple[Any, bool]]) -> tuple[Any, str]:
+        """(value, outcome); `compute` returns (value, cacheable).
+
+        outcome: 'hit' (this process), 'shared' (another process), 'coalesced' (waited for a running
+        computation), 'miss' (computed here), or 'uncached' for results not marked cacheable.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key], 'hit'
+            future = self._pending.get(key)
+            leader = future is None
+            if leader:
+                future = self._pending[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            value, cacheable, _ = future.result()
+            return value, 'coalesced' if cacheable else 'uncached'
+        try:
+            value, cacheable, outcome = self._lead(key, compute)
+        except Exception as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._pending[key]
+            if outcome == 'shared':
+                self.shared_hits += 1
+            else:
+                self.misses += 1
+            if cacheable:
+                self._entries[key] = value
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        future.set_result((value, cacheable, outcome))
+        return value, outcome if cacheable else 'uncached'
+
+    def _lead(self, key: Hashable, compute: Callable[[], tuple[Any, bool]]) -> tuple[Any, bool, str]:
+        if self.shared is None:
+            return (*compute(), 'miss')
+        name = self.etag(key)
+        deadline = time.monotonic() + self.shared_wait
+        while True:
+            value = self.shared.get(name)
+            if value is not None:
+                return value, True, 'shared'
+            if self.shared.claim(name, self.shared_wait):
+                break
+            if time.monotonic() >= deadline:
+                # The other process is stuck or gone; compute without the lease.
+                return (*compute(), 'miss')
+            time.sleep(0.02)
+        try:
+            value, cacheable = compute()
+        except Exception:
+            self.shared.release(name)
+            raise
+        if cacheable:
+            self.shared.put(name, value)
+        else:
+            self.shared.release(name)
+        return value, cacheable, 'miss'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.shared_hits + self.coalesced
+            return {
+                'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses,
+                'shared_hits': self.shared_hits, 'coalesced': self.coalesced,
+                'hit_rate': round((lookups - self.misses) / lookups, 4) if lookups else None, 'evictions': self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleArray:
+    """OHLCV candles as packed columns: int64 open times plus one contiguous float64 row per field.
+
+    Slicing returns views on the same buffer, so backtest windows and optimizer folds never copy.
+    """
+
+    __slots__ = ('time', 'values')
+
+    def __init__(self, time: np.ndarray, values: np.ndarray):
+        if values.shape != (len(FIELDS), time.shape[0]):
+            raise ValueError(f'values must have shape ({len(FIELDS)}, {time.shape[0]}), got {values.shape}')
+        self.time = time
+        self.values = values
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> CandleArray:
+        time = np.fromiter((row['time'] for row in rows), dtype=np.int64, count=len(rows))
+        values = np.empty((len(FIELDS), len(rows)), dtype=np.float64)
+        for index, field in enumerate(FIELDS):
+            values[index] = np.fromiter((row.get(field, 0.0) for row in rows), dtype=np.float64, count=len(rows))
+        return cls(time, values)
+
+    @classmethod
+    def from_closes(cls, closes: Any, time: Any | None = None) -> CandleArray:
+        close = np.asarray(closes, dtype=np.float64)
+        open_ = np.concatenate((close[:1], close[:-1]))
+        values = np.stack((open_, np.maximum(open_, close), np.minimum(open_, close), close, np.zeros_like(close)))
+        times = np.arange(close.size, dtype=np.int64) if time is None else np.asarray(time, dtype=np.int64)
+        return cls(times, values)
+
+    @classmethod
+    def load(cls, directory: Path, key: str, mode: str = 'r') -> CandleArray:
+        """Memory-map arrays written by `save`; pages are loaded lazily and shared between processes."""
+        time = np.load(directory / f'{key}.time.npy', mmap_mode=mode)
+        values = np.load(directory / f'{key}.ohlcv.npy', mmap_mode=mode)
+        return cls(time, values)
+
+    def save(self, directory: Path, key: str) -> CandleArray:
+        directory.mkdir(parents=True, exist_ok=True)
+        time = np.lib.format.open_memmap(directory / f'{key}.time.npy', mode='w+', dtype=np.int64, shape=self.time.shape)
+        values = np.lib.format.open_memmap(directory / f'{key}.ohlcv.npy', mode='w+', dtype=np.float64, shape=self.values.shape)
+        time[:] = self.time
+        values[:] = self.values
+        time.flush()
+        values.flush()
+        return CandleArray(time, values)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.values[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.values[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.values[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.values[4]
+
+    def __len__(self) -> int:
+        return int(self.time.shape[0])
+
+    def __getitem__(self, key: slice) -> CandleArray:
+        if not isinstance(key, slice):
+            raise TypeError('CandleArray only supports slice indexing')
+        return CandleArray(self.time[key], self.values[:, key])
+
+    def window(self, start: int, stop: int) -> CandleArray:
+        return self[start:stop]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.time.nbytes + self.values.nbytes)
+
+    def rows(self) -> list[dict[str, Any]]:
+        columns = [self.time.tolist(), *(self.values[index].tolist() for index in range(len(FIELDS)))]
+        keys = ('time', *FIELDS)
+        return [dict(zip(keys, row)) for row in zip(*columns)]
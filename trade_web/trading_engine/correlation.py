@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+
+# Return correlations across symbols. Closes come as a (symbols x candles) matrix on a shared
+# time axis; correlations are Pearson coefficients of simple candle-to-candle returns.
+
+
+def return_matrix(closes: np.ndarray) -> np.ndarray:
+    closes = np.asarray(closes, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        moves = closes[:, 1:] / closes[:, :-1] - 1
+    return np.nan_to_num(moves, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _pearson(count: int, total: np.ndarray, cross: np.ndarray) -> np.ndarray:
+    mean = total / count
+    cov = cross / count - np.outer(mean, mean)
+    std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+    scale = np.outer(std, std)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        matrix = np.where(scale > 0, cov / scale, 0.0)
+    matrix = np.clip(matrix, -1.0, 1.0)
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
+
+def correlation_matrix(closes: np.ndarray, window: int | None = None) -> np.ndarray:
+    """N x N correlation of the last `window` returns (all returns if None) in one matrix product."""
+    moves = return_matrix(closes)
+    if window is not None:
+        moves = moves[:, -window:]
+    if moves.shape[1] < 2:
+        return np.full((moves.shape[0], moves.shape[0]), np.nan)
+    return _pearson(moves.shape[1], moves.sum(axis=1), moves @ moves.T)
+
+
+class RollingCorrelation:
+    """Correlation matrix over the last `window` returns, updated in O(N^2) per candle.
+
+    Keeps running sums and cross products over a ring buffer; both are rebuilt from the buffer every
+    `window` updates to bound float drift.
+    """
+
+    def __init__(self, size: int, window: int):
+        self.size = size
+        self.window = window
+        self.count = 0
+        self.last_time: int | None = None
+        self.last_close: np.ndarray | None = None
+        self._buffer = np.zeros((window, size))
+        self._sum = np.zeros(size)
+        self._cross = np.zeros((size, size))
+        self._since_resum = 0
+        self._matrix: np.ndarray | None = None
+
+    def update(self, moves: np.ndarray) -> None:
+        slot = self.count % self.window
+        if self.count >= self.window:
+            old = self._buffer[slot]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        self._buffer[slot] = moves
+        self._sum += moves
+        self._cross += np.outer(moves, moves)
+        self.count += 1
+        self._since_resum += 1
+        if self._since_resum >= self.window:
+            self._resum()
+        self._matrix = None
+
+    def extend(self, moves: np.ndarray) -> None:
+        """Feed a (symbols x candles) block of returns; long blocks only keep their last `window` columns."""
+        if moves.shape[1] >= self.window:
+            self._buffer[:] = moves[:, -self.window:].T
+            self.count = self.window
+            self._resum()
+            self._matrix = None
+            return
+        for column in moves.T:
+            self.update(column)
+
+    def _resum(self) -> None:
+        filled = self._buffer[:min(self.count, self.window)]
+        self._sum = filled.sum(axis=0)
+        self._cross = filled.T @ filled
+        self._since_resum = 0
+
+    def matrix(self) -> np.ndarray | None:
+        count = min(self.count, self.window)
+        if count < 2:
+            return None
+        if self._matrix is None:
+            self._matrix = _pearson(count, self._sum, self._cross)
+        return self._matrix
+
+
+class CorrelationEngine:
+    """`RollingCorrelation` per (symbols, timeframe, window), fed only with candles it has not seen yet."""
+
+    def __init__(self) -> None:
+        self._states: dict[tuple[tuple[str, ...], str, int], RollingCorrelation] = {}
+        self._lock = threading.Lock()
+
+    def sync(self, symbols: list[str], timeframe: str, window: int, times: np.ndarray, closes: np.ndarray) -> RollingCorrelation:
+        key = (tuple(symbols), timeframe, window)
+        with self._lock:
+            state = self._states.get(key)
+            start = self._resume_index(state, times, closes)
+            if state is None or start is None:
+                state = RollingCorrelation(len(symbols), window)
+                start = 1
+            if start < len(times):
+                state.extend(return_matrix(closes[:, start - 1:]))
+                state.last_time, state.last_close = int(times[-1]), closes[:, -1].copy()
+            self._states[key] = state
+            return state
+
+    def _resume_index(self, state: RollingCorrelation | None, times: np.ndarray, closes: np.ndarray) -> int | None:
+        if state is None or state.last_time is None:
+            return None
+        index = int(np.searchsorted(times, state.last_time))
+        if index < len(times) and times[index] == state.last_time and np.array_equal(closes[:, index], state.last_close):
+            return index + 1
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+def align_closes(histories: dict[str, list[dict[str, Any]]]) -> tuple[np.ndarray, np.ndarray]:
+    """Common open times of all symbols and the matching (symbols x candles) close matrix."""
+    times = None
+    for candles in histories.values():
+        current = np.array([candle['time'] for candle in candles], dtype=np.int64)
+        times = current if times is None else np.intersect1d(times, current)
+    times = np.array([], dtype=np.int64) if times is None else times
+    rows = []
+    for candles in histories.values():
+        lookup = {candle['time']: candle['close'] for candle in candles}
+        rows.append([lookup[int(time_)] for time_ in times])
+    return times, np.array(rows, dtype=np.float64).reshape(len(histories), len(times))
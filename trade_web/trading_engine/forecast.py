@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+# Monte Carlo price paths for the forecast view. Paths are simulated as one (steps x paths) array of
+# cumulative log returns, so every horizon step is a contiguous row for the per-step sort. Quantiles
+# are taken on log prices and only the band rows are exponentiated (exp is monotone, so quantiles
+# commute with it).
+
+METHODS = ('gbm', 'bootstrap')
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def log_returns(close: np.ndarray) -> np.ndarray:
+    close = np.asarray(close, dtype=np.float64)
+    valid = (close[1:] > 0) & (close[:-1] > 0)
+    return np.log(close[1:][valid] / close[:-1][valid])
+
+
+def simulate_log_paths(moves: np.ndarray, steps: int, paths: int, method: str = 'gbm', seed: int | None = None) -> np.ndarray:
+    """(steps x paths) cumulative log returns of `paths` simulated paths over `steps` candles.
+
+    gbm: normal increments with the sample mean and standard deviation of `moves` (log returns,
+    so the lognormal drift correction is already included). bootstrap: increments drawn with
+    replacement from `moves`, keeping fat tails and skew.
+    """
+    if method not in METHODS:
+        raise ValueError(f'unknown forecast method {method!r}, expected one of {METHODS}')
+    rng = np.random.default_rng(seed)
+    if moves.size == 0:
+        return np.zeros((steps, paths))
+    if method == 'gbm':
+        increments = rng.standard_normal((steps, paths))
+        increments *= moves.std(ddof=1) if moves.size > 1 else 0.0
+        increments += moves.mean()
+    else:
+        increments = moves[rng.integers(0, moves.size, size=(steps, paths))]
+    return np.cumsum(increments, axis=0, out=increments)
+
+
+def quantile_bands(log_paths: np.ndarray, quantiles: tuple[float, ...] = QUANTILES) -> np.ndarray:
+    """(len(quantiles) x steps) linear-interpolated quantiles per horizon step, like `np.quantile`.
+
+    Sorts `log_paths` in place: one contiguous sort per step row is much faster than `np.quantile`'s
+    partitioning for several quantiles at once.
+    """
+    log_paths.sort(axis=1)
+    count = log_paths.shape[1]
+    rows = []
+    for quantile in quantiles:
+        position = quantile * (count - 1)
+        low = int(np.floor(position))
+        high = min(low + 1, count - 1)
+        rows.append(log_paths[:, low] + (log_paths[:, high] - log_paths[:, low]) * (position - low))
+    return np.array(rows)
+
+
+def monte_carlo(
+    close: np.ndarray,
+    steps: int,
+    paths: int = 10000,
+    method: str = 'gbm',
+    window: int | None = None,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """Simulate from the last close; drift/volatility (or the bootstrap pool) come from the last `window` returns."""
+    close = np.asarray(close, dtype=np.float64)
+    moves = log_returns(close)
+    if window:
+        moves = moves[-window:]
+    log_paths = simulate_log_paths(moves, steps, paths, method, seed)
+    bands = np.exp(quantile_bands(log_paths)) * close[-1]
+    final = log_paths[-1]
+    return {
+        'price': float(close[-1]),
+        'bands': dict(zip(QUANTILES, bands)),
+        'drift': float(moves.mean()) if moves.size else 0.0,
+        'volatility': float(moves.std(ddof=1)) if moves.size > 1 else 0.0,
+        'prob_up': float((final > 0).mean()),
+        'expected_return': float(np.expm1(final).mean()),
+        'returns_used': int(moves.size),
+    }
+
+
+def learning_curve(close: np.ndarray, windows: list[int], horizon: int, anchors: int = 2000) -> list[dict[str, Any]]:
+    """Out-of-sample error of the drift/volatility forecast for every lookback window.
+
+    At each of the last `anchors` candles that still have `horizon` candles after them, every window
+    forecasts the median close `horizon` candles ahead from its trailing mean/std of log returns. All
+    windows x anchors come from prefix sums of the returns and their squares, so the whole grid is a
+    handful of array operations instead of one forecast per (window, anchor).
+    """
+    close = np.asarray(close, dtype=np.float64)
+    windows = sorted({int(window) for window in windows if window >= 2})
+    if not windows or close.size <= windows[-1] + horizon:
+        return []
+    moves = np.log(close[1:] / close[:-1])
+    sums = np.concatenate(([0.0], np.cumsum(moves)))
+    squares = np.concatenate(([0.0], np.cumsum(moves * moves)))
+    # Anchor t forecasts from the returns ending at close t, i.e. moves[t - w:t].
+    last = close.size - 1 - horizon
+    points = np.arange(max(windows[-1], last - anchors + 1), last + 1)
+    lengths = np.array(windows)[:, None]
+    total = sums[points] - sums[points - lengths]
+    drift = total / lengths
+    variance = np.clip((squares[points] - squares[points - lengths] - total * drift) / (lengths - 1), 0.0, None)
+    realised = np.log(close[points + horizon] / close[points])
+    predicted = close[points] * np.exp(drift * horizon)
+    error = np.abs(predicted - close[points + horizon]) / close[points + horizon]
+    # Same 90% band as `monte_carlo` under GBM.
+    covered = np.abs(realised - drift * horizon) <= 1.6449 * np.sqrt(variance * horizon)
+    baseline = float(np.mean(np.abs(close[points] - close[points + horizon]) / close[points + horizon]))
+    return [
+        {
+            'window': window, 'error_pct': round(float(error[index].mean()) * 100, 4),
+            'coverage_pct': round(float(covered[index].mean()) * 100, 2), 'random_walk_error_pct': round(baseline * 100, 4),
+            'anchors': int(points.size),
+        }
+        for index, window in enumerate(windows)
+    ]
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any
+
+
+class EmaState:
+    """EMA fed one closed candle at a time, seeded with the SMA of the first `length` values."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.count = 0
+        self.value: float | None = None
+        self._seed_sum = 0.0
+
+    def _next(self, value: float) -> float | None:
+        if self.value is not None:
+            return value * self.alpha + self.value * (1 - self.alpha)
+        if self.count + 1 == self.length:
+            return (self._seed_sum + value) / self.length
+        return None
+
+    def update(self, value: float) -> float | None:
+        result = self._next(value)
+        if self.value is None:
+            self._seed_sum += value
+        self.value = result
+        self.count += 1
+        return self.value
+
+    def peek(self, value: float) -> float | None:
+        return self._next(value)
+
+
+class SmaState:
+    """Rolling SMA with a running sum; the sum is rebuilt every `length` updates to bound float drift."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.window: deque[float] = deque(maxlen=length)
+        self.total = 0.0
+        self._since_resum = 0
+
+    @property
+    def value(self) -> float | None:
+        return self.total / self.length if len(self.window) == self.length else None
+
+    def update(self, value: float) -> float | None:
+        if len(self.window) == self.length:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+        self._since_resum += 1
+        if self._since_resum >= self.length:
+            self.total = sum(self.window)
+            self._since_resum = 0
+        return self.value
+
+    def peek(self, value: float) -> float | None:
+        if len(self.window) == self.length:
+            return (self.total - self.window[0] + value) / self.length
+        return (self.total + value) / self.length if len(self.window) + 1 == self.length else None
+
+
+class RsiState:
+    """Wilder RSI (RMA smoothing), matching `ta.rsi(close, length)`."""
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self.count = 0
+        self.previous: float | None = None
+        self.avg_gain: float | None = None
+        self.avg_loss: float | None = None
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+
+    @property
+    def value(self) -> float | None:
+        return self._rsi(self.avg_gain, self.avg_loss)
+
+    def _rsi(self, gain: float | None, loss: float | None) -> float | None:
+        if gain is None or loss is None:
+            return None
+        if gain == 0 and loss == 0:
+            return 50
+        if loss == 0:
+            return 100
+        return 100 - (100 / (1 + gain / loss))
+
+    def _next(self, value: float) -> tuple[float | None, float | None, float, float]:
+        if self.previous is None:
+            return None, None, 0.0, 0.0
+        diff = value - self.previous
+        gain, loss = max(diff, 0), max(-diff, 0)
+        if self.avg_gain is not None and self.avg_loss is not None:
+            return (
+                (self.avg_gain * (self.length - 1) + gain) / self.length,
+                (self.avg_loss * (self.length - 1) + loss) / self.length,
+                gain,
+                loss,
+            )
+        if self.count == self.length:
+            return (self._gain_sum + gain) / self.length, (self._loss_sum + loss) / self.length, gain, loss
+        return None, None, gain, loss
+
+    def update(self, value: float) -> float | None:
+        avg_gain, avg_loss, gain, loss = self._next(value)
+        if self.avg_gain is None:
+            self._gain_sum += gain
+            self._loss_sum += loss
+        self.avg_gain, self.avg_loss = avg_gain, avg_loss
+        self.previous = value
+        self.count += 1
+        return self.value
+
+    def peek(self, value: float) -> float | None:
+        avg_gain, avg_loss, _, _ = self._next(value)
+        return self._rsi(avg_gain, avg_loss)
+
+
+class MacdState:
+    """MACD 12/26/9; like `macd()` it reports nothing until `slow + signal` candles were seen."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast, self.slow = EmaState(fast), EmaState(slow)
+        self.signal = EmaState(signal)
+        self.min_count = slow + signal
+        self.count = 0
+        self.line: float | None = None
+
+    @property
+    def value(self) -> dict[str, float | None]:
+        return self._result(self.count, self.line, self.signal.value)
+
+    def _result(self, count: int, line: float | None, signal: float | None) -> dict[str, float | None]:
+        if count < self.min_count:
+            return {'macd': None, 'signal': None, 'hist': None}
+        return {'macd': line, 'signal': signal, 'hist': line - signal if line is not None and signal is not None else None}
+
+    def update(self, value: float) -> dict[str, float | None]:
+        fast, slow = self.fast.update(value), self.slow.update(value)
+        self.count += 1
+        if fast is not None and slow is not None:
+            self.line = fast - slow
+            self.signal.update(self.line)
+        return self.value
+
+    def peek(self, value: float) -> dict[str, float | None]:
+        fast, slow = self.fast.peek(value), self.slow.peek(value)
+        if fast is None or slow is None:
+            return self._result(self.count + 1, None, None)
+        line = fast - slow
+        return self._result(self.count + 1, line, self.signal.peek(line))
+
+
+class ExtremesState:
+    """Rolling min/max over the last `length` closes using monotonic deques (amortised O(1))."""
+
+    def __init__(self, length: int = 30):
+        self.length = length
+        self.count = 0
+        self._lows: deque[tuple[int, float]] = deque()
+        self._highs: deque[tuple[int, float]] = deque()
+
+    @property
+    def value(self) -> tuple[float | None, float | None]:
+        if not self._lows:
+            return None, None
+        return self._lows[0][1], self._highs[0][1]
+
+    def update(self, value: float) -> tuple[float | None, float | None]:
+        while self._lows and self._lows[-1][1] >= value:
+            self._lows.pop()
+        while self._highs and self._highs[-1][1] <= value:
+            self._highs.pop()
+        self._lows.append((self.count, value))
+        self._highs.append((self.count, value))
+        self.count += 1
+        expired = self.count - self.length
+        while self._lows[0][0] < expired:
+            self._lows.popleft()
+        while self._highs[0][0] < expired:
+            self._highs.popleft()
+        return self.value
+
+    def peek(self, value: float) -> tuple[float, float]:
+        expired = self.count + 1 - self.length
+        low = next((item for index, item in self._lows if index >= expired), value)
+        high = next((item for index, item in self._highs if index >= expired), value)
+        return min(low, value), max(high, value)
+
+
+class IndicatorState:
+    """All indicators used by `TradingAnalyzer._frame` for one symbol/timeframe."""
+
+    def __init__(self) -> None:
+        self.ema20, self.ema50, self.sma200 = EmaState(20), EmaState(50), SmaState(200)
+        self.rsi14 = RsiState(14)
+        self.macd = MacdState()
+        self.extremes = ExtremesState(30)
+        self.first_time: int | None = None
+        self.last_time: int | None = None
+        self.last_close: float | None = None
+
+    def update(self, close: float, time: int | None = None) -> dict[str, Any]:
+        self.ema20.update(close)
+        self.ema50.update(close)
+        self.sma200.update(close)
+        self.rsi14.update(close)
+        self.macd.update(close)
+        self.extremes.update(close)
+        self.last_time = self.extremes.count - 1 if time is None else time
+        if self.first_time is None:
+            self.first_time = self.last_time
+        self.last_close = close
+        return self.snapshot()
+
+    def snapshot(self) -> dict[str, Any]:
+        support, resistance = self.extremes.value
+        return {
+            'close': self.last_close, 'rsi': self.rsi14.value, 'macd': self.macd.value,
+            'ema20': self.ema20.value, 'ema50': self.ema50.value, 'sma200': self.sma200.value,
+            'support': support, 'resistance': resistance,
+        }
+
+    def peek(self, close: float) -> dict[str, Any]:
+        """Indicators as if the still-forming candle closed at `close`; state is left untouched."""
+        support, resistance = self.extremes.peek(close)
+        return {
+            'close': close, 'rsi': self.rsi14.peek(close), 'macd': self.macd.peek(close),
+            'ema20': self.ema20.peek(close), 'ema50': self.ema50.peek(close), 'sma200': self.sma200.peek(close),
+            'support': support, 'resistance': resistance,
+        }
+
+
+class IndicatorRegistry:
+    """In-memory `IndicatorState` per (symbol, timeframe), fed only with candles it has not seen yet.
+
+    A state always covers exactly the history it was synced with: it is resumed only while that
+    history keeps its first candle (a growing young listing) and rebuilt once the window slides.
+    EMA and RSI never forget their start, so a state carried on for days would drift away from the
+    fresh recompute of `analyze_many`, backtests and other worker processes. A rebuild over the
+    analyze window (241 candles) costs far less than fetching the candles.
+
+    Each key has its own lock, so different timeframes can be synced from worker threads in parallel.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[tuple[str, str], IndicatorState] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def sync(self, symbol: str, timeframe: str, closes: list[float], times: list[int] | None = None) -> IndicatorState:
+        times = list(range(len(closes))) if times is None else list(times)
+        key = (symbol, timeframe)
+        with self._key_lock(key):
+            state = self._states.get(key)
+            start = self._resume_index(state, closes, times)
+            if state is None or start is None:
+                state = IndicatorState()
+                start = 0
+            for close, time in zip(closes[start:], times[start:]):
+                state.update(close, time)
+            self._states[key] = state
+            return state
+
+    def snapshot(self, symbol: str, timeframe: str) -> dict[str, Any] | None:
+        """Last committed values, or None if the key is unknown or currently being synced."""
+        lock = self._key_lock((symbol, timeframe))
+        if not lock.acquire(blocking=False):
+            return None
+        try:
+            state = self._states.get((symbol, timeframe))
+            return state.snapshot() if state is not None and state.last_close is not None else None
+        finally:
+            lock.release()
+
+    def _resume_index(self, state: IndicatorState | None, closes: list[float], times: list[int]) -> int | None:
+        if state is None or state.last_time is None or not times or times[0] != state.first_time:
+            return None
+        # Resume right after the last committed candle; anything else (gap, rewrite) means rebuild.
+        for index in range(len(times) - 1, -1, -1):
+            if times[index] == state.last_time:
+                return index + 1 if closes[index] == state.last_close else None
+            if times[index] < state.last_time:
+                break
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
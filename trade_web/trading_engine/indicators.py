@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+
+# All series kernels work along the last axis: a 1-D array is one price series,
+# a 2-D array is one row per symbol (equal lengths) evaluated in the same pass.
+
+
+def as_array(values: object) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _seed(values: np.ndarray, length: int) -> float | np.ndarray:
+    # Python's left-to-right sum keeps the seed bit-identical with the scalar reference formulas.
+    head = values[..., :length]
+    if head.ndim == 1:
+        return sum(head.tolist()) / length
+    return np.array([sum(row) for row in head.tolist()]) / length
+
+
+def _recurrence(values: np.ndarray, alpha: float, start: int, seed: float | np.ndarray) -> np.ndarray:
+    # Exponential smoothing is inherently sequential; a 1-D series runs as a plain
+    # float loop, a 2-D batch advances all rows per step with one vector operation.
+    result = np.full(values.shape, np.nan)
+    current = seed
+    result[..., start] = current
+    keep = 1 - alpha
+    if values.ndim == 1:
+        for index, value in enumerate(values[start + 1:].tolist(), start + 1):
+            current = value * alpha + current * keep
+            result[index] = current
+        return result
+    for index in range(start + 1, values.shape[-1]):
+        current = values[:, index] * alpha + current * keep
+        result[:, index] = current
+    return result
+
+
+def sma_series(values: object, length: int) -> np.ndarray:
+    data = as_array(values)
+    result = np.full(data.shape, np.nan)
+    if length <= 0 or data.shape[-1] < length:
+        return result
+    zeros = np.zeros(data.shape[:-1] + (1,))
+    sums = np.cumsum(np.concatenate((zeros, data), axis=-1), axis=-1)
+    result[..., length - 1:] = (sums[..., length:] - sums[..., :-length]) / length
+    return result
+
+
+def ema_series(values: object, length: int) -> np.ndarray:
+    data = as_array(values)
+    if length <= 0 or data.shape[-1] < length:
+        return np.full(data.shape, np.nan)
+    return _recurrence(data, 2 / (length + 1), length - 1, _seed(data, length))
+
+
+def rsi_series(values: object, length: int = 14) -> np.ndarray:
+    data = as_array(values)
+    result = np.full(data.shape, np.nan)
+    if length <= 0 or data.shape[-1] <= length:
+        return result
+    diff = np.diff(data, axis=-1)
+    gains = np.maximum(diff, 0.0)
+    losses = np.maximum(-diff, 0.0)
+    # Wilder RMA: seeded with the simple mean of the first `length` moves.
+    avg_gain = _rma(gains, length)
+    avg_loss = _rma(losses, length)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = 100 - (100 / (1 + avg_gain / avg_loss))
+    value = np.where(avg_loss == 0, 100.0, value)
+    value = np.where((avg_gain == 0) & (avg_loss == 0), 50.0, value)
+    result[..., length:] = value[..., length - 1:]
+    return result
+
+
+def _rma(moves: np.ndarray, length: int) -> np.ndarray:
+    result = np.full(moves.shape, np.nan)
+    current = _seed(moves, length)
+    result[..., length - 1] = current
+    if moves.ndim == 1:
+        for index, move in enumerate(moves[length:].tolist(), length):
+            current = (current * (length - 1) + move) / length
+            result[index] = current
+        return result
+    for index in range(length, moves.shape[-1]):
+        current = (current * (length - 1) + moves[:, index]) / length
+        result[:, index] = current
+    return result
+
+
+def macd_series(values: object, fast: int = 12, slow: int = 26, signal: int = 9) -> dict[str, np.ndarray]:
+    data = as_array(values)
+    line = ema_series(data, fast) - ema_series(data, slow)
+    signal_line = np.full(data.shape, np.nan)
+    valid = np.flatnonzero(~np.isnan(line.reshape(-1, data.shape[-1])[0])) if data.size else np.array([], dtype=int)
+    if valid.size >= signal:
+        signal_line[..., valid[0]:] = ema_series(line[..., valid[0]:], signal)
+    return {'macd': line, 'signal': signal_line, 'hist': line - signal_line}
+
+
+def last(series: np.ndarray) -> float | None:
+    if series.size == 0:
+        return None
+    value = float(series[-1])
+    return None if np.isnan(value) else value
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .columnar import CandleArray
+
+# Support/resistance and pivot levels for every candle of a history. Rolling extremes use the
+# van Herk/Gil-Werman scheme: the series is cut into blocks of the window length, and every window
+# is the min/max of one block suffix and the next block's prefix. That is O(n) for any window length
+# with a few whole-array passes (the batch counterpart of `incremental.ExtremesState`'s deques); windows of a few
+# candles (pivot spans) are cheaper as shifted element-wise extremes. Everything is computed once
+# per history; per-candle queries are array lookups.
+
+SHIFT_MAX = 8
+
+
+def _rolling(values: np.ndarray, length: int, op: np.ufunc, fill: float) -> np.ndarray:
+    """op over the last `length` values including the current one; shorter windows at the start."""
+    values = np.asarray(values, dtype=np.float64)
+    result = op.accumulate(values)
+    count = values.size
+    if length <= 1 or count < length:
+        return values.copy() if length <= 1 else result
+    if length <= SHIFT_MAX:
+        window = values[length - 1:].copy()
+        for shift in range(1, length):
+            op(window, values[length - 1 - shift:count - shift], out=window)
+        result[length - 1:] = window
+        return result
+    blocks = -(-count // length)
+    padded = np.full(blocks * length, fill)
+    padded[:count] = values
+    grid = padded.reshape(blocks, length)
+    prefix = op.accumulate(grid, axis=1).reshape(-1)
+    suffix = op.accumulate(grid[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+    op(suffix[:count - length + 1], prefix[length - 1:count], out=result[length - 1:])
+    return result
+
+
+def rolling_min(values: np.ndarray, length: int) -> np.ndarray:
+    return _rolling(values, length, np.minimum, np.inf)
+
+
+def rolling_max(values: np.ndarray, length: int) -> np.ndarray:
+    return _rolling(values, length, np.maximum, -np.inf)
+
+
+def rolling_extremes(close: np.ndarray, length: int = 30) -> tuple[np.ndarray, np.ndarray]:
+    """Support/resistance per candle: min/max over the last `length` closes including the current one."""
+    return rolling_min(close, length), rolling_max(close, length)
+
+
+def pivots(high: np.ndarray, low: np.ndarray, span: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """Indices of pivot highs/lows: the strict extreme of the `span` candles on each side.
+
+    A pivot at i is only known once candle i + span has closed; `LevelIndex` applies that delay.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    width = 2 * span + 1
+    if high.size < width:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    # Windows ending at i + span are centred on i; the centre must beat both neighbouring halves.
+    highest, lowest = rolling_max(high, span), rolling_min(low, span)
+    left_high, right_high = highest[span - 1:-span - 1], highest[2 * span:]
+    left_low, right_low = lowest[span - 1:-span - 1], lowest[2 * span:]
+    centre = np.arange(span, high.size - span)
+    is_high = (high[centre] > left_high) & (high[centre] > right_high)
+    is_low = (low[centre] < left_low) & (low[centre] < right_low)
+    return centre[is_high], centre[is_low]
+
+
+def _last_confirmed(indices: np.ndarray, count: int, delay: int) -> np.ndarray:
+    """For every candle the newest pivot index confirmed by then (-1 if none)."""
+    marks = np.full(count, -1, dtype=np.int64)
+    confirmed = indices + delay
+    keep = confirmed < count
+    marks[confirmed[keep]] = indices[keep]
+    return np.maximum.accumulate(marks)
+
+
+class LevelIndex:
+    """Rolling support/resistance plus pivot highs/lows of one history, queryable per candle in O(1).
+
+    `support`/`resistance` are the rolling close extremes the signal model uses. Pivots come from
+    highs/lows and only count from the candle that confirms them (`span` candles later), so
+    backtests and pattern scans never see a pivot before it exists.
+    """
+
+    def __init__(self, candles: CandleArray, length: int = 30, span: int = 3):
+        self.length = length
+        self.span = span
+        self.count = len(candles)
+        self.support, self.resistance = rolling_extremes(candles.close, length)
+        self.pivot_highs, self.pivot_lows = pivots(candles.high, candles.low, span)
+        self.high_values = candles.high[self.pivot_highs]
+        self.low_values = candles.low[self.pivot_lows]
+        # Newest confirmed pivot high/low index for every candle (-1 before the first one).
+        self.last_high = _last_confirmed(self.pivot_highs, self.count, span)
+        self.last_low = _last_confirmed(self.pivot_lows, self.count, span)
+
+    def levels(self, index: int) -> tuple[float, float]:
+        return float(self.support[index]), float(self.resistance[index])
+
+    def last_pivot_high(self, index: int) -> int | None:
+        value = int(self.last_high[index])
+        return None if value < 0 else value
+
+    def last_pivot_low(self, index: int) -> int | None:
+        value = int(self.last_low[index])
+        return None if value < 0 else value
+
+    def confirmed_pivots(self, index: int, kind: str = 'low') -> np.ndarray:
+        """Pivot indices of `kind` ('high' | 'low') confirmed at candle `index`, oldest first (a view)."""
+        pivots_ = self.pivot_highs if kind == 'high' else self.pivot_lows
+        return pivots_[:int(np.searchsorted(pivots_, index - self.span, side='right'))]
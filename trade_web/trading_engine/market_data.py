@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+
+
+class BinanceKlines:
+    """Spot klines loader in the `CandleStore.fetch` loader shape; times are open times in seconds.
+
+    `requests` (and its urllib3/ssl stack) is imported with the first session, not at app start.
+    """
+
+    url = 'https://api.binance.com/api/v3/klines'
+    limit = 1000
+
+    def __init__(self, session: requests.Session | None = None, timeout: float = 5.0):
+        self._session = session
+        self.timeout = timeout
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
+    def fetch(self, symbol: str, timeframe: str, start: int, end: int) -> list[dict[str, Any]]:
+        candles: list[dict[str, Any]] = []
+        cursor = start * 1000
+        while cursor <= end * 1000:
+            response = self.session.get(
+                self.url,
+                params={'symbol': symbol, 'interval': timeframe, 'startTime': cursor, 'endTime': end * 1000, 'limit': self.limit},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            rows = response.json()
+            candles.extend(
+                {'time': row[0] // 1000, 'open': float(row[1]), 'high': float(row[2]), 'low': float(row[3]), 'close': float(row[4]), 'volume': float(row[5])}
+                for row in rows
+            )
+            if len(rows) < self.limit:
+                break
+            cursor = rows[-1][6] + 1
+        return candles
+
+    __call__ = fetch
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import multiprocessing
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable
+
+import numpy as np
+
+from .backtest import WARMUP, indicator_arrays, round_trip_cost, signal_series, strength_series
+from .columnar import FIELDS, CandleArray
+from .scoring import status_arrays
+from .validation import CrossValidator
+
+PARAM_SPACE: dict[str, list[Any]] = {
+    'weak_buy': [2, 3, 4],
+    'buy': [3, 4, 5, 6],
+    'strong_buy': [5, 6, 7],
+    'rr_good': [1.0, 1.2, 1.4, 1.6, 1.8],
+    'rr_excellent': [1.8, 2.0, 2.5, 3.0],
+    'rsi_oversold': [25, 30, 35],
+    'rsi_bullish': [45, 50, 55],
+    'rsi_overbought': [65, 70, 75],
+}
+# Partial evaluations (successive halving) never run on fewer candles than this.
+MIN_PARTIAL_CANDLES = 4 * WARMUP
+
+
+class SharedCandles:
+    """Candle arrays of several symbols published once in a single shared-memory block.
+
+    Workers attach by name and build zero-copy `CandleArray` views, so only the layout is pickled.
+    """
+
+    def __init__(self, data: dict[str, CandleArray]):
+        size = sum(len(candles) * 8 * (1 + len(FIELDS)) for candles in data.values())
+        self.memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.layout: list[tuple[str, int, int]] = []
+        offset = 0
+        for symbol, candles in data.items():
+            count = len(candles)
+            np.ndarray(count, dtype=np.int64, buffer=self.memory.buf, offset=offset)[:] = candles.time
+            np.ndarray((len(FIELDS), count), dtype=np.float64, buffer=self.memory.buf, offset=offset + count * 8)[:] = candles.values
+            self.layout.append((symbol, offset, count))
+            offset += count * 8 * (1 + len(FIELDS))
+
+    @property
+    def spec(self) -> tuple[str, list[tuple[str, int, int]]]:
+        return self.memory.name, self.layout
+
+    def close(self) -> None:
+        self.memory.close()
+        self.memory.unlink()
+
+
+def attach(spec: tuple[str, list[tuple[str, int, int]]]) -> tuple[shared_memory.SharedMemory, dict[str, CandleArray]]:
+    name, layout = spec
+    memory = shared_memory.SharedMemory(name=name)
+    data = {}
+    for symbol, offset, count in layout:
+        time_ = np.ndarray(count, dtype=np.int64, buffer=memory.buf, offset=offset)
+        values = np.ndarray((len(FIELDS), count), dtype=np.float64, buffer=memory.buf, offset=offset + count * 8)
+        data[symbol] = CandleArray(time_, values)
+    return memory, data
+
+
+class Evaluator:
+    """Scores parameter sets on prepared symbols; indicators and statuses are computed once per symbol."""
+
+    def __init__(self, data: dict[str, CandleArray], settings: dict[str, Any]):
+        self.settings = settings
+        self.cost = round_trip_cost(settings.get('risk_management', {}))
+        self.validator = CrossValidator(settings.get('validation', {}), settings['horizon'])
+        self.prepared = {}
+        for symbol, candles in data.items():
+            indicators = indicator_arrays(candles)
+            statuses = status_arrays(**indicators)
+            self.prepared[symbol] = (candles, indicators, statuses, strength_series(statuses, settings['timeframes']))
+
+    def signals(self, params: dict[str, Any], symbol: str) -> dict[str, np.ndarray]:
+        _, indicators, statuses, strength = self.prepared[symbol]
+        weights = params.get('indicator_weights') or {}
+        if any(value != 1 for value in weights.values()):
+            strength = strength_series(statuses, self.settings['timeframes'], weights)
+        return signal_series(indicators, statuses, strength, params, self.settings['mode'])
+
+    def evaluate(self, params: dict[str, Any], budget: float = 1.0) -> dict[str, Any]:
+        """Score `params`; a `budget` below 1 uses only that leading share of every symbol's candles."""
+        per_symbol = []
+        used = []
+        for symbol, (candles, _, _, _) in self.prepared.items():
+            count = len(candles) if budget >= 1 else min(len(candles), max(MIN_PARTIAL_CANDLES, int(len(candles) * budget)))
+            per_symbol.append(self.validator.run(candles, self.signals(params, symbol), self.cost, count, score))
+            used.append(count / max(len(candles), 1))
+        candidate = summarize_candidate(params, per_symbol)
+        candidate['budget'] = round(float(np.mean(used)), 4)
+        return candidate
+
+
+def score(result: dict[str, Any]) -> float:
+    """0..100 blend of profit factor, win rate, return and drawdown; 50 is roughly break-even."""
+    if not result['trades']:
+        return 0.0
+    profit_factor = min(result['profit_factor'], 3.0)
+    value = 50 + (profit_factor - 1) * 25 + (result['win_rate'] - 50) * 0.4 + result['total_return_pct'] * 0.8 + result['max_drawdown_pct'] * 0.8
+    return round(max(0.0, min(100.0, value)), 2)
+
+
+def summarize_candidate(params: dict[str, Any], per_symbol: list[dict[str, Any]]) -> dict[str, Any]:
+    """Average `CrossValidator.run` results over symbols into one ranked candidate."""
+    fulls = [item['full'] for item in per_symbol]
+    train = round(float(np.mean([item['train'] for item in per_symbol])), 2)
+    oos = round(float(np.mean([item['out_of_sample'] for item in per_symbol])), 2)
+    walk_forward = round(float(np.mean([item['walk_forward'] for item in per_symbol])), 2)
+    folds = [
+        dict(fold, train_score=round(float(np.mean([item['folds'][index]['train_score'] for item in per_symbol])), 2),
+             test_score=round(float(np.mean([item['folds'][index]['test_score'] for item in per_symbol])), 2))
+        for index, fold in enumerate(per_symbol[0]['folds'])
+    ]
+    candidate = {
+        'score': round(0.4 * train + 0.35 * oos + 0.25 * walk_forward, 2),
+        'train_score': train, 'out_of_sample_score': oos, 'walk_forward_score': walk_forward,
+        'trades': sum(item['trades'] for item in fulls),
+        'avg_profit_factor': round(float(np.mean([item['profit_factor'] for item in fulls])), 2),
+        'avg_win_rate': round(float(np.mean([item['win_rate'] for item in fulls])), 2),
+        'total_return_pct': round(sum(item['total_return_pct'] for item in fulls), 2),
+        'max_drawdown_pct': round(min(item['max_drawdown_pct'] for item in fulls), 2),
+        'params': params,
+        'folds': folds,
+    }
+    candidate['quality'] = quality_gate(candidate)
+    return candidate
+
+
+def quality_gate(candidate: dict[str, Any]) -> dict[str, Any]:
+    flags = []
+    if candidate['trades'] < 10:
+        flags.append('zu wenige Trades')
+    if candidate['avg_profit_factor'] < 1.1:
+        flags.append('Profit-Factor < 1.1')
+    if candidate['avg_win_rate'] < 40:
+        flags.append('Winrate < 40%')
+    if candidate['max_drawdown_pct'] < -15:
+        flags.append('Drawdown > 15%')
+    if candidate['out_of_sample_score'] < 45:
+        flags.append('Out-of-sample schwach')
+    if candidate['walk_forward_score'] < 45:
+        flags.append('Walk-forward schwach')
+    if candidate['train_score'] - min(candidate['out_of_sample_score'], candidate['walk_forward_score']) > 20:
+        flags.append('Stabilitaetsluecke Train/OOS/WF')
+    return {'passed': not flags, 'flags': flags}
+
+
+def sample_params(base: dict[str, Any], rng: random.Random) -> dict[str, Any]:
+    params = dict(base)
+    for key, values in PARAM_SPACE.items():
+        params[key] = rng.choice(values)
+    return normalize_params(params)
+
+
+def normalize_params(params: dict[str, Any]) -> dict[str, Any]:
+    params['buy'] = max(params['buy'], params['weak_buy'])
+    params['strong_buy'] = max(params['strong_buy'], params['buy'])
+    params['rr_excellent'] = max(params['rr_excellent'], params['rr_good'])
+    return params
+
+
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(spec: tuple[str, list[tuple[str, int, int]]], settings: dict[str, Any]) -> None:
+    memory, data = attach(spec)
+    _worker['memory'] = memory
+    _worker['evaluator'] = Evaluator(data, settings)
+
+
+def _evaluate(params: dict[str, Any], budget: float) -> dict[str, Any]:
+    return _worker['evaluator'].evaluate(params, budget)
+
+
+class _InProcess:
+    def __init__(self, data: dict[str, CandleArray], settings: dict[str, Any]):
+        self.evaluator = Evaluator(data, settings)
+
+    def map(self, trials: list[dict[str, Any]], record: Callable[[dict[str, Any], dict[str, Any]], bool]) -> bool:
+        for trial in trials:
+            if record(trial, self.evaluator.evaluate(trial['params'], trial['budget'])):
+                return True
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+class _Pool:
+    """Spawned worker processes attached to one shared candle block; lives for the whole search."""
+
+    def __init__(self, data: dict[str, CandleArray], settings: dict[str, Any], workers: int):
+        self.workers = workers
+        self.shared = SharedCandles(data)
+        context = multiprocessing.get_context('spawn')
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(self.shared.spec, settings))
+
+    def map(self, trials: list[dict[str, Any]], record: Callable[[dict[str, Any], dict[str, Any]], bool]) -> bool:
+        pending: dict[Future, dict[str, Any]] = {}
+        queue = iter(trials)
+
+        def fill() -> None:
+            # Keep roughly two tasks per worker in flight so cancellation reacts quickly.
+            for trial in queue:
+                pending[self.pool.submit(_evaluate, trial['params'], trial['budget'])] = trial
+                if len(pending) >= self.workers * 2:
+                    break
+
+        fill()
+        cancelled = False
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                cancelled = record(pending.pop(future), future.result()) or cancelled
+            if cancelled:
+                for future in pending:
+                    future.cancel()
+                return True
+            fill()
+        return False
+
+    def close(self) -> None:
+        try:
+            self.pool.shutdown(cancel_futures=True)
+        finally:
+            self.shared.close()
+
+
+def run(
+    data: dict[str, CandleArray],
+    settings: dict[str, Any],
+    strategy: Any,
+    workers: int = 1,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+    resume: dict[int, dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Drive a search strategy (see `search.py`) in-process or on a process pool.
+
+    Returns (full evaluations, convergence); partial evaluations only feed the strategy. Every
+    progress update carries the evaluated `trial` and its `evaluation`, which is what a checkpoint
+    stores. `resume` maps trial ids to such checkpoints ({'params', 'budget', 'candidate'}): a seeded
+    strategy asks the same trials again, and those are told from the checkpoint instead of evaluated.
+    """
+    results: list[dict[str, Any]] = []
+    convergence: list[dict[str, Any]] = []
+    done = 0
+    resume = resume or {}
+
+    def record(trial: dict[str, Any], candidate: dict[str, Any], resumed: bool = False) -> bool:
+        nonlocal done
+        done += 1
+        strategy.tell(trial, candidate)
+        update: dict[str, Any] = {'done': done, 'total': strategy.planned, 'search': strategy.report(), 'trial': trial, 'evaluation': candidate, 'resumed': resumed}
+        if trial['budget'] >= 1:
+            results.append(candidate)
+            best = max(results, key=lambda item: item['score'])
+            point = {'step': len(results), 'best_score': best['score'], 'score': candidate['score'], 'cost': round(strategy.cost, 2)}
+            convergence.append(point)
+            update.update(best=best, candidate=candidate, convergence=point)
+        if progress:
+            progress(update)
+        return bool(should_cancel and should_cancel())
+
+    def replay(trial: dict[str, Any]) -> dict[str, Any] | None:
+        stored = resume.get(trial['id'])
+        if stored and stored['params'] == trial['params'] and stored['budget'] == trial['budget']:
+            return stored['candidate']
+        return None
+
+    # The pool is only started once a trial actually needs evaluating.
+    backend: _InProcess | _Pool | None = None
+    try:
+        while True:
+            trials = strategy.ask()
+            if not trials:
+                break
+            fresh, cancelled = [], False
+            for trial in trials:
+                candidate = replay(trial)
+                if candidate is None:
+                    fresh.append(trial)
+                elif record(trial, candidate, resumed=True):
+                    cancelled = True
+                    break
+            if cancelled:
+                break
+            if fresh:
+                backend = backend or (_InProcess(data, settings) if workers <= 1 else _Pool(data, settings, workers))
+                if backend.map(fresh, record):
+                    break
+    finally:
+        if backend is not None:
+            backend.close()
+    return results, convergence
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .columnar import CandleArray
+from .levels import LevelIndex
+
+# Chart patterns over a whole history from the pivot index of `levels.py`:
+#   W / double bottom: two consecutive pivot lows at about the same price with a neckline (the
+#     highest high between them) clearly above. Entry at the close while price is still under the
+#     neckline, on the neckline (retest) after the breakout; stop under the lower low, target the
+#     neckline plus the pattern height (measured move).
+#   Fibonacci: retracement of the last confirmed swing; a pullback into the 0.5-0.618 zone is a
+#     setup in swing direction with the stop beyond the 0.786 level and the swing extreme as target.
+# Every pattern only exists from the candle that confirms its last pivot, so per-candle arrays can be
+# used by backtests without lookahead.
+
+FIB_RATIOS = (0.236, 0.382, 0.5, 0.618, 0.786)
+FIB_ZONE = (0.5, 0.618)
+PATTERN_SETTINGS = {
+    'span': 3,              # pivot = strict extreme of `span` candles on each side
+    'tolerance': 0.01,      # max relative gap between the two W lows
+    'min_depth': 0.03,      # neckline at least this far above the lower low
+    'max_width': 80,        # max candles between the two lows
+    'expiry': 20,           # candles a confirmed W stays actionable
+    'stop_buffer': 0.003,   # stop distance beyond the pattern low / 0.786 level
+    'min_swing': 0.02,      # minimum swing size for Fibonacci setups
+}
+
+
+def w_patterns(candles: CandleArray, index: LevelIndex, settings: dict[str, Any]) -> dict[str, np.ndarray]:
+    """All W/double-bottom patterns of the history, one entry per qualifying pair of consecutive pivot lows."""
+    lows = index.pivot_lows
+    if lows.size < 2:
+        empty = np.array([], dtype=np.float64)
+        return {key: empty for key in ('first', 'second', 'confirmed', 'neckline', 'bottom', 'stop', 'target', 'quality')}
+    first, second = lows[:-1], lows[1:]
+    # Highest high in [first, second): reduceat over the interleaved bounds, every second value.
+    neckline = np.maximum.reduceat(candles.high, np.stack((first, second), axis=1).reshape(-1))[::2]
+    low_first, low_second = candles.low[first], candles.low[second]
+    bottom = np.minimum(low_first, low_second)
+    gap = np.abs(low_second - low_first) / bottom
+    depth = (neckline - bottom) / bottom
+    valid = (gap <= settings['tolerance']) & (depth >= settings['min_depth']) & (second - first <= settings['max_width'])
+    # 60..90 from the symmetry of the lows and the depth of the pattern; a breakout adds 10 per candle.
+    quality = 60 + 15 * (1 - gap / settings['tolerance']) + 15 * np.minimum(depth / (3 * settings['min_depth']), 1.0)
+    return {
+        'first': first[valid], 'second': second[valid], 'confirmed': second[valid] + index.span,
+        'neckline': neckline[valid], 'bottom': bottom[valid],
+        'stop': bottom[valid] * (1 - settings['stop_buffer']), 'target': 2 * neckline[valid] - bottom[valid],
+        'quality': quality[valid],
+    }
+
+
+def scan(candles: CandleArray, settings: dict[str, Any] | None = None, index: LevelIndex | None = None) -> dict[str, Any]:
+    """W and Fibonacci setups for every candle of `candles` as (candles,) arrays.
+
+    w_*: the newest confirmed W that is still actionable (within `expiry`, close between stop and
+    target); w_breakout marks closes above its neckline. fib_*: +1/-1 when the close sits in the
+    0.5-0.618 retracement of the last up/down swing, with `fib_levels` (ratios x candles).
+    """
+    settings = dict(PATTERN_SETTINGS, **(settings or {}))
+    index = index or LevelIndex(candles, span=settings['span'])
+    close, count = candles.close, len(candles)
+    candle = np.arange(count)
+    result: dict[str, Any] = {'index': index}
+
+    found = w_patterns(candles, index, settings)
+    result['w_patterns'] = found
+    latest = np.full(count, -1, dtype=np.int64)
+    confirmed = found['confirmed'].astype(np.int64)
+    keep = confirmed < count
+    latest[confirmed[keep]] = np.flatnonzero(keep)
+    latest = np.maximum.accumulate(latest)
+    has = latest >= 0
+    pick = np.where(has, latest, 0)
+    take = (lambda key: np.where(has, found[key][pick], np.nan)) if found['first'].size else (lambda key: np.full(count, np.nan))
+    stop, target, neckline = take('stop'), take('target'), take('neckline')
+    with np.errstate(invalid='ignore'):
+        active = has & (candle - np.where(has, confirmed[pick] if confirmed.size else 0, 0) <= settings['expiry']) & (close > stop) & (close < target)
+        breakout = active & (close > neckline)
+    result.update({
+        'w_active': active, 'w_breakout': breakout, 'w_neckline': neckline, 'w_entry': np.where(breakout, neckline, close),
+        'w_stop': stop, 'w_target': target,
+        'w_confidence': np.where(active, take('quality') + 10 * breakout, 0.0),
+    })
+
+    high_at, low_at = index.last_high, index.last_low
+    swing = (high_at >= 0) & (low_at >= 0)
+    swing_high = np.where(swing, candles.high[np.maximum(high_at, 0)], np.nan)
+    swing_low = np.where(swing, candles.low[np.maximum(low_at, 0)], np.nan)
+    size = swing_high - swing_low
+    up = high_at > low_at
+    with np.errstate(invalid='ignore', divide='ignore'):
+        retracement = np.where(up, swing_high - close, close - swing_low) / size
+        setup = swing & (size / swing_low >= settings['min_swing']) & (retracement >= FIB_ZONE[0]) & (retracement <= FIB_ZONE[1])
+    ratios = np.array(FIB_RATIOS)[:, None]
+    levels = np.where(up, swing_high - ratios * size, swing_low + ratios * size)
+    deep = levels[FIB_RATIOS.index(0.786)]
+    side = np.where(setup, np.where(up, 1, -1), 0).astype(np.int8)
+    result.update({
+        'fib_side': side, 'fib_levels': levels, 'fib_entry': np.where(setup, close, np.nan),
+        'fib_stop': np.where(setup, np.where(up, deep * (1 - settings['stop_buffer']), deep * (1 + settings['stop_buffer'])), np.nan),
+        'fib_target': np.where(setup, np.where(up, swing_high, swing_low), np.nan),
+        # closer to the 0.618 level and larger swings score higher (50..80)
+        'fib_confidence': np.where(setup, 50 + 20 * (1 - np.abs(retracement - 0.618) / 0.118).clip(0, 1) + 10 * np.minimum(size / swing_low / (5 * settings['min_swing']), 1.0), 0.0),
+    })
+    return result
+
+
+def pattern_at(result: dict[str, Any], position: int = -1) -> dict[str, Any]:
+    """The `analyze` pattern block for one candle: the stronger of an active W and a Fibonacci setup."""
+    candidates = []
+    if result['w_active'][position]:
+        entry, stop, target = (float(result[key][position]) for key in ('w_entry', 'w_stop', 'w_target'))
+        kind = 'W-Pattern Ausbruch' if result['w_breakout'][position] else 'W-Pattern'
+        candidates.append((float(result['w_confidence'][position]), kind, 'BUY', entry, stop, target))
+    if result['fib_side'][position]:
+        side = 'BUY' if result['fib_side'][position] > 0 else 'SELL'
+        entry, stop, target = (float(result[key][position]) for key in ('fib_entry', 'fib_stop', 'fib_target'))
+        candidates.append((float(result['fib_confidence'][position]), f'Fibonacci 0.5-0.618 {"Long" if side == "BUY" else "Short"}', side, entry, stop, target))
+    levels = result['fib_levels'][:, position]
+    fibonacci = {str(ratio): round(float(value), 6) for ratio, value in zip(FIB_RATIOS, levels) if np.isfinite(value)}
+    if not candidates:
+        return {'pattern_detected': False, 'pattern_type': None, 'confidence': 0, 'fibonacci': fibonacci}
+    confidence, kind, side, entry, stop, target = max(candidates, key=lambda item: item[0])
+    risk = abs(entry - stop)
+    return {
+        'pattern_detected': True, 'pattern_type': kind, 'side': side, 'confidence': round(confidence),
+        'optimal_entry': entry, 'stop_loss': stop, 'target_price': target,
+        'risk_reward': round(abs(target - entry) / risk, 4) if risk else 0.0, 'fibonacci': fibonacci,
+    }
+
+
+def trade_alignment(result: dict[str, Any], trades: dict[str, np.ndarray]) -> dict[str, Any]:
+    """Pattern counts of a scanned history and how the backtest trades entered with a setup in their direction fared."""
+    entries = trades['entry_index'].astype(np.int64)
+    side = trades['side']
+    aligned = (result['w_active'][entries] & (side > 0)) | (result['fib_side'][entries] == side)
+    returns = trades['return'][aligned]
+    return {
+        'w_patterns': int(result['w_patterns']['first'].size), 'w_candles': int(result['w_active'].sum()),
+        'fib_candles': int(np.count_nonzero(result['fib_side'])), 'aligned_trades': int(aligned.sum()),
+        'aligned_win_rate': round(float((returns > 0).mean()) * 100, 2) if returns.size else None,
+        'aligned_avg_trade_pct': round(float(returns.mean()) * 100, 4) if returns.size else None,
+    }
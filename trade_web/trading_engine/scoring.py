@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+# Array versions of `TradingAnalyzer._frame` statuses, `_timeframe_score` and `_signal`.
+# Inputs may have any shape (one entry per symbol, per candle, ...); outputs keep that shape.
+# Statuses are encoded as +1 green, 0 orange/grey, -1 red.
+
+SIGNAL_TIERS = {3: 'STRONG', 2: '', 1: 'WEAK'}
+STATUS_NAMES = ('RSI', 'MACD', 'MA_Setup', 'Volumen', 'Trend', 'Support/Resist')
+# Scalar `signal_params` a parameter grid carries as columns; `indicator_weights` becomes a (sets x STATUS_NAMES) matrix.
+GRID_PARAMS = ('weak_buy', 'buy', 'strong_buy', 'rr_good', 'rr_excellent', 'rsi_oversold', 'rsi_overbought')
+
+
+def _fill(values: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(values), fallback, values)
+
+
+def _status(green: np.ndarray, red: np.ndarray) -> np.ndarray:
+    return np.where(green, 1, np.where(red, -1, 0)).astype(np.int8)
+
+
+def status_arrays(
+    price: np.ndarray,
+    rsi: np.ndarray,
+    hist: np.ndarray,
+    ema20: np.ndarray,
+    ema50: np.ndarray,
+    sma200: np.ndarray,
+    support: np.ndarray,
+    resistance: np.ndarray,
+) -> dict[str, np.ndarray]:
+    r = _fill(rsi, np.full_like(price, 50.0))
+    h = np.nan_to_num(hist, nan=0.0)
+    e20, e50, s200 = _fill(ema20, price), _fill(ema50, price), _fill(sma200, price)
+    return {
+        'RSI': _status(r > 55, r < 45),
+        'MACD': _status(h > 0, h < 0),
+        'MA_Setup': _status((price > e20) & (e20 > e50), (price < e20) & (e20 < e50)),
+        'Volumen': np.zeros(price.shape, dtype=np.int8),
+        'Trend': _status(price > s200, price < s200),
+        'Support/Resist': _status((resistance - price) > (price - support), (price - support) > (resistance - price)),
+    }
+
+
+def timeframe_points(statuses: dict[str, np.ndarray], weight: int, weights: dict[str, float] | None = None) -> np.ndarray:
+    """Points of one timeframe from the sum of its statuses, each scaled by its `indicator_weights` entry."""
+    raw = sum(status.astype(np.int64) if weights is None else status * weights.get(name, 1) for name, status in statuses.items())
+    return _points(raw, weight)
+
+
+def _points(raw: np.ndarray, weight: int) -> np.ndarray:
+    return np.select(
+        [raw >= 3, raw >= 1, raw <= -3, raw <= -1],
+        [weight, max(1, weight - 1), -weight, -1],
+        default=0,
+    )
+
+
+def signal_arrays(strength: np.ndarray, entry: np.ndarray, support: np.ndarray, resistance: np.ndarray, params: dict[str, Any]) -> dict[str, np.ndarray]:
+    buy = strength >= 0
+    stop = np.where(buy, support, resistance)
+    target = np.where(buy, resistance, support)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rr_buy = np.where((target > entry) & (entry > stop), (target - entry) / (entry - stop), 0.0)
+        rr_sell = np.where((stop > entry) & (entry > target), (entry - target) / (stop - entry), 0.0)
+    rr = np.where(buy, rr_buy, rr_sell)
+    score = np.abs(strength)
+    rr_ok = rr >= params['rr_good']
+    tier = np.select(
+        [(score >= params['strong_buy']) & rr_ok, (score >= params['buy']) & rr_ok, score >= params['weak_buy']],
+        [3, 2, 1],
+        default=0,
+    )
+    return {'side': np.where(buy, 1, -1), 'tier': tier, 'score': score, 'stop': stop, 'target': target, 'risk_reward': rr, 'active': (tier > 0) & rr_ok}
+
+
+def param_grid(param_sets: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    """Stack parameter sets into one column per `GRID_PARAMS` key plus a (sets x STATUS_NAMES) weight matrix."""
+    grid = {key: np.array([float(params[key]) for params in param_sets]) for key in GRID_PARAMS}
+    grid['weights'] = np.array([[float(params.get('indicator_weights', {}).get(name, 1)) for name in STATUS_NAMES] for params in param_sets]).reshape(len(param_sets), len(STATUS_NAMES))
+    return grid
+
+
+def grid_signal_arrays(
+    statuses: dict[str, np.ndarray],
+    timeframe_weights: list[int],
+    entry: np.ndarray,
+    support: np.ndarray,
+    resistance: np.ndarray,
+    rsi: np.ndarray,
+    grid: dict[str, np.ndarray],
+    mode: str = 'balanced',
+    warmup: int = 0,
+) -> dict[str, np.ndarray]:
+    """`signal_arrays` plus the signal-mode entry filter for every parameter set at once.
+
+    Statuses, prices and RSI are 1-D over candles; outputs have shape (sets x candles). The weighted
+    status sums are one (weight rows x statuses) @ (statuses x candles) product over the distinct
+    `indicator_weights` rows only. |strength| is a small integer, so the tier of every set is a lookup
+    in a (sets x score x rr_ok) table instead of threshold comparisons on full matrices.
+    `timeframe_weights` are the usual 1/2 weights of the timeframes scored from these statuses.
+    """
+    sets = grid['weights'].shape[0]
+    rows, inverse = np.unique(grid['weights'], axis=0, return_inverse=True)
+    raw = rows @ np.stack([statuses[name] for name in STATUS_NAMES]).astype(np.float64)
+    weights, repeats = np.unique(timeframe_weights, return_counts=True)
+    strength = sum(int(count) * _points(raw, int(weight)) for weight, count in zip(weights, repeats)).astype(np.int8)
+    strength = strength[inverse.reshape(-1)]
+    buy = strength >= 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valid = (resistance > entry) & (entry > support)
+        rr_buy = np.where(valid, (resistance - entry) / (entry - support), 0.0)
+        rr_sell = np.where(valid, (entry - support) / (resistance - entry), 0.0)
+    rr = np.where(buy, rr_buy, rr_sell)
+    column = {key: grid[key][:, None] for key in GRID_PARAMS}
+    rr_ok = rr >= column['rr_good']
+
+    # tier[set, score, rr_ok] with the same precedence as `signal_arrays`.
+    scores = np.arange(int(sum(timeframe_weights)) + 1)[None, :, None]
+    ok = np.array([False, True])[None, None, :]
+    table = np.where(
+        (scores >= column['strong_buy'][:, :, None]) & ok, 3,
+        np.where((scores >= column['buy'][:, :, None]) & ok, 2, np.where(scores >= column['weak_buy'][:, :, None], 1, 0)),
+    ).astype(np.int8)
+    score = np.abs(strength)
+    tier = table.reshape(-1)[(np.arange(sets)[:, None] * table.shape[1] + score) * 2 + rr_ok]
+    side = np.where(buy, np.int8(1), np.int8(-1))
+    active = (tier > 0) & rr_ok
+    if mode == 'high_precision':
+        rsi = np.nan_to_num(rsi, nan=50.0)
+        stretched = np.where(buy, rsi > column['rsi_overbought'], rsi < column['rsi_oversold'])
+        active &= (tier >= 2) & (rr >= column['rr_excellent']) & ~stretched
+    elif mode == 'lux_style':
+        for name in ('MACD', 'Trend', 'MA_Setup'):
+            active &= statuses[name] == side
+    active[:, :warmup] = False
+    return {'code': side * tier, 'side': side, 'tier': tier, 'score': score, 'risk_reward': rr, 'active': active}
+
+
+def signal_type(tier: int, side: int) -> str:
+    if tier == 0:
+        return 'NONE'
+    name = 'BUY' if side > 0 else 'SELL'
+    prefix = SIGNAL_TIERS[tier]
+    return f'{prefix}_{name}' if prefix else name
+
+
+def signal_type_names(code: np.ndarray) -> np.ndarray:
+    """Signal type strings for `grid_signal_arrays` codes (side * tier, -3..3)."""
+    names = np.array([signal_type(abs(value), value) for value in range(-3, 4)])
+    return names[np.asarray(code, dtype=np.int64) + 3]
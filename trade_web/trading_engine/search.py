@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Any
+
+from .optimizer import PARAM_SPACE, normalize_params, sample_params
+
+# Search strategies for `optimizer.run`, driven by ask/tell:
+#   ask()  -> next batch of trials ({'id', 'params', 'budget'}), [] when finished
+#   tell(trial, candidate) for every evaluated trial
+# `budget` is the share of candles a trial is backtested on (1.0 = full evaluation).
+# `cost` adds up the budgets actually used, so it is measured in full evaluations and
+# `saved_full_evaluations` compares it with plain random search over `count` candidates.
+# `best_partial` is the best candidate on the largest budget below 1.0 seen so far; it stands in
+# for the result when a search is cancelled before any full evaluation finished.
+
+
+class RandomSearch:
+    name = 'random'
+
+    def __init__(self, base: dict[str, Any], count: int, rng: random.Random, batch_size: int = 1):
+        self.base = base
+        self.count = count
+        self.rng = rng
+        self.batch_size = max(1, batch_size)
+        self.evaluations = 0
+        self.full_evaluations = 0
+        self.cost = 0.0
+        self.best_partial: dict[str, Any] | None = None
+        self._partial_rank = (0.0, -math.inf)
+        self._next_id = 0
+        self._asked = False
+
+    @property
+    def planned(self) -> int:
+        return self.count
+
+    def trial(self, params: dict[str, Any], budget: float = 1.0) -> dict[str, Any]:
+        self._next_id += 1
+        return {'id': self._next_id, 'params': params, 'budget': budget}
+
+    def sample(self, first: bool = False) -> dict[str, Any]:
+        # The first trial of every search is the current configuration.
+        return normalize_params(dict(self.base)) if first else sample_params(self.base, self.rng)
+
+    def ask(self) -> list[dict[str, Any]]:
+        if self._asked:
+            return []
+        self._asked = True
+        return [self.trial(self.sample(index == 0)) for index in range(self.count)]
+
+    def tell(self, trial: dict[str, Any], candidate: dict[str, Any]) -> None:
+        self.evaluations += 1
+        self.full_evaluations += int(trial['budget'] >= 1)
+        self.cost += candidate.get('budget', trial['budget'])
+        if trial['budget'] < 1 and (trial['budget'], candidate['score']) > self._partial_rank:
+            self.best_partial, self._partial_rank = candidate, (trial['budget'], candidate['score'])
+
+    def report(self) -> dict[str, Any]:
+        return {
+            'strategy': self.name,
+            'evaluations': self.evaluations,
+            'full_evaluations': self.full_evaluations,
+            'cost': round(self.cost, 2),
+            'saved_full_evaluations': round(max(0.0, self.count - self.cost), 2),
+        }
+
+
+class SuccessiveHalving(RandomSearch):
+    """Start `count` candidates on a small candle budget, keep the best 1/eta per rung, finish on full data."""
+
+    name = 'halving'
+
+    def __init__(self, base: dict[str, Any], count: int, rng: random.Random, batch_size: int = 1, eta: int = 3, min_budget: float = 1 / 9):
+        super().__init__(base, count, rng, batch_size)
+        self.eta = eta
+        # Rung budgets are eta ** -level; level 0 is the full evaluation.
+        self.levels = max(0, round(math.log(1 / min_budget, eta)))
+        self._brackets = [(count, self.levels)]
+        self._plan = list(self._brackets)
+        self._rung: list[dict[str, Any]] = []
+        self._level = 0
+        self._scores: dict[int, float] = {}
+
+    @property
+    def planned(self) -> int:
+        total = 0
+        for size, level in self._plan:
+            total += size
+            for _ in range(level):
+                size = max(1, math.ceil(size / self.eta))
+                total += size
+        return total
+
+    def ask(self) -> list[dict[str, Any]]:
+        if self._rung and self._level > 0:
+            keep = max(1, math.ceil(len(self._rung) / self.eta))
+            survivors = sorted(self._rung, key=lambda trial: self._scores.get(trial['id'], 0.0), reverse=True)[:keep]
+            self._level -= 1
+            self._rung = [self.trial(trial['params'], float(self.eta) ** -self._level) for trial in survivors]
+            return list(self._rung)
+        if not self._brackets:
+            return []
+        size, self._level = self._brackets.pop(0)
+        first = self._next_id == 0
+        self._rung = [self.trial(self.sample(first and index == 0), float(self.eta) ** -self._level) for index in range(size)]
+        return list(self._rung)
+
+    def tell(self, trial: dict[str, Any], candidate: dict[str, Any]) -> None:
+        super().tell(trial, candidate)
+        self._scores[trial['id']] = candidate['score']
+
+
+class Hyperband(SuccessiveHalving):
+    """Several successive-halving brackets from aggressive (small start budget) to plain full evaluation."""
+
+    name = 'hyperband'
+
+    def __init__(self, base: dict[str, Any], count: int, rng: random.Random, batch_size: int = 1, eta: int = 3, min_budget: float = 1 / 9):
+        super().__init__(base, count, rng, batch_size, eta, min_budget)
+        # Standard Hyperband bracket sizes, scaled so all brackets together start `count` candidates.
+        weights = [math.ceil((self.levels + 1) / (level + 1) * eta ** level) for level in range(self.levels, -1, -1)]
+        sizes = [max(1, round(count * weight / sum(weights))) for weight in weights]
+        self._brackets = list(zip(sizes, range(self.levels, -1, -1)))
+        self._plan = list(self._brackets)
+
+
+class TreeParzen(RandomSearch):
+    """TPE-style sampler over the categorical `PARAM_SPACE`.
+
+    After `startup` random trials every parameter value is weighted by how often it occurs in the best
+    `gamma` share versus the rest; new trials maximise that ratio. The search stops early once
+    `patience` full evaluations in a row did not improve the best score.
+    """
+
+    name = 'tpe'
+
+    def __init__(self, base: dict[str, Any], count: int, rng: random.Random, batch_size: int = 1, gamma: float = 0.25, draws: int = 24):
+        super().__init__(base, count, rng, batch_size)
+        self.gamma = gamma
+        self.draws = draws
+        self.startup = min(count, max(8, count // 4))
+        self.patience = max(10, count // 4)
+        self._history: list[tuple[dict[str, Any], float]] = []
+        self._seen: set[tuple[Any, ...]] = set()
+        self._asked_count = 0
+        self._best = -math.inf
+        self._stale = 0
+
+    def _key(self, params: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(params[name] for name in PARAM_SPACE)
+
+    def _suggest(self) -> dict[str, Any]:
+        ranked = sorted(self._history, key=lambda item: item[1], reverse=True)
+        cut = max(1, math.ceil(len(ranked) * self.gamma))
+        good, bad = [params for params, _ in ranked[:cut]], [params for params, _ in ranked[cut:]]
+        densities = {}
+        for name, values in PARAM_SPACE.items():
+            # Laplace smoothing keeps every value reachable.
+            good_counts = [1 + sum(params[name] == value for params in good) for value in values]
+            bad_counts = [1 + sum(params[name] == value for params in bad) for value in values]
+            densities[name] = (good_counts, [g / sum(good_counts) / (b / sum(bad_counts)) for g, b in zip(good_counts, bad_counts)])
+        best, best_ratio = None, -math.inf
+        for _ in range(self.draws):
+            params = dict(self.base)
+            ratio = 1.0
+            for name, values in PARAM_SPACE.items():
+                good_counts, ratios = densities[name]
+                index = self.rng.choices(range(len(values)), weights=good_counts)[0]
+                params[name] = values[index]
+                ratio *= ratios[index]
+            params = normalize_params(params)
+            if self._key(params) not in self._seen and ratio > best_ratio:
+                best, best_ratio = params, ratio
+        return best if best is not None else self.sample()
+
+    def ask(self) -> list[dict[str, Any]]:
+        if self._asked_count >= self.count or self._stale >= self.patience:
+            return []
+        if self._asked_count < self.startup:
+            size = self.startup - self._asked_count
+            params = [self.sample(self._asked_count == 0 and index == 0) for index in range(size)]
+        else:
+            size = min(self.batch_size, self.count - self._asked_count)
+            params = []
+            for _ in range(size):
+                suggestion = self._suggest()
+                self._seen.add(self._key(suggestion))
+                params.append(suggestion)
+        self._asked_count += size
+        for item in params:
+            self._seen.add(self._key(item))
+        return [self.trial(item) for item in params]
+
+    def tell(self, trial: dict[str, Any], candidate: dict[str, Any]) -> None:
+        super().tell(trial, candidate)
+        self._history.append((trial['params'], candidate['score']))
+        if candidate['score'] > self._best:
+            self._best, self._stale = candidate['score'], 0
+        else:
+            self._stale += 1
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (RandomSearch, SuccessiveHalving, Hyperband, TreeParzen)}
+
+
+def make_strategy(name: str, base: dict[str, Any], count: int, seed: int, batch_size: int = 1) -> RandomSearch:
+    if name not in STRATEGIES:
+        raise ValueError(f'unknown search strategy {name!r}, expected one of {sorted(STRATEGIES)}')
+    return STRATEGIES[name](base, count, random.Random(seed), batch_size)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from .columnar import CandleArray
+from .timeframes import TIMEFRAME_SECONDS
+
+# Synthetic OHLCV for demo mode, benchmarks and optimizer stress tests: a regime-switching GBM.
+# Every candle draws its log return from the drift/volatility of the current regime; regimes last an
+# exponentially distributed number of days, so 15m and 1d series of the same seed behave alike in
+# wall-clock time. All draws are whole-array NumPy calls, no per-candle Python.
+
+BASE_STEP = TIMEFRAME_SECONDS['4h']
+# Length of the one demo series per symbol/timeframe; every demo request slices its tail.
+DEMO_CANDLES = 8192
+# (name, drift, volatility) of the 4h log return; other timeframes scale drift by time, volatility by sqrt(time).
+REGIMES = (
+    ('bull', 0.0012, 0.008),
+    ('bear', -0.0012, 0.011),
+    ('range', 0.0, 0.005),
+    ('volatile', 0.0, 0.02),
+)
+
+
+def demo_seed(symbol: str, timeframe: str) -> int:
+    """Stable seed per symbol/timeframe (crc32, unlike `hash` not salted per process)."""
+    return zlib.crc32(f'{symbol}:{timeframe}'.encode())
+
+
+def regime_path(count: int, step: int, rng: np.random.Generator, regime_days: float = 20.0, regimes: tuple = REGIMES) -> np.ndarray:
+    """Regime index per candle; a regime switches with probability step / (regime_days in seconds) per candle."""
+    switches = rng.random(count) < min(1.0, step / (regime_days * 86400))
+    segments = np.cumsum(switches)
+    return rng.integers(0, len(regimes), size=int(segments[-1]) + 1)[segments]
+
+
+def generate_candles(
+    count: int,
+    timeframe: str = '4h',
+    seed: int | None = None,
+    price: float = 100.0,
+    end_time: int | None = None,
+    regime_days: float = 20.0,
+    regimes: tuple = REGIMES,
+) -> CandleArray:
+    """`count` OHLCV candles ending at open time `end_time` (default: `count - 1` steps after 0), starting at `price`.
+
+    Opens are the previous close, wicks grow with the regime volatility, and volume is lognormal
+    noise scaled up on large moves; the same arguments always give the same series.
+    """
+    if count < 1:
+        raise ValueError(f'count must be positive, got {count}')
+    step = TIMEFRAME_SECONDS[timeframe]
+    rng = np.random.default_rng(seed)
+    table = np.array([item[1:] for item in regimes], dtype=np.float64)
+    regime = regime_path(count, step, rng, regime_days, regimes)
+    drift = table[regime, 0] * (step / BASE_STEP)
+    volatility = table[regime, 1] * np.sqrt(step / BASE_STEP)
+
+    moves = rng.standard_normal(count)
+    moves *= volatility
+    moves += drift
+    values = np.empty((5, count), dtype=np.float64)
+    close = values[3]
+    np.cumsum(moves, out=close)
+    np.exp(close, out=close)
+    close *= price
+    open_ = values[0]
+    open_[0] = price
+    open_[1:] = close[:-1]
+    wicks = np.abs(rng.standard_normal((2, count)))
+    wicks *= 0.6 * volatility
+    np.exp(wicks, out=wicks)
+    np.multiply(np.maximum(open_, close), wicks[0], out=values[1])
+    np.divide(np.minimum(open_, close), wicks[1], out=values[2])
+    # Volume in base units for a turnover around 5e7 per 4h candle, higher on large moves.
+    volume = values[4]
+    volume[:] = rng.standard_normal(count)
+    volume *= 0.35
+    np.exp(volume, out=volume)
+    volume *= 1 + np.abs(moves - drift) / volatility
+    volume *= 5e7 / price * (step / BASE_STEP)
+
+    end = (count - 1) * step if end_time is None else end_time
+    time = np.arange(end - (count - 1) * step, end + 1, step, dtype=np.int64)
+    return CandleArray(time, values)
+
+
+def demo_candles(symbol: str, timeframe: str, count: int, end_time: int, price: float) -> CandleArray:
+    """The last `count` candles of the demo series of `symbol`/`timeframe` ending at open time `end_time`.
+
+    Analyze, backtest, optimizer and forecast ask for different lengths; slicing one `DEMO_CANDLES`
+    series means they all see the same price for the same candle. The series ends at `price`; longer
+    requests get their own series.
+    """
+    return _demo_series(symbol, timeframe, end_time, price, max(DEMO_CANDLES, count))[-count:]
+
+
+@lru_cache(maxsize=32)
+def _demo_series(symbol: str, timeframe: str, end_time: int, price: float, count: int) -> CandleArray:
+    series = generate_candles(count, timeframe, demo_seed(symbol, timeframe), price, end_time)
+    # Scaled to close at `price`: thousands of 1d candles would otherwise drift far from any real level.
+    factor = price / series.close[-1]
+    series.values[:4] *= factor
+    series.values[4] /= factor
+    # Shared by every caller until the next candle closes.
+    series.time.flags.writeable = False
+    series.values.flags.writeable = False
+    return series
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import time
+
+TIMEFRAME_SECONDS = {'1m': 60, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600, '4h': 14400, '1d': 86400}
+
+
+def last_closed_open_time(timeframe: str, now: float | None = None) -> int:
+    step = TIMEFRAME_SECONDS[timeframe]
+    current = int(time.time() if now is None else now)
+    return current - current % step - step
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .backtest import metrics, simulate
+from .columnar import CandleArray
+
+# Cross-validation folds as index ranges over one candle/signal series. Indicators and signals are
+# computed once for the whole series; a fold only re-runs `simulate` on its ranges. `simulate`
+# never lets a trade exit past the end of its range, so a range is a self-contained sample.
+
+METHODS = ('holdout', 'purged_kfold')
+
+
+@dataclass(frozen=True)
+class Fold:
+    kind: str
+    train: tuple[tuple[int, int], ...]
+    test: tuple[int, int]
+
+
+def _ranges(*pairs: tuple[int, int]) -> tuple[tuple[int, int], ...]:
+    return tuple((start, stop) for start, stop in pairs if stop - start > 1)
+
+
+def holdout(count: int, train_share: float, purge: int, start: int = 0) -> Fold:
+    """Train on the first `train_share` of the candles, test on the rest; the last `purge` train candles are dropped."""
+    split = start + int((count - start) * train_share)
+    return Fold('holdout', _ranges((start, split - purge)), (split, count))
+
+
+def walk_forward(count: int, folds: int, purge: int, start: int = 0) -> list[Fold]:
+    """Anchored walk-forward: the second half is split into `folds` test segments, each trained on everything before it."""
+    edges = np.linspace(start + (count - start) // 2, count, folds + 1).astype(int)
+    return [Fold('walk_forward', _ranges((start, int(a) - purge)), (int(a), int(b))) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def purged_kfold(count: int, folds: int, purge: int, embargo: int, start: int = 0) -> list[Fold]:
+    """K contiguous test blocks; training uses all other candles except a purge before and an embargo after each block.
+
+    The purge drops training entries whose trades could still be open when the test block starts, the
+    embargo drops candles right after the block whose features overlap its trades.
+    """
+    edges = np.linspace(start, count, folds + 1).astype(int)
+    result = []
+    for a, b in zip(edges[:-1], edges[1:]):
+        result.append(Fold('purged_kfold', _ranges((start, int(a) - purge), (int(b) + embargo, count)), (int(a), int(b))))
+    return result
+
+
+def _merge(trades: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    return {key: np.concatenate([item[key] for item in trades]) for key in trades[0]}
+
+
+class CrossValidator:
+    """Scores one signal series on the configured folds.
+
+    settings (optimizer `validation`): method ('holdout' | 'purged_kfold'), folds, walk_forward_folds,
+    train_share, embargo_pct. The purge equals the trade horizon.
+    """
+
+    def __init__(self, settings: dict[str, Any], horizon: int):
+        self.method = settings.get('method', 'holdout')
+        if self.method not in METHODS:
+            raise ValueError(f'unknown validation method {self.method!r}, expected one of {METHODS}')
+        self.folds = int(settings.get('folds', 5))
+        self.walk_forward_folds = int(settings.get('walk_forward_folds', 3))
+        self.train_share = float(settings.get('train_share', 0.7))
+        self.embargo_pct = float(settings.get('embargo_pct', 1.0))
+        self.horizon = horizon
+
+    def plan(self, count: int) -> list[Fold]:
+        embargo = max(self.horizon, int(count * self.embargo_pct / 100))
+        if self.method == 'purged_kfold':
+            folds = purged_kfold(count, self.folds, self.horizon, embargo)
+        else:
+            folds = [holdout(count, self.train_share, self.horizon)]
+        return folds + walk_forward(count, self.walk_forward_folds, self.horizon)
+
+    def run(self, candles: CandleArray, signals: dict[str, np.ndarray], cost: float, count: int, score: Any) -> dict[str, Any]:
+        """Full-range metrics plus train/OOS/walk-forward scores; `score` maps metrics to 0..100."""
+
+        def evaluate(ranges: tuple[tuple[int, int], ...]) -> dict[str, Any]:
+            if not ranges:
+                return metrics({'return': np.array([], dtype=np.float64)})
+            return metrics(_merge([simulate(candles, signals, [self.horizon], cost, a, b)[self.horizon] for a, b in ranges]))
+
+        folds = []
+        for fold in self.plan(count):
+            folds.append({
+                'kind': fold.kind, 'train': [list(item) for item in fold.train], 'test': list(fold.test),
+                'train_score': score(evaluate(fold.train)), 'test_score': score(evaluate((fold.test,))),
+            })
+        cv = [fold for fold in folds if fold['kind'] != 'walk_forward']
+        walk = [fold for fold in folds if fold['kind'] == 'walk_forward']
+        return {
+            'full': evaluate(((0, count),)),
+            'train': float(np.mean([fold['train_score'] for fold in cv])),
+            'out_of_sample': float(np.mean([fold['test_score'] for fold in cv])),
+            'walk_forward': float(np.mean([fold['test_score'] for fold in walk])),
+            'folds': folds,
+        }